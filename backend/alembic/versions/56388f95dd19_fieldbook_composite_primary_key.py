@@ -0,0 +1,51 @@
+"""fieldbook_composite_primary_key
+
+Revision ID: 56388f95dd19
+Revises: a9b3c5e8d2f1
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '56388f95dd19'
+down_revision = 'a9b3c5e8d2f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Promote (calculation_id, point_number) to the fieldbook primary key.
+    The surrogate UUID id and the separate unique constraint each kept their
+    own btree; the composite PK covers both, as well as the two secondary
+    indexes that were prefixes of it.
+    """
+    op.drop_index('idx_fieldbook_point_number', table_name='fieldbook', schema='public')
+    op.drop_index('idx_fieldbook_calculation', table_name='fieldbook', schema='public')
+    op.drop_constraint('uq_fieldbook_calc_point', 'fieldbook', schema='public', type_='unique')
+    op.drop_constraint('fieldbook_pkey', 'fieldbook', schema='public', type_='primary')
+    op.drop_column('fieldbook', 'id', schema='public')
+    op.create_primary_key('fieldbook_pkey', 'fieldbook', ['calculation_id', 'point_number'], schema='public')
+    print("Fieldbook primary key is now (calculation_id, point_number)")
+
+
+def downgrade() -> None:
+    """Restore the surrogate UUID primary key"""
+    op.drop_constraint('fieldbook_pkey', 'fieldbook', schema='public', type_='primary')
+    op.add_column(
+        'fieldbook',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False,
+                  server_default=sa.text('gen_random_uuid()')),
+        schema='public'
+    )
+    op.create_primary_key('fieldbook_pkey', 'fieldbook', ['id'], schema='public')
+    op.create_unique_constraint('uq_fieldbook_calc_point', 'fieldbook',
+                                ['calculation_id', 'point_number'], schema='public')
+    op.create_index('idx_fieldbook_calculation', 'fieldbook',
+                    ['calculation_id'], unique=False, schema='public')
+    op.create_index('idx_fieldbook_point_number', 'fieldbook',
+                    ['calculation_id', 'point_number'], unique=False, schema='public')
@@ -0,0 +1,53 @@
+"""add_boundary_derived_columns
+
+Revision ID: a3c9e1f7b250
+Revises: f8a1c3d5e7b9
+Create Date: 2026-10-17 17:31:40.268159
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9e1f7b250'
+down_revision = 'f8a1c3d5e7b9'
+branch_labels = None
+depends_on = None
+
+
+UTM_SRID_EXPR = (
+    "CASE WHEN ST_Y(ST_Centroid(boundary_geom)) >= 0 THEN 32600 ELSE 32700 END"
+    " + floor((ST_X(ST_Centroid(boundary_geom)) + 180) / 6)::int + 1"
+)
+
+DERIVED_COLUMNS = [
+    ('boundary_digest', sa.LargeBinary(), "sha256(ST_AsEWKB(ST_Normalize(boundary_geom)))"),
+    ('bbox_n', sa.Float(), "ST_YMax(boundary_geom)"),
+    ('bbox_s', sa.Float(), "ST_YMin(boundary_geom)"),
+    ('bbox_e', sa.Float(), "ST_XMax(boundary_geom)"),
+    ('bbox_w', sa.Float(), "ST_XMin(boundary_geom)"),
+    ('utm_srid', sa.Integer(), UTM_SRID_EXPR),
+    ('area_sqm', sa.Float(), f"ST_Area(ST_Transform(boundary_geom, {UTM_SRID_EXPR}))"),
+]
+
+
+def upgrade() -> None:
+    """
+    Add generated columns derived from boundary_geom to calculations:
+    normalized geometry digest, bounding box, UTM SRID and UTM area
+    """
+    for name, type_, expression in DERIVED_COLUMNS:
+        op.add_column(
+            'calculations',
+            sa.Column(name, type_, sa.Computed(expression, persisted=True), nullable=True),
+            schema='public'
+        )
+
+
+def downgrade() -> None:
+    """
+    Remove the boundary-derived columns from calculations
+    """
+    for name, _, _ in reversed(DERIVED_COLUMNS):
+        op.drop_column('calculations', name, schema='public')
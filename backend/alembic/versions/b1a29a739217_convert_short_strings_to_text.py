@@ -0,0 +1,68 @@
+"""convert_short_strings_to_text
+
+Revision ID: b1a29a739217
+Revises: 56388f95dd19
+Create Date: 2026-10-17 09:40:02.551873
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1a29a739217'
+down_revision = '56388f95dd19'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, previous VARCHAR length, check constraint name)
+TEXT_COLUMNS = [
+    ('inventory_trees', 'species', 255, 'tree_species_len'),
+    ('inventory_trees', 'remark', 50, 'tree_remark_len'),
+    ('tree_correction_logs', 'species', 255, 'tree_correction_species_len'),
+    ('tree_correction_logs', 'correction_reason', 100, 'tree_correction_reason_len'),
+    ('tree_species_coefficients', 'scientific_name', 255, 'tree_coeff_scientific_name_len'),
+    ('biodiversity_species', 'scientific_name', 255, 'biodiversity_scientific_name_len'),
+]
+
+
+def upgrade() -> None:
+    """
+    Convert VARCHAR(n) name/remark columns to TEXT with a CHECK on length.
+    In Postgres varchar(n) has no storage advantage over text; the CHECK keeps
+    the same bound while the planner works from real avg_width statistics.
+    """
+    for table, column, length, constraint in TEXT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            existing_type=sa.String(length),
+            schema='public'
+        )
+        op.create_check_constraint(
+            constraint,
+            table,
+            f"length({column}) <= {length}",
+            schema='public'
+        )
+
+    # Refresh avg_width statistics for the converted tables
+    for table in sorted({table for table, _, _, _ in TEXT_COLUMNS}):
+        op.execute(f"ANALYZE public.{table}")
+
+    print("Converted short string columns to TEXT with length checks")
+
+
+def downgrade() -> None:
+    """Revert to VARCHAR(n)"""
+    for table, column, length, constraint in TEXT_COLUMNS:
+        op.drop_constraint(constraint, table, schema='public', type_='check')
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length),
+            existing_type=sa.Text(),
+            schema='public'
+        )
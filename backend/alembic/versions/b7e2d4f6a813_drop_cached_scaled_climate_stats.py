@@ -0,0 +1,31 @@
+"""drop_cached_scaled_climate_stats
+
+Revision ID: b7e2d4f6a813
+Revises: a3c9e1f7b250
+Create Date: 2026-10-17 18:05:12.730461
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d4f6a813'
+down_revision = 'a3c9e1f7b250'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Drop cached whole-boundary climate statistics computed with the old
+    0.1 scale; they are recomputed (range-filtered, unscaled) on next use
+    """
+    op.execute("DELETE FROM public.raster_stats_cache WHERE raster_name = 'climate'")
+
+
+def downgrade() -> None:
+    """
+    Nothing to restore; the rows are recomputed on demand
+    """
+    pass
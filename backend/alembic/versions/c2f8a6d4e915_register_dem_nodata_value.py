@@ -0,0 +1,64 @@
+"""register_dem_nodata_value
+
+Revision ID: c2f8a6d4e915
+Revises: b7e2d4f6a813
+Create Date: 2026-10-17 18:42:57.104382
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2f8a6d4e915'
+down_revision = 'b7e2d4f6a813'
+branch_labels = None
+depends_on = None
+
+
+def _update_dem(update: str) -> None:
+    """
+    Run the UPDATE on rasters.dem if it is loaded. A DEM loaded with
+    raster2pgsql -C carries an enforce_nodata_values_rast CHECK that rejects
+    changing the band NoData value, so the constraint is dropped around the
+    UPDATE and rebuilt from the new value afterwards.
+    """
+    op.execute(f"""
+        DO $$
+        DECLARE
+            has_constraint boolean;
+        BEGIN
+            IF to_regclass('rasters.dem') IS NOT NULL THEN
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_constraint
+                    WHERE conrelid = 'rasters.dem'::regclass
+                    AND conname = 'enforce_nodata_values_rast'
+                ) INTO has_constraint;
+                IF has_constraint THEN
+                    PERFORM DropRasterConstraints('rasters', 'dem', 'rast', 'nodata');
+                END IF;
+                {update};
+                IF has_constraint THEN
+                    PERFORM AddRasterConstraints('rasters', 'dem', 'rast', 'nodata');
+                END IF;
+            END IF;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    """
+    Register -32768 as the NoData value of the DEM band so that zonal
+    statistics skip void pixels without overriding it on every tile read
+    """
+    _update_dem(
+        "UPDATE rasters.dem SET rast = ST_SetBandNoDataValue(rast, 1, -32768) "
+        "WHERE ST_BandNoDataValue(rast, 1) IS DISTINCT FROM -32768"
+    )
+
+
+def downgrade() -> None:
+    """
+    Unregister the DEM NoData value
+    """
+    _update_dem("UPDATE rasters.dem SET rast = ST_SetBandNoDataValue(rast, 1, NULL)")
@@ -0,0 +1,39 @@
+"""add_calculation_cache_table
+
+Revision ID: c7e2f4a91b3d
+Revises: b1a29a739217
+Create Date: 2026-10-17 14:12:45.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2f4a91b3d'
+down_revision = 'b1a29a739217'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add calculation_cache table for whole-boundary analysis results,
+    keyed by SHA-256 of the normalized boundary geometry and analysis options
+    """
+    op.create_table(
+        'calculation_cache',
+        sa.Column('geom_hash', sa.LargeBinary(), nullable=False),
+        sa.Column('results', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('geom_hash'),
+        schema='public'
+    )
+
+
+def downgrade() -> None:
+    """
+    Remove calculation_cache table
+    """
+    op.drop_table('calculation_cache', schema='public')
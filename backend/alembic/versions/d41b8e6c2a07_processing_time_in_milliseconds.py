@@ -0,0 +1,42 @@
+"""processing_time_in_milliseconds
+
+Revision ID: d41b8e6c2a07
+Revises: c7e2f4a91b3d
+Create Date: 2026-10-17 15:03:27.846512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41b8e6c2a07'
+down_revision = 'c7e2f4a91b3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Store calculation processing time in milliseconds instead of whole seconds
+    """
+    op.alter_column(
+        'calculations',
+        'processing_time_seconds',
+        new_column_name='processing_time_ms',
+        schema='public'
+    )
+    op.execute("UPDATE public.calculations SET processing_time_ms = processing_time_ms * 1000")
+
+
+def downgrade() -> None:
+    """
+    Revert processing time to whole seconds
+    """
+    op.execute("UPDATE public.calculations SET processing_time_ms = processing_time_ms / 1000")
+    op.alter_column(
+        'calculations',
+        'processing_time_ms',
+        new_column_name='processing_time_seconds',
+        schema='public'
+    )
@@ -0,0 +1,36 @@
+"""drop_cached_forest_change_counts
+
+Revision ID: d6a4b9e2f371
+Revises: c2f8a6d4e915
+Create Date: 2026-10-17 19:12:40.158203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd6a4b9e2f371'
+down_revision = 'c2f8a6d4e915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Drop cached whole-boundary forest loss / gain / fire statistics stored
+    without per-value pixel areas, and the cached whole-forest results whose
+    hectares were derived from them; both are recomputed on next use
+    """
+    op.execute(
+        "DELETE FROM public.raster_stats_cache "
+        "WHERE raster_name IN ('forest_loss', 'forest_gain', 'fire_loss')"
+    )
+    op.execute("DELETE FROM public.calculation_cache")
+
+
+def downgrade() -> None:
+    """
+    Nothing to restore; the rows are recomputed on demand
+    """
+    pass
@@ -0,0 +1,70 @@
+"""add_raster_tile_spatial_indexes
+
+Revision ID: e5f3a7b19c42
+Revises: d41b8e6c2a07
+Create Date: 2026-10-17 16:20:11.402937
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5f3a7b19c42'
+down_revision = 'd41b8e6c2a07'
+branch_labels = None
+depends_on = None
+
+
+# Raster tables read by the analysis service
+RASTER_TABLES = [
+    'agb_2022_nepal',
+    'annual_mean_temperature',
+    'annual_precipitation',
+    'aspect',
+    'canopy_height',
+    'dem',
+    'esa_world_cover',
+    'forest_loss_fire',
+    'forest_type',
+    'hansen2000_classified',
+    'min_temp_coldest_month',
+    'nasa_forest_2020',
+    'nepal_forest_health',
+    'nepal_gain',
+    'nepal_lossyear',
+    'slope',
+    'soilgrids_isric',
+]
+
+
+def upgrade() -> None:
+    """
+    Add GIST indexes on the tile extents of the analysis rasters so that
+    ST_Intersects(rast, geom) only fetches tiles overlapping the boundary.
+    Tables loaded with raster2pgsql -I already have such an index and are
+    skipped; tables that have not been loaded yet are ignored.
+    """
+    for table in RASTER_TABLES:
+        op.execute(f"""
+            DO $$
+            BEGIN
+                IF to_regclass('rasters.{table}') IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM pg_indexes
+                    WHERE schemaname = 'rasters' AND tablename = '{table}'
+                    AND indexdef ILIKE '%st_convexhull(rast)%'
+                ) THEN
+                    CREATE INDEX {table}_rast_gist
+                        ON rasters.{table} USING gist (ST_ConvexHull(rast));
+                    ANALYZE rasters.{table};
+                END IF;
+            END $$;
+        """)
+
+
+def downgrade() -> None:
+    """
+    Remove the raster tile indexes added by this revision
+    """
+    for table in RASTER_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS rasters.{table}_rast_gist")
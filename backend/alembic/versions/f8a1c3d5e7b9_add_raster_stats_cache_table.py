@@ -0,0 +1,40 @@
+"""add_raster_stats_cache_table
+
+Revision ID: f8a1c3d5e7b9
+Revises: e5f3a7b19c42
+Create Date: 2026-10-17 16:48:02.915374
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8a1c3d5e7b9'
+down_revision = 'e5f3a7b19c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add raster_stats_cache table for per-raster whole-boundary zonal statistics,
+    keyed by SHA-256 of the normalized boundary geometry and the raster layer
+    """
+    op.create_table(
+        'raster_stats_cache',
+        sa.Column('geom_hash', sa.LargeBinary(), nullable=False),
+        sa.Column('raster_name', sa.Text(), nullable=False),
+        sa.Column('stats', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('geom_hash', 'raster_name'),
+        schema='public'
+    )
+
+
+def downgrade() -> None:
+    """
+    Remove raster_stats_cache table
+    """
+    op.drop_table('raster_stats_cache', schema='public')
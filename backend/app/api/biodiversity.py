@@ -2,7 +2,7 @@
 Biodiversity species inventory API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, and_, func
 from typing import List, Optional
 from uuid import UUID
@@ -11,6 +11,7 @@ from ..core.database import get_db
 from ..models import BiodiversitySpecies, CalculationBiodiversity, Calculation, User
 from ..schemas.biodiversity import (
     BiodiversitySpeciesResponse,
+    BiodiversitySpeciesTD,
     BiodiversitySpeciesListResponse,
     CalculationBiodiversityCreate,
     CalculationBiodiversityBulkCreate,
@@ -23,6 +24,22 @@ from ..utils.auth import get_current_user
 router = APIRouter(prefix="/biodiversity", tags=["biodiversity"])
 
 
+def _species_dict(species: BiodiversitySpecies) -> dict:
+    """Flatten a species row into the BiodiversitySpeciesTD shape"""
+    return {key: getattr(species, key) for key in BiodiversitySpeciesTD.__annotations__}
+
+
+def _record_dict(record: CalculationBiodiversity) -> dict:
+    """Flatten a biodiversity record, nesting its species as a plain dict"""
+    data = {
+        key: getattr(record, key)
+        for key in CalculationBiodiversityResponse.model_fields
+        if key != "species"
+    }
+    data["species"] = _species_dict(record.species)
+    return data
+
+
 @router.get("/species", response_model=BiodiversitySpeciesListResponse)
 def get_species_list(
     category: Optional[str] = Query(None, description="Filter by category: vegetation, animal"),
@@ -89,14 +106,14 @@ def get_species_list(
                    .limit(page_size)\
                    .all()
 
-    total_pages = (total + page_size - 1) // page_size
-
     return {
-        "items": species,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages
+        "items": [_species_dict(s) for s in species],
+        "page": {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": offset + len(species) < total
+        }
     }
 
 
@@ -115,11 +132,12 @@ def get_species_detail(
 @router.get("/calculations/{calculation_id}/species", response_model=CalculationBiodiversitySummary)
 def get_calculation_biodiversity(
     calculation_id: UUID,
+    include_species: bool = Query(False, description="Include the selected species records"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Get all biodiversity species selected for a calculation
+    Get biodiversity counts for a calculation, optionally with the selected species
     """
     # Verify calculation exists and user has access
     calculation = db.query(Calculation).filter(Calculation.id == calculation_id).first()
@@ -130,26 +148,38 @@ def get_calculation_biodiversity(
     if calculation.user_id != current_user.id and current_user.role.value not in ['SUPER_ADMIN', 'ORG_ADMIN']:
         raise HTTPException(status_code=403, detail="Not authorized to access this calculation")
 
-    # Get all biodiversity records
-    records = db.query(CalculationBiodiversity)\
-                .filter(CalculationBiodiversity.calculation_id == calculation_id)\
-                .all()
-
-    # Calculate counts
-    total_species = len(records)
-    vegetation_count = sum(1 for r in records if r.species.category == 'vegetation')
-    animal_count = sum(1 for r in records if r.species.category == 'animal')
-    protected_count = sum(1 for r in records if r.species.is_protected or r.species.iucn_status in ['CR', 'EN', 'VU'])
-    invasive_count = sum(1 for r in records if r.species.is_invasive)
+    # Calculate all counts in one aggregate query
+    counts = db.query(
+        func.count(CalculationBiodiversity.id).label('total'),
+        func.count().filter(BiodiversitySpecies.category == 'vegetation').label('vegetation'),
+        func.count().filter(BiodiversitySpecies.category == 'animal').label('animal'),
+        func.count().filter(or_(
+            BiodiversitySpecies.is_protected,
+            BiodiversitySpecies.iucn_status.in_(['CR', 'EN', 'VU'])
+        )).label('protected'),
+        func.count().filter(BiodiversitySpecies.is_invasive).label('invasive')
+    ).join(
+        BiodiversitySpecies, CalculationBiodiversity.species_id == BiodiversitySpecies.id
+    ).filter(
+        CalculationBiodiversity.calculation_id == calculation_id
+    ).one()
+
+    species = None
+    if include_species:
+        records = db.query(CalculationBiodiversity)\
+                    .options(joinedload(CalculationBiodiversity.species))\
+                    .filter(CalculationBiodiversity.calculation_id == calculation_id)\
+                    .all()
+        species = [_record_dict(r) for r in records]
 
     return {
         "calculation_id": calculation_id,
-        "total_species": total_species,
-        "vegetation_count": vegetation_count,
-        "animal_count": animal_count,
-        "protected_species_count": protected_count,
-        "invasive_species_count": invasive_count,
-        "species": records
+        "total_species": counts.total,
+        "vegetation_count": counts.vegetation,
+        "animal_count": counts.animal,
+        "protected_species_count": counts.protected,
+        "invasive_species_count": counts.invasive,
+        "species": species
     }
 
 
@@ -205,7 +235,7 @@ def add_species_to_calculation(
     db.commit()
     db.refresh(new_record)
 
-    return new_record
+    return _record_dict(new_record)
 
 
 @router.post("/calculations/{calculation_id}/species/bulk")
@@ -2,6 +2,7 @@
 Fieldbook API endpoints for boundary vertex extraction and 20m interpolation.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
@@ -30,11 +31,14 @@ from app.services.export import (
     export_fieldbook_gpx,
     export_fieldbook_geojson
 )
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import Response, StreamingResponse, JSONResponse
 import io
 
 router = APIRouter()
 
+# Built once; reused to validate the ORM rows of every list request
+_POINT_LIST_ADAPTER = TypeAdapter(list[FieldbookPoint])
+
 
 @router.post("/{calculation_id}/fieldbook/generate", response_model=FieldbookGenerateResponse)
 async def generate_fieldbook(
@@ -94,7 +98,7 @@ async def generate_fieldbook(
 @router.get("/{calculation_id}/fieldbook")
 async def list_fieldbook_points(
     calculation_id: UUID,
-    format: Optional[str] = Query(None, description="Export format: csv, excel, gpx, geojson"),
+    format: Optional[FieldbookExportFormat] = Query(None, description="Export format: csv, excel, gpx, geojson"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -151,14 +155,14 @@ async def list_fieldbook_points(
         Fieldbook.calculation_id == calculation_id
     ).order_by(Fieldbook.point_number).all()
 
-    if not points:
-        return FieldbookListResponse(points=[], total_count=0)
-
-    return FieldbookListResponse(
-        points=[FieldbookPoint.model_validate(p) for p in points],
+    response = FieldbookListResponse(
+        points=_POINT_LIST_ADAPTER.validate_python(points, from_attributes=True),
         total_count=len(points)
     )
 
+    # Serialize with pydantic-core directly instead of FastAPI's jsonable_encoder pass
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
 
 @router.get("/{calculation_id}/fieldbook/{point_number}", response_model=FieldbookPoint)
 async def get_fieldbook_point(
@@ -27,7 +27,7 @@ async def list_all_fieldbooks(
         Calculation.id.label('calculation_id'),
         Calculation.forest_name,
         Calculation.created_at,
-        func.count(Fieldbook.id).label('total_points'),
+        func.count(Fieldbook.point_number).label('total_points'),
         func.sum(func.cast(Fieldbook.point_type == 'vertex', Integer)).label('original_vertices'),
         func.sum(func.cast(Fieldbook.point_type == 'interpolated', Integer)).label('interpolated_count')
     ).join(
@@ -107,7 +107,7 @@ async def get_community_forest(forest_id: int, db: Session = Depends(get_db)):
         func.ST_AsGeoJSON(CommunityForest.geom).label("geojson")
     ).filter(CommunityForest.id == forest_id).first()
 
-    geometry = json.loads(geojson_query.geojson) if geojson_query else None
+    geometry = geojson_query.geojson if geojson_query else None
 
     return {
         "id": forest.id,
@@ -420,7 +420,7 @@ async def upload_forest_boundary(
             'run_proximity': run_proximity,
         }
 
-        analysis_results, processing_time = await analyze_forest_boundary(calc_id, db, options=analysis_service_options)
+        analysis_results, processing_time_ms = await analyze_forest_boundary(calc_id, db, options=analysis_service_options)
         print(f"Analysis completed with {len(analysis_results)} keys")
 
         # Merge analysis results with existing block data using SQL JSONB operators
@@ -429,18 +429,19 @@ async def upload_forest_boundary(
             UPDATE public.calculations
             SET
                 result_data = result_data || CAST(:analysis_data AS jsonb),
-                processing_time_seconds = :processing_time,
+                processing_time_ms = :processing_time_ms,
                 status = :status,
                 completed_at = NOW()
             WHERE id = :calc_id
         """)
 
-        print(f"Executing UPDATE with {len(json.dumps(analysis_results))} bytes of data")
+        analysis_json = json.dumps(analysis_results)
+        print(f"Executing UPDATE with {len(analysis_json)} bytes of data")
         result = db.execute(update_query, {
-            "analysis_data": json.dumps(analysis_results),
-            "processing_time": processing_time,
+            "analysis_data": analysis_json,
+            "processing_time_ms": processing_time_ms,
             "status": "COMPLETED",
-            "calc_id": str(calc_id)  # Use calc_id instead of calculation.id
+            "calc_id": calc_id  # Use calc_id instead of calculation.id
         })
         print(f"UPDATE affected {result.rowcount} rows")
 
@@ -521,7 +522,7 @@ async def upload_forest_boundary(
         func.ST_AsGeoJSON(Calculation.boundary_geom).label("geojson")
     ).filter(Calculation.id == calc_id).first()
 
-    geometry_json = json.loads(geojson_query.geojson) if geojson_query else None
+    geometry_json = geojson_query.geojson if geojson_query else None
 
     return CalculationResponse(
         id=calculation.id,
@@ -530,7 +531,7 @@ async def upload_forest_boundary(
         forest_name=calculation.forest_name,
         block_name=calculation.block_name,
         status=calculation.status,
-        processing_time_seconds=calculation.processing_time_seconds,
+        processing_time_ms=calculation.processing_time_ms,
         error_message=calculation.error_message,
         created_at=calculation.created_at,
         completed_at=calculation.completed_at,
@@ -627,7 +628,7 @@ async def reanalyze_calculation(
         print(f"Starting re-analysis for calculation {calculation_id}")
         print(f"Analysis options: {analysis_options}")
 
-        analysis_results, processing_time = await analyze_forest_boundary(
+        analysis_results, processing_time_ms = await analyze_forest_boundary(
             calculation_id, db, options=analysis_options
         )
         print(f"Re-analysis completed with {len(analysis_results)} keys")
@@ -651,7 +652,7 @@ async def reanalyze_calculation(
             SET
                 result_data = CAST(:result_data AS jsonb),
                 analysis_options = CAST(:analysis_options AS jsonb),
-                processing_time_seconds = :processing_time,
+                processing_time_ms = :processing_time_ms,
                 status = :status,
                 completed_at = NOW()
             WHERE id = :calc_id
@@ -660,9 +661,9 @@ async def reanalyze_calculation(
         db.execute(update_query, {
             "result_data": json.dumps(updated_result_data),
             "analysis_options": json.dumps(analysis_options),
-            "processing_time": processing_time,
+            "processing_time_ms": processing_time_ms,
             "status": "COMPLETED",
-            "calc_id": str(calculation_id)
+            "calc_id": calculation_id
         })
 
         db.commit()
@@ -694,7 +695,7 @@ async def reanalyze_calculation(
         func.ST_AsGeoJSON(Calculation.boundary_geom).label("geojson")
     ).filter(Calculation.id == calculation_id).first()
 
-    geometry_json = json.loads(geojson_query.geojson) if geojson_query else None
+    geometry_json = geojson_query.geojson if geojson_query else None
 
     return CalculationResponse(
         id=calculation.id,
@@ -703,7 +704,7 @@ async def reanalyze_calculation(
         forest_name=calculation.forest_name,
         block_name=calculation.block_name,
         status=calculation.status,
-        processing_time_seconds=calculation.processing_time_seconds,
+        processing_time_ms=calculation.processing_time_ms,
         error_message=calculation.error_message,
         created_at=calculation.created_at,
         completed_at=calculation.completed_at,
@@ -899,7 +900,7 @@ async def get_calculation(
         func.ST_AsGeoJSON(Calculation.boundary_geom).label("geojson")
     ).filter(Calculation.id == calculation_id).first()
 
-    geometry_json = json.loads(geojson_query.geojson) if geojson_query else None
+    geometry_json = geojson_query.geojson if geojson_query else None
 
     return CalculationResponse(
         id=calculation.id,
@@ -908,7 +909,7 @@ async def get_calculation(
         forest_name=calculation.forest_name,
         block_name=calculation.block_name,
         status=calculation.status,
-        processing_time_seconds=calculation.processing_time_seconds,
+        processing_time_ms=calculation.processing_time_ms,
         error_message=calculation.error_message,
         created_at=calculation.created_at,
         completed_at=calculation.completed_at,
@@ -944,7 +945,7 @@ async def list_calculations(
             forest_name=calc.forest_name,
             block_name=calc.block_name,
             status=calc.status,
-            processing_time_seconds=calc.processing_time_seconds,
+            processing_time_ms=calc.processing_time_ms,
             error_message=calc.error_message,
             created_at=calc.created_at,
             completed_at=calc.completed_at,
@@ -3,7 +3,9 @@ Inventory API endpoints
 Handles tree inventory upload, validation, and processing
 """
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Form
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from geoalchemy2 import Geometry
+from sqlalchemy import cast, func
 from sqlalchemy.orm import Session
 from typing import List, Optional, Any
 from uuid import UUID
@@ -22,9 +24,9 @@ from ..schemas.inventory import (
     TreeSpeciesCoefficientResponse,
     ValidationReportResponse,
     InventoryCalculationResponse,
-    InventoryTreeResponse,
     InventoryTreesListResponse,
     InventorySummaryResponse,
+    InventoryExportFormat,
     MyInventoriesResponse
 )
 from ..utils.auth import get_current_active_user
@@ -896,8 +898,28 @@ async def list_inventory_trees(
     if not inventory:
         raise HTTPException(status_code=404, detail="Inventory not found")
 
-    # Build query
-    query = db.query(InventoryTree).filter(
+    # Select only the response columns, with lon/lat extracted from the
+    # geography in the same statement
+    query = db.query(
+        InventoryTree.id,
+        InventoryTree.species,
+        InventoryTree.local_name,
+        InventoryTree.dia_cm,
+        InventoryTree.height_m,
+        InventoryTree.tree_class,
+        InventoryTree.stem_volume,
+        InventoryTree.branch_volume,
+        InventoryTree.tree_volume,
+        InventoryTree.gross_volume,
+        InventoryTree.net_volume,
+        InventoryTree.net_volume_cft,
+        InventoryTree.firewood_m3,
+        InventoryTree.firewood_chatta,
+        InventoryTree.remark,
+        InventoryTree.grid_cell_id,
+        func.ST_X(cast(InventoryTree.location, Geometry('POINT', srid=4326))).label('longitude'),
+        func.ST_Y(cast(InventoryTree.location, Geometry('POINT', srid=4326))).label('latitude')
+    ).filter(
         InventoryTree.inventory_calculation_id == inventory_id
     )
 
@@ -910,56 +932,31 @@ async def list_inventory_trees(
 
     # Apply pagination
     offset = (page - 1) * page_size
-    trees = query.offset(offset).limit(page_size).all()
-
-    # Convert to response format (with lon/lat)
-    tree_responses = []
-    for tree in trees:
-        # Extract coordinates from geography
-        from sqlalchemy import text
-        result = db.execute(
-            text("SELECT ST_X(location::geometry), ST_Y(location::geometry) FROM public.inventory_trees WHERE id = :id"),
-            {"id": tree.id}
-        ).first()
-
-        lon, lat = result[0], result[1]
-
-        tree_responses.append(InventoryTreeResponse(
-            id=tree.id,
-            species=tree.species,
-            local_name=tree.local_name,
-            dia_cm=tree.dia_cm,
-            height_m=tree.height_m,
-            tree_class=tree.tree_class,
-            stem_volume=tree.stem_volume,
-            branch_volume=tree.branch_volume,
-            tree_volume=tree.tree_volume,
-            gross_volume=tree.gross_volume,
-            net_volume=tree.net_volume,
-            net_volume_cft=tree.net_volume_cft,
-            firewood_m3=tree.firewood_m3,
-            firewood_chatta=tree.firewood_chatta,
-            remark=tree.remark,
-            grid_cell_id=tree.grid_cell_id,
-            longitude=lon,
-            latitude=lat
-        ))
-
-    has_more = (offset + len(trees)) < total_count
-
-    return {
-        'trees': tree_responses,
-        'total_count': total_count,
-        'page': page,
-        'page_size': page_size,
-        'has_more': has_more
-    }
+    rows = query.offset(offset).limit(page_size).all()
+
+    # Rows come straight from typed columns, so they are serialized as-is
+    # without per-row validation; response_model documents the shape
+    trees = []
+    for row in rows:
+        tree = row._asdict()
+        tree['id'] = str(row.id)
+        trees.append(tree)
+
+    return JSONResponse(content={
+        'trees': trees,
+        'page': {
+            'total': total_count,
+            'page': page,
+            'page_size': page_size,
+            'has_more': (offset + len(rows)) < total_count
+        }
+    })
 
 
 @router.get("/{inventory_id}/export")
 async def export_inventory(
     inventory_id: UUID,
-    format: str = Query('csv', regex="^(csv|geojson)$"),
+    format: InventoryExportFormat = Query('csv'),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -1,11 +1,12 @@
 """
 Sampling design API endpoints for forest inventory sampling.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse, JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import List, Optional
+from typing_extensions import Annotated
 from uuid import UUID
 import io
 
@@ -15,7 +16,7 @@ from app.models.user import User
 from app.models.calculation import Calculation
 from app.models.sampling import SamplingDesign
 from app.schemas.sampling import (
-    SamplingDesignCreate,
+    SamplingDesignVariant,
     SamplingDesignUpdate,
     SamplingDesign as SamplingDesignSchema,
     SamplingGenerateResponse,
@@ -37,7 +38,7 @@ router = APIRouter()
 @router.post("/calculations/{calculation_id}/sampling/create", response_model=SamplingGenerateResponse)
 async def create_sampling(
     calculation_id: UUID,
-    request: SamplingDesignCreate,
+    request: Annotated[SamplingDesignVariant, Body(discriminator="sampling_type")],
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -101,13 +102,10 @@ async def create_sampling(
             min_samples_small_blocks=request.min_samples_small_blocks or 2,
             boundary_buffer_meters=request.boundary_buffer_meters or 50.0,
             intensity_per_hectare=request.intensity_per_hectare,  # Deprecated fallback
-            grid_spacing_meters=request.grid_spacing_meters,  # Deprecated
+            grid_spacing_meters=getattr(request, "grid_spacing_meters", None),  # Deprecated
             min_distance_meters=request.min_distance_meters,
-            plot_shape=request.plot_shape or "circular",
-            plot_radius_meters=request.plot_radius_meters,
-            plot_length_meters=request.plot_length_meters,
-            plot_width_meters=request.plot_width_meters,
             notes=request.notes,
+            **request.plot.model_dump(),
             block_overrides=block_overrides_dict
         )
 
@@ -178,7 +176,7 @@ async def get_sampling_design(
 @router.get("/sampling/{design_id}/points")
 async def get_sampling_points(
     design_id: UUID,
-    format: Optional[str] = Query(None, description="Export format: csv, gpx, kml, geojson"),
+    format: Optional[SamplingExportFormat] = Query(None, description="Export format: csv, gpx, kml, geojson"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
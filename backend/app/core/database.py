@@ -1,6 +1,10 @@
 """
 Database connection and session management
 """
+import uuid
+
+from psycopg2.extensions import register_adapter
+from psycopg2.extras import UUID_adapter
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -8,6 +12,11 @@ from sqlalchemy.pool import QueuePool
 from .config import settings
 
 
+# Let raw text() queries bind uuid.UUID values directly (as 'uuid'::uuid).
+# Only the adapter is registered: uuid columns in raw query results stay str
+register_adapter(uuid.UUID, UUID_adapter)
+
+
 # Create database engine with connection pooling
 engine = create_engine(
     settings.DATABASE_URL,
@@ -2,7 +2,7 @@
 from .user import User, UserRole, UserStatus
 from .organization import Organization, SubscriptionType
 from .forest_manager import ForestManager
-from .calculation import Calculation, CalculationStatus
+from .calculation import Calculation, CalculationStatus, CalculationCache, RasterStatsCache
 from .community_forest import CommunityForest
 from .inventory import (
     TreeSpeciesCoefficient,
@@ -24,6 +24,8 @@ __all__ = [
     "ForestManager",
     "Calculation",
     "CalculationStatus",
+    "CalculationCache",
+    "RasterStatsCache",
     "CommunityForest",
     "TreeSpeciesCoefficient",
     "InventoryCalculation",
@@ -1,7 +1,7 @@
 """
 Biodiversity models for species inventory tracking
 """
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Numeric, UUID, func
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Numeric, UUID, CheckConstraint, func
 from sqlalchemy.orm import relationship
 from ..core.database import Base
 
@@ -9,14 +9,17 @@ from ..core.database import Base
 class BiodiversitySpecies(Base):
     """Master species data - pre-populated from CSV"""
     __tablename__ = "biodiversity_species"
-    __table_args__ = {'schema': 'public'}
+    __table_args__ = (
+        CheckConstraint("length(scientific_name) <= 255", name='biodiversity_scientific_name_len'),
+        {'schema': 'public'}
+    )
 
     id = Column(UUID, primary_key=True, server_default=func.gen_random_uuid())
     category = Column(String(50), nullable=False)  # 'vegetation', 'animal'
     sub_category = Column(String(50))  # 'tree', 'mammal', 'bird', etc.
     nepali_name = Column(String(255), nullable=False)
     english_name = Column(String(255), nullable=False)
-    scientific_name = Column(String(255), nullable=False)
+    scientific_name = Column(Text, nullable=False)
     primary_use = Column(String(100))
     secondary_uses = Column(Text)
     iucn_status = Column(String(10))  # 'LC', 'VU', 'EN', 'CR', 'DD', 'NT'
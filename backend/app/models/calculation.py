@@ -2,7 +2,7 @@
 Calculation model - maps to existing calculations table
 Stores uploaded boundaries and analysis results
 """
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Integer, ForeignKey, Text, Index
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Integer, ForeignKey, Text, Index, LargeBinary, Float, Computed
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from geoalchemy2 import Geometry
@@ -13,6 +13,13 @@ import uuid
 from ..core.database import Base
 
 
+# WGS 84 / UTM zone SRID of the boundary centroid (326xx north, 327xx south)
+UTM_SRID_EXPR = (
+    "CASE WHEN ST_Y(ST_Centroid(boundary_geom)) >= 0 THEN 32600 ELSE 32700 END"
+    " + floor((ST_X(ST_Centroid(boundary_geom)) + 180) / 6)::int + 1"
+)
+
+
 class CalculationStatus(str, enum.Enum):
     """Calculation processing status"""
     PROCESSING = "processing"
@@ -39,6 +46,16 @@ class Calculation(Base):
     uploaded_filename = Column(String(255), nullable=False)
     boundary_geom = Column(Geometry(srid=4326), nullable=False)  # Accepts Polygon or MultiPolygon
 
+    # Derived from boundary_geom by PostgreSQL (generated columns), so they
+    # follow boundary corrections without any application code
+    boundary_digest = Column(LargeBinary, Computed("sha256(ST_AsEWKB(ST_Normalize(boundary_geom)))"))
+    bbox_n = Column(Float, Computed("ST_YMax(boundary_geom)"))
+    bbox_s = Column(Float, Computed("ST_YMin(boundary_geom)"))
+    bbox_e = Column(Float, Computed("ST_XMax(boundary_geom)"))
+    bbox_w = Column(Float, Computed("ST_XMin(boundary_geom)"))
+    utm_srid = Column(Integer, Computed(UTM_SRID_EXPR))
+    area_sqm = Column(Float, Computed(f"ST_Area(ST_Transform(boundary_geom, {UTM_SRID_EXPR}))"))
+
     # Forest-specific metadata
     forest_name = Column(String(255), nullable=True)
     block_name = Column(String(255), nullable=True)
@@ -52,7 +69,7 @@ class Calculation(Base):
 
     # Processing metadata
     status = Column(SQLEnum(CalculationStatus), nullable=False, default=CalculationStatus.PROCESSING)
-    processing_time_seconds = Column(Integer, nullable=True)
+    processing_time_ms = Column(Integer, nullable=True)
     error_message = Column(Text, nullable=True)
 
     # Timestamps
@@ -67,3 +84,38 @@ class Calculation(Base):
 
     def __repr__(self):
         return f"<Calculation(id={self.id}, user_id={self.user_id}, status={self.status.value})>"
+
+
+class CalculationCache(Base):
+    """
+    CalculationCache model - maps to public.calculation_cache table
+    Whole-boundary analysis results keyed by a hash of the normalized
+    boundary geometry and the analysis options
+    """
+    __tablename__ = "calculation_cache"
+    __table_args__ = {"schema": "public"}
+
+    geom_hash = Column(LargeBinary, primary_key=True)  # SHA-256 digest
+    results = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CalculationCache(geom_hash={self.geom_hash.hex()})>"
+
+
+class RasterStatsCache(Base):
+    """
+    RasterStatsCache model - maps to public.raster_stats_cache table
+    Raw whole-boundary zonal statistics per raster layer, keyed by a hash of
+    the normalized boundary geometry
+    """
+    __tablename__ = "raster_stats_cache"
+    __table_args__ = {"schema": "public"}
+
+    geom_hash = Column(LargeBinary, primary_key=True)  # SHA-256 digest
+    raster_name = Column(Text, primary_key=True)  # e.g. "dem", "slope", "climate"
+    stats = Column(JSONB, nullable=False)  # {"counts": {...}, "stats": {...}}
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<RasterStatsCache(geom_hash={self.geom_hash.hex()}, raster_name={self.raster_name})>"
@@ -1,12 +1,11 @@
 """
 Fieldbook model for boundary vertices and interpolated points
 """
-from sqlalchemy import Column, String, Integer, Numeric, Boolean, Text, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Numeric, Boolean, Text, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from geoalchemy2 import Geometry
-import uuid
 
 from ..core.database import Base
 
@@ -16,18 +15,17 @@ class Fieldbook(Base):
     Fieldbook entries for boundary verification.
     Stores vertices extracted from polygon boundaries plus interpolated points
     at 20m intervals for field verification.
+
+    Points are keyed by (calculation_id, point_number) - the natural key -
+    so a single btree serves both uniqueness and per-calculation lookups.
     """
     __tablename__ = "fieldbook"
-    __table_args__ = (
-        UniqueConstraint('calculation_id', 'point_number', name='uq_fieldbook_calc_point'),
-        {'schema': 'public'}
-    )
+    __table_args__ = {'schema': 'public'}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    calculation_id = Column(UUID(as_uuid=True), ForeignKey('public.calculations.id', ondelete='CASCADE'), nullable=False)
+    calculation_id = Column(UUID(as_uuid=True), ForeignKey('public.calculations.id', ondelete='CASCADE'), primary_key=True)
 
     # Point identification
-    point_number = Column(Integer, nullable=False)  # Sequential number P1, P2, P3...
+    point_number = Column(Integer, primary_key=True, autoincrement=False)  # Sequential number P1, P2, P3...
     point_type = Column(String(20), nullable=False)  # 'vertex' or 'interpolated'
 
     # Block information (for multi-block forests)
@@ -63,4 +61,4 @@ class Fieldbook(Base):
     calculation = relationship("Calculation", back_populates="fieldbook_points")
 
     def __repr__(self):
-        return f"<Fieldbook(id={self.id}, calc={self.calculation_id}, point={self.point_number}, type={self.point_type})>"
+        return f"<Fieldbook(calc={self.calculation_id}, point={self.point_number}, type={self.point_type})>"
@@ -1,7 +1,7 @@
 """
 Inventory models - maps to inventory tables
 """
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text, Float, Boolean, Index
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text, Float, Boolean, Index, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from geoalchemy2 import Geography
@@ -17,10 +17,13 @@ class TreeSpeciesCoefficient(Base):
     Stores allometric equations for volume calculations
     """
     __tablename__ = "tree_species_coefficients"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        CheckConstraint("length(scientific_name) <= 255", name='tree_coeff_scientific_name_len'),
+        {"schema": "public"}
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    scientific_name = Column(String(255), unique=True, nullable=False)
+    scientific_name = Column(Text, unique=True, nullable=False)
     local_name = Column(String(100), nullable=True)
 
     # Volume equation coefficients
@@ -117,6 +120,8 @@ class InventoryTree(Base):
         Index('idx_inventory_trees_location', 'location', postgresql_using='gist'),
         Index('idx_inventory_trees_remark', 'remark'),
         Index('idx_inventory_trees_species', 'species'),
+        CheckConstraint("length(species) <= 255", name='tree_species_len'),
+        CheckConstraint("length(remark) <= 50", name='tree_remark_len'),
         {"schema": "public"}
     )
 
@@ -124,7 +129,7 @@ class InventoryTree(Base):
     inventory_calculation_id = Column(UUID(as_uuid=True), ForeignKey("public.inventory_calculations.id", ondelete="CASCADE"), nullable=False)
 
     # Original data
-    species = Column(String(255), nullable=False)
+    species = Column(Text, nullable=False)
     dia_cm = Column(Float, nullable=False)
     height_m = Column(Float, nullable=True)
     tree_class = Column(String(10), nullable=True)
@@ -143,7 +148,7 @@ class InventoryTree(Base):
     firewood_chatta = Column(Float, nullable=True)
 
     # Mother tree designation
-    remark = Column(String(50), nullable=True)  # 'Mother Tree' or 'Felling Tree'
+    remark = Column(Text, nullable=True)  # 'Mother Tree' or 'Felling Tree'
     grid_cell_id = Column(Integer, nullable=True)
 
     # Metadata
@@ -261,6 +266,8 @@ class TreeCorrectionLog(Base):
     __tablename__ = "tree_correction_logs"
     __table_args__ = (
         Index('idx_tree_corrections_inventory', 'inventory_calculation_id'),
+        CheckConstraint("length(species) <= 255", name='tree_correction_species_len'),
+        CheckConstraint("length(correction_reason) <= 100", name='tree_correction_reason_len'),
         {"schema": "public"}
     )
 
@@ -269,7 +276,7 @@ class TreeCorrectionLog(Base):
 
     # Tree identification
     tree_row_number = Column(Integer, nullable=False)
-    species = Column(String(255), nullable=True)
+    species = Column(Text, nullable=True)
 
     # Original coordinates (before correction)
     original_x = Column(Float, nullable=False)
@@ -283,7 +290,7 @@ class TreeCorrectionLog(Base):
     distance_moved_meters = Column(Float, nullable=False)
 
     # Why corrected
-    correction_reason = Column(String(100), nullable=False)  # 'out_of_boundary', 'gps_error'
+    correction_reason = Column(Text, nullable=False)  # 'out_of_boundary', 'gps_error'
 
     # When corrected
     corrected_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
@@ -8,6 +8,7 @@ from .auth import (
     PasswordReset,
     PasswordChange,
 )
+from .common import PageInfo
 from .forest import (
     CommunityForestResponse,
     ForestManagerCreate,
@@ -29,7 +30,7 @@ from .inventory import (
     InventoryUpdateTreeRequest,
     InventorySummaryResponse,
     MyInventoriesResponse,
-    ExportFormat,
+    InventoryExportFormat,
 )
 from .fieldbook import (
     FieldbookPointBase,
@@ -44,6 +45,9 @@ from .fieldbook import (
 from .sampling import (
     SamplingDesignBase,
     SamplingDesignCreate,
+    SystematicSamplingDesign,
+    RandomSamplingDesign,
+    StratifiedSamplingDesign,
     SamplingDesignUpdate,
     SamplingDesign,
     SamplingPointGeoJSON,
@@ -60,6 +64,7 @@ __all__ = [
     "UserResponse",
     "PasswordReset",
     "PasswordChange",
+    "PageInfo",
     "CommunityForestResponse",
     "ForestManagerCreate",
     "ForestManagerResponse",
@@ -78,7 +83,7 @@ __all__ = [
     "InventoryUpdateTreeRequest",
     "InventorySummaryResponse",
     "MyInventoriesResponse",
-    "ExportFormat",
+    "InventoryExportFormat",
     "FieldbookPointBase",
     "FieldbookPointCreate",
     "FieldbookPointUpdate",
@@ -89,6 +94,9 @@ __all__ = [
     "FieldbookExportFormat",
     "SamplingDesignBase",
     "SamplingDesignCreate",
+    "SystematicSamplingDesign",
+    "RandomSamplingDesign",
+    "StratifiedSamplingDesign",
     "SamplingDesignUpdate",
     "SamplingDesign",
     "SamplingPointGeoJSON",
@@ -1,7 +1,7 @@
 """
 Authentication schemas for request/response validation
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, validator
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
@@ -62,8 +62,7 @@ class UserResponse(BaseModel):
     created_at: datetime
     last_login: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PasswordReset(BaseModel):
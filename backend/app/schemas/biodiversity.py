@@ -1,25 +1,35 @@
 """
 Pydantic schemas for biodiversity species
 """
-from pydantic import BaseModel, UUID4, Field
+import sys
+from pydantic import BaseModel, ConfigDict, UUID4, Field, field_validator
 from typing import Optional, List
+from typing_extensions import Annotated, TypedDict
 from datetime import datetime
-from decimal import Decimal
+
+from .common import PageInfo
+
+
+# Length-bounded strings shared by the species and record schemas
+Name255 = Annotated[str, Field(max_length=255)]
+Name100 = Annotated[str, Field(max_length=100)]
+Name50 = Annotated[str, Field(max_length=50)]
+Name20 = Annotated[str, Field(max_length=20)]
 
 
 # Base schemas
 class BiodiversitySpeciesBase(BaseModel):
     """Base schema for biodiversity species"""
-    category: str = Field(..., max_length=50, description="Main category: vegetation, animal")
-    sub_category: Optional[str] = Field(None, max_length=50, description="Sub-category: tree, mammal, bird, etc.")
-    nepali_name: str = Field(..., max_length=255)
-    english_name: str = Field(..., max_length=255)
-    scientific_name: str = Field(..., max_length=255)
-    primary_use: Optional[str] = Field(None, max_length=100)
+    category: Name50 = Field(..., description="Main category: vegetation, animal")
+    sub_category: Optional[Name50] = Field(None, description="Sub-category: tree, mammal, bird, etc.")
+    nepali_name: Name255
+    english_name: Name255
+    scientific_name: Name255
+    primary_use: Optional[Name100] = None
     secondary_uses: Optional[str] = None
     iucn_status: Optional[str] = Field(None, max_length=10)
-    cites_appendix: Optional[str] = Field(None, max_length=20)
-    distribution: Optional[str] = Field(None, max_length=255)
+    cites_appendix: Optional[Name20] = None
+    distribution: Optional[Name255] = None
     notes: Optional[str] = None
     is_invasive: bool = False
     is_protected: bool = False
@@ -35,29 +45,56 @@ class BiodiversitySpeciesResponse(BiodiversitySpeciesBase):
     id: UUID4
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BiodiversitySpeciesTD(TypedDict):
+    """
+    Species row nested inside list/summary responses.
+    A TypedDict is validated as a plain dict, so list payloads with hundreds
+    of species skip per-row BaseModel construction.
+    """
+    id: UUID4
+    category: str
+    sub_category: Optional[str]
+    nepali_name: str
+    english_name: str
+    scientific_name: str
+    primary_use: Optional[str]
+    secondary_uses: Optional[str]
+    iucn_status: Optional[str]
+    cites_appendix: Optional[str]
+    distribution: Optional[str]
+    notes: Optional[str]
+    is_invasive: bool
+    is_protected: bool
+    created_at: datetime
 
 
 class BiodiversitySpeciesListResponse(BaseModel):
     """Paginated species list response"""
-    items: List[BiodiversitySpeciesResponse]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
+    items: List[BiodiversitySpeciesTD]
+    page: PageInfo
+
+    model_config = ConfigDict(defer_build=True)
 
 
 # Calculation Biodiversity schemas
 class CalculationBiodiversityBase(BaseModel):
     """Base schema for calculation biodiversity selection"""
     species_id: UUID4
-    presence_status: str = Field("present", max_length=20)
-    abundance: Optional[str] = Field(None, max_length=20)
+    presence_status: Name20 = "present"
+    abundance: Optional[Name20] = None
     notes: Optional[str] = None
     photo_url: Optional[str] = Field(None, max_length=500)
-    latitude: Optional[Decimal] = None
-    longitude: Optional[Decimal] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+    @field_validator('presence_status')
+    @classmethod
+    def intern_presence_status(cls, v: str) -> str:
+        """presence_status takes only a handful of values; keep one copy of each"""
+        return sys.intern(v)
 
 
 class CalculationBiodiversityCreate(CalculationBiodiversityBase):
@@ -68,18 +105,18 @@ class CalculationBiodiversityCreate(CalculationBiodiversityBase):
 class CalculationBiodiversityBulkCreate(BaseModel):
     """Schema for bulk creating biodiversity records"""
     species_ids: List[UUID4] = Field(..., description="List of species IDs to add")
-    presence_status: str = Field("present", max_length=20)
+    presence_status: Name20 = "present"
     notes: Optional[str] = None
 
 
 class CalculationBiodiversityUpdate(BaseModel):
     """Schema for updating biodiversity record"""
-    presence_status: Optional[str] = Field(None, max_length=20)
-    abundance: Optional[str] = Field(None, max_length=20)
+    presence_status: Optional[Name20] = None
+    abundance: Optional[Name20] = None
     notes: Optional[str] = None
     photo_url: Optional[str] = Field(None, max_length=500)
-    latitude: Optional[Decimal] = None
-    longitude: Optional[Decimal] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
 
 class CalculationBiodiversityResponse(CalculationBiodiversityBase):
@@ -88,10 +125,9 @@ class CalculationBiodiversityResponse(CalculationBiodiversityBase):
     calculation_id: UUID4
     recorded_by: Optional[UUID4]
     recorded_at: datetime
-    species: BiodiversitySpeciesResponse
+    species: BiodiversitySpeciesTD
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CalculationBiodiversitySummary(BaseModel):
@@ -102,7 +138,9 @@ class CalculationBiodiversitySummary(BaseModel):
     animal_count: int
     protected_species_count: int
     invasive_species_count: int
-    species: List[CalculationBiodiversityResponse]
+    species: Optional[List[CalculationBiodiversityResponse]] = None
+
+    model_config = ConfigDict(defer_build=True)
 
 
 # Filter schemas
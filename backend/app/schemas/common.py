@@ -0,0 +1,12 @@
+"""
+Schemas shared across API modules
+"""
+from typing_extensions import TypedDict
+
+
+class PageInfo(TypedDict):
+    """Pagination block of a paginated list response"""
+    total: int
+    page: int
+    page_size: int
+    has_more: bool
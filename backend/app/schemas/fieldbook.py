@@ -1,8 +1,9 @@
 """
 Pydantic schemas for Fieldbook API
 """
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Optional, Literal
+import sys
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
@@ -12,19 +13,25 @@ class FieldbookPointBase(BaseModel):
     """Base schema for fieldbook point"""
     point_number: int = Field(..., description="Sequential point number")
     point_type: str = Field(..., description="Type: 'vertex' or 'interpolated'")
-    longitude: Decimal = Field(..., description="WGS84 longitude")
-    latitude: Decimal = Field(..., description="WGS84 latitude")
-    easting_utm: Optional[Decimal] = Field(None, description="UTM Easting")
-    northing_utm: Optional[Decimal] = Field(None, description="UTM Northing")
+    longitude: float = Field(..., description="WGS84 longitude")
+    latitude: float = Field(..., description="WGS84 latitude")
+    easting_utm: Optional[float] = Field(None, description="UTM Easting")
+    northing_utm: Optional[float] = Field(None, description="UTM Northing")
     utm_zone: Optional[int] = Field(None, description="UTM Zone (44 or 45 for Nepal)")
-    azimuth_to_next: Optional[Decimal] = Field(None, description="Bearing to next point (degrees)")
-    distance_to_next: Optional[Decimal] = Field(None, description="Distance to next point (meters)")
-    elevation: Optional[Decimal] = Field(None, description="Elevation from DEM (meters)")
+    azimuth_to_next: Optional[float] = Field(None, description="Bearing to next point (degrees)")
+    distance_to_next: Optional[float] = Field(None, description="Distance to next point (meters)")
+    elevation: Optional[float] = Field(None, description="Elevation from DEM (meters)")
     remarks: Optional[str] = Field(None, description="Field remarks")
     is_verified: bool = Field(False, description="GPS verified in field")
     block_number: Optional[int] = Field(None, description="Block number (for multi-block forests)")
     block_name: Optional[str] = Field(None, description="Block name (e.g., 'Block 1', 'Ward 5')")
 
+    @field_validator('point_type', 'block_name')
+    @classmethod
+    def intern_category(cls, v: Optional[str]) -> Optional[str]:
+        """Share one str object per category across thousands of points"""
+        return sys.intern(v) if v is not None else v
+
 
 class FieldbookPointCreate(FieldbookPointBase):
     """Schema for creating fieldbook point"""
@@ -41,7 +48,6 @@ class FieldbookPointUpdate(BaseModel):
 
 class FieldbookPoint(FieldbookPointBase):
     """Schema for fieldbook point response"""
-    id: UUID
     calculation_id: UUID
     created_at: datetime
     updated_at: datetime
@@ -86,10 +92,8 @@ class FieldbookListResponse(BaseModel):
     points: list[FieldbookPoint]
     total_count: int
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class FieldbookExportFormat(str):
-    """Export format options"""
-    CSV = "csv"
-    EXCEL = "excel"
-    GPX = "gpx"
-    GEOJSON = "geojson"
+# Export format options
+FieldbookExportFormat = Literal["csv", "excel", "gpx", "geojson"]
@@ -1,12 +1,19 @@
 """
 Forest management schemas for request/response validation
 """
-from pydantic import BaseModel, Field
-from typing import Optional, Any, Dict, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, Json
+from typing import Optional, Any, Dict, List, Literal
+from typing_extensions import Annotated, TypedDict
 from datetime import datetime
 from uuid import UUID
 
-from ..models.calculation import CalculationStatus
+
+# Calculation status as its plain string value; ORM rows hand over the
+# CalculationStatus enum member, which is unwrapped before the literal check
+CalculationStatusLiteral = Annotated[
+    Literal["processing", "completed", "failed"],
+    BeforeValidator(lambda v: getattr(v, "value", v))
+]
 
 
 class CommunityForestResponse(BaseModel):
@@ -16,17 +23,16 @@ class CommunityForestResponse(BaseModel):
     code: Optional[str]
     regime: Optional[str]
     area_hectares: float
-    geometry: Optional[Dict[str, Any]]  # GeoJSON
+    geometry: Optional[Json[Dict[str, Any]]]  # Raw ST_AsGeoJSON text, parsed by pydantic-core
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ForestManagerCreate(BaseModel):
     """Schema for creating forest manager assignment"""
     user_id: UUID
     community_forest_id: int
-    role: str = Field(..., pattern="^(manager|chairman|secretary|member)$")
+    role: Literal["manager", "chairman", "secretary", "member"]
 
 
 class ForestManagerResponse(BaseModel):
@@ -38,8 +44,7 @@ class ForestManagerResponse(BaseModel):
     assigned_date: datetime
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CalculationCreate(BaseModel):
@@ -55,80 +60,160 @@ class CalculationResponse(BaseModel):
     uploaded_filename: str
     forest_name: Optional[str]
     block_name: Optional[str]
-    status: CalculationStatus
-    processing_time_seconds: Optional[int]
+    status: CalculationStatusLiteral
+    processing_time_ms: Optional[int]
     error_message: Optional[str]
     created_at: datetime
     completed_at: Optional[datetime]
-    geometry: Optional[Dict[str, Any]]  # GeoJSON
+    geometry: Optional[Json[Dict[str, Any]]]  # Raw ST_AsGeoJSON text, parsed by pydantic-core
     result_data: Optional[Dict[str, Any]]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class AnalysisResultResponse(BaseModel):
-    """Schema for analysis results"""
-    calculation_id: UUID
-    status: CalculationStatus
-    processing_time_seconds: Optional[int]
+class SlopePercentages(TypedDict, total=False):
+    """Share of area per slope class (raster codes 1-4)"""
+    gentle: float
+    moderate: float
+    steep: float
+    very_steep: float
+
+
+class AspectPercentages(TypedDict, total=False):
+    """Share of area per aspect direction (raster codes 1-8)"""
+    N: float
+    NE: float
+    E: float
+    SE: float
+    S: float
+    SW: float
+    W: float
+    NW: float
+
+
+class CanopyPercentages(TypedDict, total=False):
+    """Share of area per canopy height class"""
+    non_forest: float
+    bush_regenerated: float
+    pole_trees: float
+    high_forest: float
+
+
+class ForestHealthPercentages(TypedDict, total=False):
+    """Share of area per NDVI forest health class (raster codes 1-5)"""
+    stressed: float
+    poor: float
+    moderate: float
+    healthy: float
+    excellent: float
+    unknown: float
+
+
+class NearestFeature(TypedDict, total=False):
+    """Closest settlement/road/river to the forest boundary"""
+    name: str
+    distance_m: float
+    geometry: Dict[str, Any]
+
+
+class ElevationStats(TypedDict):
+    """DEM elevation summary (meters)"""
+    min: Optional[float]
+    max: Optional[float]
+    mean: Optional[float]
+
+
+class SlopeStats(TypedDict):
+    """Slope class breakdown"""
+    dominant_class: Optional[str]
+    percentages: Optional[SlopePercentages]
 
-    # Area calculations
-    area_hectares: Optional[float]
-    area_sqm: Optional[float]
 
-    # Elevation metrics
-    elevation_min: Optional[float]
-    elevation_max: Optional[float]
-    elevation_mean: Optional[float]
+class AspectStats(TypedDict):
+    """Aspect direction breakdown"""
+    dominant: Optional[str]
+    percentages: Optional[AspectPercentages]
 
-    # Slope analysis
-    slope_dominant_class: Optional[str]
-    slope_percentages: Optional[Dict[str, float]]
 
-    # Aspect analysis
-    aspect_dominant: Optional[str]
-    aspect_percentages: Optional[Dict[str, float]]
+class CanopyStats(TypedDict):
+    """Canopy height class breakdown"""
+    dominant_class: Optional[str]
+    percentages: Optional[CanopyPercentages]
 
-    # Canopy height
-    canopy_dominant_class: Optional[str]
-    canopy_percentages: Optional[Dict[str, float]]
 
-    # Forest health
-    forest_health_dominant: Optional[str]
-    forest_health_percentages: Optional[Dict[str, float]]
+class HealthStats(TypedDict):
+    """Forest health class breakdown"""
+    dominant: Optional[str]
+    percentages: Optional[ForestHealthPercentages]
 
-    # Biomass and carbon
+
+class BiomassStats(TypedDict):
+    """Above-ground biomass and carbon stock"""
     agb_mean: Optional[float]
     agb_total: Optional[float]
     carbon_stock: Optional[float]
 
-    # Climate
+
+class ClimateStats(TypedDict):
+    """Mean annual temperature and precipitation"""
     temperature_mean: Optional[float]
     precipitation_mean: Optional[float]
 
-    # Land cover
-    landcover_dominant: Optional[str]
-    landcover_percentages: Optional[Dict[str, float]]
 
-    # Forest change
-    forest_loss_hectares: Optional[float]
-    forest_gain_hectares: Optional[float]
-    forest_loss_by_year: Optional[Dict[str, float]]
+class LandcoverStats(TypedDict):
+    """Land cover class breakdown"""
+    dominant: Optional[str]
+    percentages: Optional[Dict[str, float]]
+
+
+class ForestChangeStats(TypedDict):
+    """Forest loss and gain"""
+    loss_hectares: Optional[float]
+    gain_hectares: Optional[float]
+    loss_by_year: Optional[Dict[str, float]]
+
 
-    # Administrative location
+class Location(TypedDict):
+    """Administrative location"""
     province: Optional[str]
     municipality: Optional[str]
     ward: Optional[str]
 
-    # Proximity analysis
-    nearest_settlement: Optional[Dict[str, Any]]
-    nearest_road: Optional[Dict[str, Any]]
-    nearest_river: Optional[Dict[str, Any]]
+
+class Proximity(TypedDict):
+    """Nearby features"""
+    nearest_settlement: Optional[NearestFeature]
+    nearest_road: Optional[NearestFeature]
+    nearest_river: Optional[NearestFeature]
     buildings_within_1km: Optional[int]
 
+
+class AnalysisResultResponse(BaseModel):
+    """Schema for analysis results, grouped into one section per analysis"""
+    calculation_id: UUID
+    status: CalculationStatusLiteral
+    processing_time_ms: Optional[int]
+
+    # Area calculations
+    area_hectares: Optional[float]
+    area_sqm: Optional[float]
+
+    elevation: Optional[ElevationStats] = None
+    slope: Optional[SlopeStats] = None
+    aspect: Optional[AspectStats] = None
+    canopy: Optional[CanopyStats] = None
+    forest_health: Optional[HealthStats] = None
+    biomass: Optional[BiomassStats] = None
+    climate: Optional[ClimateStats] = None
+    landcover: Optional[LandcoverStats] = None
+    forest_change: Optional[ForestChangeStats] = None
+    location: Optional[Location] = None
+    proximity: Optional[Proximity] = None
+
     # Full JSONB data
-    full_results: Optional[Dict[str, Any]]
+    full_results: Optional[Dict[str, Any]] = None
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class ForestListQuery(BaseModel):
@@ -145,6 +230,8 @@ class MyForestsResponse(BaseModel):
     total_count: int
     total_area_hectares: float
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ReanalysisRequest(BaseModel):
     """Schema for re-running analysis with different options"""
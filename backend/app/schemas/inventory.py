@@ -1,11 +1,13 @@
 """
 Inventory schemas for request/response validation
 """
-from pydantic import BaseModel, Field
-from typing import Optional, Any, Dict, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Any, Dict, List, Literal
 from datetime import datetime
 from uuid import UUID
 
+from .common import PageInfo
+
 
 class TreeSpeciesCoefficientResponse(BaseModel):
     """Schema for tree species coefficient response"""
@@ -16,8 +18,7 @@ class TreeSpeciesCoefficientResponse(BaseModel):
     max_height_m: Optional[float]
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryUploadRequest(BaseModel):
@@ -70,8 +71,7 @@ class InventoryCalculationResponse(BaseModel):
     total_firewood_m3: Optional[float]
     total_firewood_chatta: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class InventoryTreeResponse(BaseModel):
@@ -101,22 +101,20 @@ class InventoryTreeResponse(BaseModel):
     longitude: Optional[float]
     latitude: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryTreesListResponse(BaseModel):
     """Schema for paginated trees list"""
     trees: List[InventoryTreeResponse]
-    total_count: int
-    page: int
-    page_size: int
-    has_more: bool
+    page: PageInfo
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class InventoryUpdateTreeRequest(BaseModel):
     """Schema for updating tree remark"""
-    remark: str = Field(..., pattern="^(Mother Tree|Felling Tree|Seedling)$")
+    remark: Literal["Mother Tree", "Felling Tree", "Seedling"]
 
 
 class InventorySummaryResponse(BaseModel):
@@ -152,12 +150,11 @@ class MyInventoriesResponse(BaseModel):
     inventories: List[InventoryCalculationResponse]
     total_count: int
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class ExportFormat(str):
-    """Export format enum"""
-    CSV = "csv"
-    SHAPEFILE = "shapefile"
-    GEOJSON = "geojson"
+# Export format options (shapefile export is not implemented yet)
+InventoryExportFormat = Literal["csv", "geojson"]
 
 
 # Boundary Correction Schemas
@@ -219,5 +216,4 @@ class TreeCorrectionLogResponse(BaseModel):
     correction_reason: str
     corrected_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
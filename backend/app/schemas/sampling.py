@@ -1,8 +1,9 @@
 """
 Pydantic schemas for Sampling Design API
 """
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional, Literal, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Literal, Dict, Any, Union
+from typing_extensions import Annotated
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
@@ -42,6 +43,45 @@ class BlockOverride(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
 
+class CircularPlot(BaseModel):
+    """Circular sample plot"""
+    plot_shape: Literal["circular"] = "circular"
+    plot_radius_meters: Decimal = Field(
+        default=Decimal("12.6156"),
+        ge=1.0,
+        le=50.0,
+        description="Plot radius (default: 12.62m for 500m² plot)"
+    )
+
+    model_config = ConfigDict(extra='forbid')
+
+
+class SquarePlot(BaseModel):
+    """Square sample plot"""
+    plot_shape: Literal["square"]
+    plot_length_meters: Decimal = Field(..., ge=1.0, le=100.0, description="Plot side length")
+    plot_width_meters: Decimal = Field(..., ge=1.0, le=100.0, description="Plot side width")
+
+    model_config = ConfigDict(extra='forbid')
+
+
+class RectangularPlot(BaseModel):
+    """Rectangular sample plot"""
+    plot_shape: Literal["rectangular"]
+    plot_length_meters: Decimal = Field(..., ge=1.0, le=100.0, description="Plot length")
+    plot_width_meters: Decimal = Field(..., ge=1.0, le=100.0, description="Plot width")
+
+    model_config = ConfigDict(extra='forbid')
+
+
+# Tagged on plot_shape so each shape's required dimensions are enforced by
+# the matching variant alone
+PlotSpec = Annotated[
+    Union[CircularPlot, SquarePlot, RectangularPlot],
+    Field(discriminator="plot_shape")
+]
+
+
 class SamplingDesignBase(BaseModel):
     """Base schema for sampling design"""
     sampling_type: Literal["systematic", "random", "stratified"] = Field(
@@ -60,12 +100,6 @@ class SamplingDesignBase(BaseModel):
         le=10.0,
         description="[DEPRECATED] Sampling intensity (points per hectare) - use sampling_intensity_percent instead"
     )
-    grid_spacing_meters: Optional[int] = Field(
-        None,
-        ge=10,
-        le=1000,
-        description="[DEPRECATED] Grid spacing for systematic sampling - calculated from intensity"
-    )
     min_samples_per_block: Optional[int] = Field(
         default=5,
         ge=2,
@@ -84,34 +118,6 @@ class SamplingDesignBase(BaseModel):
         le=500,
         description="Minimum distance between points"
     )
-    num_strata: Optional[int] = Field(
-        None,
-        ge=4,
-        le=100,
-        description="Number of strata for stratified sampling"
-    )
-    plot_shape: Optional[Literal["circular", "square", "rectangular"]] = Field(
-        default="circular",
-        description="Sample plot shape (default: circular)"
-    )
-    plot_radius_meters: Optional[Decimal] = Field(
-        default=Decimal("12.6156"),
-        ge=1.0,
-        le=50.0,
-        description="Plot radius for circular plots (default: 12.62m for 500m² plot)"
-    )
-    plot_length_meters: Optional[Decimal] = Field(
-        None,
-        ge=1.0,
-        le=100.0,
-        description="Plot length for rectangular plots"
-    )
-    plot_width_meters: Optional[Decimal] = Field(
-        None,
-        ge=1.0,
-        le=100.0,
-        description="Plot width for rectangular plots"
-    )
     boundary_buffer_meters: Optional[float] = Field(
         default=50.0,
         ge=0.0,
@@ -125,28 +131,49 @@ class SamplingDesignBase(BaseModel):
     )
 
 
-class SamplingDesignCreate(SamplingDesignBase):
-    """Schema for creating sampling design"""
+class SamplingDesignCreateBase(SamplingDesignBase):
+    """Fields shared by every sampling design create request"""
+    plot: PlotSpec = Field(
+        default_factory=CircularPlot,
+        description="Sample plot shape and dimensions (default: 500m² circular plot)"
+    )
 
-    @field_validator('plot_radius_meters')
-    @classmethod
-    def validate_plot_radius(cls, v, info):
-        """Validate plot radius for circular plots"""
-        if info.data.get('plot_shape') == 'circular' and v is None:
-            # Default to 12.6156m (500m² plot)
-            return Decimal("12.6156")
-        return v
+    model_config = ConfigDict(extra='forbid')
 
-    @field_validator('plot_length_meters', 'plot_width_meters')
-    @classmethod
-    def validate_rectangular_dimensions(cls, v, info):
-        """Validate dimensions for rectangular plots"""
-        if info.data.get('plot_shape') in ['square', 'rectangular']:
-            if v is None:
-                raise ValueError(f"plot_length_meters and plot_width_meters required for {info.data.get('plot_shape')} plots")
-        return v
 
-    model_config = ConfigDict(extra='forbid')
+class SystematicSamplingDesign(SamplingDesignCreateBase):
+    """Create request for systematic (regular grid) sampling"""
+    sampling_type: Literal["systematic"]
+    grid_spacing_meters: Optional[int] = Field(
+        None,
+        ge=10,
+        le=1000,
+        description="[DEPRECATED] Grid spacing for systematic sampling - calculated from intensity"
+    )
+
+
+class RandomSamplingDesign(SamplingDesignCreateBase):
+    """Create request for random sampling"""
+    sampling_type: Literal["random"]
+
+
+class StratifiedSamplingDesign(SamplingDesignCreateBase):
+    """Create request for stratified random sampling"""
+    sampling_type: Literal["stratified"]
+    num_strata: Optional[int] = Field(
+        None,
+        ge=4,
+        le=100,
+        description="Number of strata for stratified sampling"
+    )
+
+
+SamplingDesignVariant = Union[SystematicSamplingDesign, RandomSamplingDesign, StratifiedSamplingDesign]
+
+# Tagged on sampling_type so each request is validated against exactly one
+# variant. Route handlers use Body(discriminator="sampling_type") on
+# SamplingDesignVariant, since FastAPI rejects a pydantic Field in Annotated.
+SamplingDesignCreate = Annotated[SamplingDesignVariant, Field(discriminator="sampling_type")]
 
 
 class SamplingDesignUpdate(BaseModel):
@@ -161,6 +188,11 @@ class SamplingDesign(SamplingDesignBase):
     id: UUID
     calculation_id: UUID
     total_points: int
+    grid_spacing_meters: Optional[int] = None
+    plot_shape: Optional[Literal["circular", "square", "rectangular"]] = None
+    plot_radius_meters: Optional[Decimal] = None
+    plot_length_meters: Optional[Decimal] = None
+    plot_width_meters: Optional[Decimal] = None
     created_at: datetime
     updated_at: datetime
     default_parameters: Optional[Dict[str, Any]] = Field(
@@ -192,13 +224,13 @@ class BlockSamplingInfo(BaseModel):
     """Information about sampling in one block"""
     block_number: int
     block_name: str
-    block_area_hectares: Decimal
+    block_area_hectares: float
     samples_generated: int
     minimum_enforced: bool = Field(
         ...,
         description="Whether minimum sample rule was applied"
     )
-    actual_intensity_percent: Decimal = Field(
+    actual_intensity_percent: float = Field(
         ...,
         description="Actual sampling intensity achieved for this block"
     )
@@ -213,7 +245,7 @@ class SamplingGenerateResponse(BaseModel):
     sampling_type: str
     total_points: int
     total_blocks: int = Field(..., description="Number of forest blocks")
-    forest_area_hectares: Decimal
+    forest_area_hectares: float
     requested_intensity_percent: Decimal = Field(
         ...,
         description="Requested sampling intensity percentage"
@@ -222,12 +254,12 @@ class SamplingGenerateResponse(BaseModel):
         ...,
         description="Actual sampling intensity achieved (points per hectare)"
     )
-    plot_area_sqm: Optional[Decimal] = Field(None, description="Individual plot area")
-    total_sampled_area_hectares: Optional[Decimal] = Field(
+    plot_area_sqm: Optional[float] = Field(None, description="Individual plot area")
+    total_sampled_area_hectares: Optional[float] = Field(
         None,
         description="Total area covered by all plots"
     )
-    sampling_percentage: Optional[Decimal] = Field(
+    sampling_percentage: Optional[float] = Field(
         None,
         description="Percentage of forest area sampled"
     )
@@ -236,10 +268,8 @@ class SamplingGenerateResponse(BaseModel):
         description="Per-block sampling details"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class SamplingExportFormat(str):
-    """Export format options"""
-    CSV = "csv"
-    GPX = "gpx"
-    GEOJSON = "geojson"
-    KML = "kml"
+# Export format options
+SamplingExportFormat = Literal["csv", "gpx", "kml", "geojson"]
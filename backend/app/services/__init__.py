@@ -1,10 +1,21 @@
 """Service modules"""
 # Temporarily commented out due to pyproj DLL issue
 # from .file_processor import process_uploaded_file, calculate_area_utm
-from .analysis import analyze_forest_boundary
 
 __all__ = [
     # "process_uploaded_file",
     # "calculate_area_utm",
     "analyze_forest_boundary",
 ]
+
+
+def __getattr__(name):
+    # Import on first access so that loading any app.services submodule
+    # does not pull in the whole analysis pipeline
+    if name == "analyze_forest_boundary":
+        from .analysis import analyze_forest_boundary
+        return analyze_forest_boundary
+    if name in ("process_uploaded_file", "calculate_area_utm"):
+        from . import file_processor
+        return getattr(file_processor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,42 @@
 Forest boundary analysis service
 Performs raster and vector analysis on uploaded forest boundaries
 """
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import re
 import time
-from typing import Dict, Any, Tuple, Optional
+from contextvars import ContextVar
+from typing import Dict, Any, Tuple, Optional, Union
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import func, text
+import orjson
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime
 
-from ..models.calculation import Calculation
+from ..core.database import SessionLocal
+from ..models.calculation import Calculation, CalculationCache, RasterStatsCache
+
+logger = logging.getLogger(__name__)
+
+# Version of the whole-forest analysis, part of the calculation_cache key;
+# bump it whenever a change alters whole-forest results so old entries are
+# no longer served
+ANALYSIS_VERSION = 2
+
+# Errors the analysis helpers caught (and replaced with empty results) during
+# the current whole-forest analysis; such a run is not written to
+# calculation_cache. None outside analyze_forest_boundary.
+_analysis_errors: ContextVar[Optional[list]] = ContextVar("_analysis_errors", default=None)
+
+# WGS 84 / UTM zone SRID (326xx north, 327xx south) for a point named centroid
+UTM_SRID_SQL = """(
+    CASE WHEN ST_Y(centroid) >= 0 THEN 32600 ELSE 32700 END
+    + floor((ST_X(centroid) + 180) / 6)::int + 1
+)"""
 
 
 async def analyze_forest_boundary(calculation_id: UUID, db: Session, options: Optional[Dict[str, bool]] = None) -> Tuple[Dict[str, Any], int]:
@@ -24,7 +52,7 @@ async def analyze_forest_boundary(calculation_id: UUID, db: Session, options: Op
                  If None, all analyses run (backward compatible)
 
     Returns:
-        Tuple of (result_data dict, processing_time_seconds)
+        Tuple of (result_data dict, processing_time_ms)
     """
     # Default options: run everything if not specified
     if options is None:
@@ -34,10 +62,16 @@ async def analyze_forest_boundary(calculation_id: UUID, db: Session, options: Op
     def should_run(analysis_name: str) -> bool:
         return options.get(analysis_name, True)  # Default True for backward compatibility
     # Per-block analysis enabled
-    start_time = time.time()
-
-    # Get calculation record
-    calculation = db.query(Calculation).filter(Calculation.id == calculation_id).first()
+    start_ns = time.perf_counter_ns()
+
+    # Get calculation record (only the stored blocks are needed here; the
+    # boundary geometry is read further down in the form each step uses)
+    calculation = (
+        db.query(Calculation)
+        .options(load_only(Calculation.result_data))
+        .filter(Calculation.id == calculation_id)
+        .first()
+    )
     if not calculation:
         raise ValueError(f"Calculation {calculation_id} not found")
 
@@ -47,102 +81,179 @@ async def analyze_forest_boundary(calculation_id: UUID, db: Session, options: Op
     existing_data = calculation.result_data or {}
     blocks = existing_data.get('blocks', [])
 
-    # Analyze each block separately
-    analyzed_blocks = []
-    for i, block in enumerate(blocks):
-        print(f"Analyzing block {i+1}/{len(blocks)}: {block.get('block_name', f'Block {i+1}')}", flush=True)
+    # Tile-based raster summaries for every block in one round trip
+    block_summary_options = [
+        option for option, _, _, _ in _BLOCK_SUMMARY_LAYERS + _CLIMATE_LAYERS
+        if options.get('run_raster_analysis', True) and options.get(option, True)
+    ]
+    # Serialize each block geometry once for every PostGIS call that takes it
+    block_geojsons = [orjson.dumps(block['geometry']).decode() for block in blocks]
+    block_summaries = {}
+    if blocks and block_summary_options:
+        block_summaries = await asyncio.to_thread(
+            _fetch_block_raster_summaries,
+            block_geojsons,
+            block_summary_options,
+            db
+        )
+
+    async def analyze_block(i: int, block: Dict) -> Dict:
+        logger.info("Analyzing block %d/%d: %s", i + 1, len(blocks), block.get('block_name', f'Block {i+1}'))
 
         try:
             block_analysis = await analyze_block_geometry(
-                block['geometry'],
+                block_geojsons[i],
                 calculation_id,
                 db,
-                options
+                options,
+                # A block without raster rows has an empty summary, not a
+                # missing one (which would query it again)
+                block_summaries.get(i + 1, ({}, {}, {}))
             )
+            logger.info("Block %d analysis completed successfully", i + 1)
             # Merge analysis results into block data
-            analyzed_block = {**block, **block_analysis}
-            print(f"Block {i+1} analysis completed successfully", flush=True)
+            return {**block, **block_analysis}
 
         except Exception as block_error:
-            print(f"Error analyzing block {i+1}: {block_error}")
+            logger.exception("Error analyzing block %d", i + 1)
             db.rollback()  # Rollback failed block transaction
 
-            # Commit to clear transaction state for next block
-            try:
-                db.commit()
-                print(f"Transaction reset after block {i+1} error")
-            except Exception as commit_error:
-                print(f"Warning: Could not commit after block error: {commit_error}")
-
             # Continue with minimal data for this block
-            analyzed_block = {**block, "analysis_error": str(block_error)[:200]}
+            return {**block, "analysis_error": str(block_error)[:200]}
 
-        analyzed_blocks.append(analyzed_block)
-
-        # ALWAYS commit after each block to ensure clean transaction state for next block
-        try:
-            db.commit()
-            print(f"Block {i+1} transaction committed")
-        except Exception as commit_error:
-            print(f"Warning: Could not commit after block {i+1}: {commit_error}")
-            db.rollback()
+    # Analyze the blocks concurrently: their helper queries share the
+    # _GEOMETRY_HELPER_SLOTS, so one block's slow helper no longer holds up the
+    # next block. The block queries only read, and results keep block order.
+    analyzed_blocks = await asyncio.gather(
+        *(analyze_block(i, block) for i, block in enumerate(blocks))
+    )
 
     # Store analyzed blocks
-    results['blocks'] = analyzed_blocks
+    results['blocks'] = list(analyzed_blocks)
 
     # Commit block results to clear any transaction issues
-    print(f"Committing block analysis results...")
+    logger.debug("Committing block analysis results")
     try:
         db.commit()
-        print("Block analysis committed successfully")
+        logger.debug("Block analysis committed successfully")
     except Exception as commit_error:
-        print(f"Warning: Could not commit block results: {commit_error}")
+        logger.warning("Could not commit block results: %s", commit_error)
         db.rollback()
 
-    # Also calculate whole-area statistics for summary
-    # 1. Calculate area (using UTM projection for accuracy)
-    print("Starting whole-forest analysis...")
-    area_data = calculate_area(calculation_id, db)
-    results.update(area_data)
+    # The whole-forest steps below only read, so they share one read-only
+    # snapshot instead of taking a new one per statement (the helpers on
+    # their own sessions import it, see step 2-3)
+    db.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
 
-    # 1b. Calculate whole forest extent (bounding box)
-    extent_query = text("""
+    # Also calculate whole-area statistics for summary
+    # 1. Read the whole boundary once: EWKB for the raster query, WKT for
+    # the vector helpers; the cache key digest, extent (bounding box), UTM
+    # zone and area are generated columns kept in sync with boundary_geom
+    logger.info("Starting whole-forest analysis")
+    boundary_query = text("""
         SELECT
-            ST_YMax(ST_Envelope(boundary_geom)) as north,
-            ST_YMin(ST_Envelope(boundary_geom)) as south,
-            ST_XMax(ST_Envelope(boundary_geom)) as east,
-            ST_XMin(ST_Envelope(boundary_geom)) as west
-        FROM calculations WHERE id = :calc_id
+            boundary_digest as geom_digest,
+            ST_AsEWKB(boundary_geom) as ewkb,
+            ST_AsText(boundary_geom) as wkt,
+            ROUND(bbox_n::numeric, 7)::float8 as north,
+            ROUND(bbox_s::numeric, 7)::float8 as south,
+            ROUND(bbox_e::numeric, 7)::float8 as east,
+            ROUND(bbox_w::numeric, 7)::float8 as west,
+            utm_srid,
+            ROUND(area_sqm::numeric, 2)::float8 as area_sqm,
+            ROUND((area_sqm / 10000.0)::numeric, 4)::float8 as area_hectares
+        FROM public.calculations
+        WHERE id = :calc_id
     """)
-    whole_extent = db.execute(extent_query, {"calc_id": str(calculation_id)}).first()
-    if whole_extent:
+    whole_geom = db.execute(boundary_query, {"calc_id": calculation_id}).first()
+
+    # 1a. The whole-forest statistics depend only on the geometry and the
+    # options, so identical boundaries reuse an earlier run
+    cache_key = None
+    if whole_geom:
+        cache_key = hashlib.sha256(
+            f"v{ANALYSIS_VERSION}:".encode()
+            + bytes(whole_geom.geom_digest)
+            + json.dumps(options, sort_keys=True).encode()
+        ).digest()
+        cached = db.get(CalculationCache, cache_key)
+        if cached is not None:
+            logger.info("Whole-forest analysis loaded from cache")
+            db.commit()
+            results.update(cached.results)
+            return results, (time.perf_counter_ns() - start_ns) // 1_000_000
+
+    # 1b. Area (using UTM projection for accuracy) and extent (bounding box)
+    if whole_geom:
+        results["area_sqm"] = whole_geom.area_sqm
+        results["area_hectares"] = whole_geom.area_hectares
+        results["utm_zone"] = whole_geom.utm_srid
         results["whole_forest_extent"] = {
-            "N": round(float(whole_extent.north), 7),
-            "S": round(float(whole_extent.south), 7),
-            "E": round(float(whole_extent.east), 7),
-            "W": round(float(whole_extent.west), 7)
+            "N": whole_geom.north,
+            "S": whole_geom.south,
+            "E": whole_geom.east,
+            "W": whole_geom.west
         }
 
-    # 2. Raster analysis on whole boundary (if enabled)
-    if should_run('run_raster_analysis'):
-        raster_results = await analyze_rasters(calculation_id, db)
-        results.update(raster_results)
+    # 2-3. The raster summary runs on this session (in the read-only
+    # snapshot) while the independent whole-forest vector helpers run
+    # alongside it, each on its own pooled session that imports the same
+    # snapshot
+    snapshot = db.execute(text("SELECT pg_export_snapshot()")).scalar() if whole_geom else None
+    whole_helpers = {}
+    if whole_geom:
+        whole_helpers = {
+            "location": get_administrative_location,
+            "geology": analyze_geology_geometry,
+            "access": calculate_access_info,
+            "features": analyze_nearby_features,
+            "physiography": analyze_physiography_geometry,
+            "ecoregion": analyze_ecoregion_geometry,
+            "nasa_forest_2020": analyze_nasa_forest_2020_geometry,
+        }
+        if should_run('run_landcover_1984'):
+            whole_helpers["landcover_1984"] = analyze_landcover_1984_geometry
+        if should_run('run_hansen2000'):
+            whole_helpers["hansen2000"] = analyze_hansen2000_geometry
+
+    run_rasters = bool(whole_geom) and should_run('run_raster_analysis')
+    logger.info("Analyzing whole forest rasters and vector layers")
+    # The tasks and worker threads below copy this context, so every helper
+    # records into the same list
+    whole_errors: list = []
+    errors_token = _analysis_errors.set(whole_errors)
+    outcomes = await asyncio.gather(
+        *([analyze_rasters(
+            bytes(whole_geom.ewkb), db, geom_digest=bytes(whole_geom.geom_digest)
+        )] if run_rasters else []),
+        *(_run_geometry_helper(helper, whole_geom.wkt, snapshot) for helper in whole_helpers.values()),
+        return_exceptions=True
+    )
+    _analysis_errors.reset(errors_token)
+    if run_rasters:
+        raster_results, outcomes = outcomes[0], outcomes[1:]
+        if isinstance(raster_results, Exception):
+            logger.error("Error analyzing whole forest rasters", exc_info=raster_results)
+            whole_errors.append(raster_results)
+        else:
+            results.update(raster_results)
+    whole = {}
+    for name, outcome in zip(whole_helpers, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Error analyzing whole forest %s", name, exc_info=outcome)
+            whole_errors.append(outcome)
+            outcome = {}
+        whole[name] = outcome
 
     # 3. Vector analysis (if enabled)
     if should_run('run_proximity'):
-        vector_results = await analyze_vectors(calculation_id, db)
+        vector_results = analyze_vectors(calculation_id, db)
         results.update(vector_results)
 
-    # 3b. Get administrative location for whole forest
-    whole_geom_query = text("""
-        SELECT ST_AsText(boundary_geom) as wkt
-        FROM public.calculations
-        WHERE id = :calc_id
-    """)
-    whole_geom = db.execute(whole_geom_query, {"calc_id": str(calculation_id)}).first()
     if whole_geom:
-        whole_location = get_administrative_location(whole_geom.wkt, db)
-        # Prefix keys with "whole_" to distinguish from block-level data
+        # 3b. Administrative location, prefixed with "whole_" to distinguish
+        # from block-level data
+        whole_location = whole["location"]
         results["whole_province"] = whole_location.get("province")
         results["whole_district"] = whole_location.get("district")
         results["whole_municipality"] = whole_location.get("municipality")
@@ -150,136 +261,293 @@ async def analyze_forest_boundary(calculation_id: UUID, db: Session, options: Op
         results["whole_watershed"] = whole_location.get("watershed")
         results["whole_major_river_basin"] = whole_location.get("major_river_basin")
 
-    # 3c. Geology analysis for whole forest
-    if whole_geom:
-        whole_geology = analyze_geology_geometry(whole_geom.wkt, db)
-        results["whole_geology_percentages"] = whole_geology.get("geology_percentages")
+        # 3c. Geology
+        results["whole_geology_percentages"] = whole["geology"].get("geology_percentages")
 
-    # 3d. Access information for whole forest
-    if whole_geom:
-        whole_access = calculate_access_info(whole_geom.wkt, db)
-        results["whole_access_info"] = whole_access.get("access_info")
+        # 3d. Access information
+        results["whole_access_info"] = whole["access"].get("access_info")
 
-    # 3e. Nearby features for whole forest
-    if whole_geom:
-        whole_features = analyze_nearby_features(whole_geom.wkt, db)
+        # 3e. Nearby features
+        whole_features = whole["features"]
         results["whole_features_north"] = whole_features.get("features_north")
         results["whole_features_east"] = whole_features.get("features_east")
         results["whole_features_south"] = whole_features.get("features_south")
         results["whole_features_west"] = whole_features.get("features_west")
 
-    # 3f. Physiography for whole forest
-    if whole_geom:
-        print("Analyzing whole forest physiography...", flush=True)
-        try:
-            whole_physio = analyze_physiography_geometry(whole_geom.wkt, db)
-            results["whole_physiography_percentages"] = whole_physio.get("physiography_percentages")
-            print(f"Whole forest physiography: {whole_physio.get('physiography_percentages')}", flush=True)
-        except Exception as e:
-            print(f"Error analyzing whole forest physiography: {e}")
-            results["whole_physiography_percentages"] = None
+        # 3f. Physiography
+        results["whole_physiography_percentages"] = whole["physiography"].get("physiography_percentages")
+        logger.debug("Whole forest physiography: %s", results['whole_physiography_percentages'])
 
-    # 3g. Ecoregion for whole forest
-    if whole_geom:
-        print("Analyzing whole forest ecoregion...", flush=True)
-        try:
-            whole_ecoregion = analyze_ecoregion_geometry(whole_geom.wkt, db)
-            results["whole_ecoregion_percentages"] = whole_ecoregion.get("ecoregion_percentages")
-            print(f"Whole forest ecoregion: {whole_ecoregion.get('ecoregion_percentages')}", flush=True)
-        except Exception as e:
-            print(f"Error analyzing whole forest ecoregion: {e}")
-            results["whole_ecoregion_percentages"] = None
+        # 3g. Ecoregion
+        results["whole_ecoregion_percentages"] = whole["ecoregion"].get("ecoregion_percentages")
+        logger.debug("Whole forest ecoregion: %s", results['whole_ecoregion_percentages'])
 
-    # 3h. NASA Forest 2020 for whole forest
-    if whole_geom:
-        print("Analyzing whole forest NASA forest 2020...", flush=True)
-        try:
-            whole_nasa = analyze_nasa_forest_2020_geometry(whole_geom.wkt, db)
-            results["whole_nasa_forest_2020_percentages"] = whole_nasa.get("nasa_forest_2020_percentages")
-            results["whole_nasa_forest_2020_dominant"] = whole_nasa.get("nasa_forest_2020_dominant")
-            print(f"Whole forest NASA forest 2020: {whole_nasa.get('nasa_forest_2020_percentages')}", flush=True)
-        except Exception as e:
-            print(f"Error analyzing whole forest NASA forest 2020: {e}")
-            results["whole_nasa_forest_2020_percentages"] = None
-            results["whole_nasa_forest_2020_dominant"] = None
+        # 3h. NASA Forest 2020
+        whole_nasa = whole["nasa_forest_2020"]
+        results["whole_nasa_forest_2020_percentages"] = whole_nasa.get("nasa_forest_2020_percentages")
+        results["whole_nasa_forest_2020_dominant"] = whole_nasa.get("nasa_forest_2020_dominant")
+        logger.debug("Whole forest NASA forest 2020: %s", results['whole_nasa_forest_2020_percentages'])
 
-    # 3i. Landcover 1984 for whole forest (Historical baseline)
-    if whole_geom and should_run('run_landcover_1984'):
-        print("Analyzing whole forest landcover 1984...", flush=True)
-        try:
-            whole_lc1984 = analyze_landcover_1984_geometry(whole_geom.wkt, db)
+        # 3i. Landcover 1984 (Historical baseline)
+        if "landcover_1984" in whole:
+            whole_lc1984 = whole["landcover_1984"]
             results["landcover_1984_dominant"] = whole_lc1984.get("landcover_1984_dominant")
             results["landcover_1984_percentages"] = whole_lc1984.get("landcover_1984_percentages")
-            print(f"Whole forest landcover 1984 dominant: {whole_lc1984.get('landcover_1984_dominant')}", flush=True)
-        except Exception as e:
-            print(f"Error analyzing whole forest landcover 1984: {e}")
-            results["landcover_1984_dominant"] = None
-            results["landcover_1984_percentages"] = None
+            logger.debug("Whole forest landcover 1984 dominant: %s", results['landcover_1984_dominant'])
 
-    # 3j. Hansen 2000 for whole forest (Forest classification)
-    if whole_geom and should_run('run_hansen2000'):
-        print("Analyzing whole forest hansen 2000...", flush=True)
-        try:
-            whole_hansen2000 = analyze_hansen2000_geometry(whole_geom.wkt, db)
+        # 3j. Hansen 2000 (Forest classification)
+        if "hansen2000" in whole:
+            whole_hansen2000 = whole["hansen2000"]
             results["hansen2000_dominant"] = whole_hansen2000.get("hansen2000_dominant")
             results["hansen2000_percentages"] = whole_hansen2000.get("hansen2000_percentages")
-            print(f"Whole forest hansen 2000 dominant: {whole_hansen2000.get('hansen2000_dominant')}", flush=True)
-        except Exception as e:
-            print(f"Error analyzing whole forest hansen 2000: {e}")
-            results["hansen2000_dominant"] = None
-            results["hansen2000_percentages"] = None
-
-    # 3k. Temperature for whole forest
-    if whole_geom and should_run('run_temperature'):
-        print("Analyzing whole forest temperature...", flush=True)
-        try:
-            whole_temp = analyze_temperature_geometry(whole_geom.wkt, db)
-            results["temperature_mean_c"] = whole_temp.get("temperature_mean_c")
-            results["temperature_min_c"] = whole_temp.get("temperature_min_c")
-            print(f"Whole forest temperature: {whole_temp.get('temperature_mean_c')}°C (mean), {whole_temp.get('temperature_min_c')}°C (min)", flush=True)
-        except Exception as e:
-            print(f"Error analyzing whole forest temperature: {e}")
-            results["temperature_mean_c"] = None
-            results["temperature_min_c"] = None
-
-    # 3l. Precipitation for whole forest
-    if whole_geom and should_run('run_precipitation'):
-        print("Analyzing whole forest precipitation...", flush=True)
-        try:
-            whole_precip = analyze_precipitation_geometry(whole_geom.wkt, db)
-            results["precipitation_mean_mm"] = whole_precip.get("precipitation_mean_mm")
-            print(f"Whole forest precipitation: {whole_precip.get('precipitation_mean_mm')} mm/year", flush=True)
-        except Exception as e:
-            print(f"Error analyzing whole forest precipitation: {e}")
-            results["precipitation_mean_mm"] = None
+            logger.debug("Whole forest hansen 2000 dominant: %s", results['hansen2000_dominant'])
 
     # 4. Administrative boundaries
-    admin_results = await analyze_admin_boundaries(calculation_id, db)
+    admin_results = analyze_admin_boundaries(calculation_id, db)
     results.update(admin_results)
 
-    processing_time = int(time.time() - start_time)
+    processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+    # End the read-only snapshot before writing the cache entry
+    db.commit()
+
+    # Only complete results are cached: a run where some query failed would
+    # otherwise be served for this boundary from then on
+    if cache_key is not None and not whole_errors:
+        db.execute(
+            insert(CalculationCache)
+            .values(
+                geom_hash=cache_key,
+                results={k: v for k, v in results.items() if k != 'blocks'}
+            )
+            .on_conflict_do_nothing()
+        )
 
     # Commit all analysis results to ensure clean transaction state
-    print("Committing final analysis results...")
+    logger.debug("Committing final analysis results")
     try:
         db.commit()
-        print("Analysis transaction committed successfully")
+        logger.debug("Analysis transaction committed successfully")
     except Exception as commit_error:
-        print(f"Warning: Could not commit analysis: {commit_error}")
+        logger.warning("Could not commit analysis: %s", commit_error)
         db.rollback()
 
-    return results, processing_time
+    return results, processing_time_ms
+
+
+# Tile-based rasters summarised for all blocks at once:
+# (analysis option, layer, raster table, pixel value filter). Layers without a
+# filter get band 1 ST_SummaryStatsAgg statistics instead of value counts.
+_BLOCK_SUMMARY_LAYERS = [
+    ("run_elevation", "dem", "rasters.dem", None),
+    ("run_biomass", "agb", "rasters.agb_2022_nepal", None),
+    ("run_slope", "slope", "rasters.slope", "(pvc).value BETWEEN 1 AND 4"),
+    ("run_aspect", "aspect", "rasters.aspect", "(pvc).value BETWEEN 1 AND 8"),
+    ("run_canopy", "canopy_height", "rasters.canopy_height", "(pvc).value BETWEEN 0 AND 50"),
+    ("run_forest_health", "forest_health", "rasters.nepal_forest_health", "(pvc).value BETWEEN 1 AND 5"),
+    ("run_forest_type", "forest_type", "rasters.forest_type", "(pvc).value BETWEEN 1 AND 26"),
+    ("run_landcover", "landcover", "rasters.esa_world_cover", "(pvc).value > 0"),
+    ("run_forest_loss", "forest_loss", "rasters.nepal_lossyear", "(pvc).value > 0"),
+    ("run_forest_gain", "forest_gain", "rasters.nepal_gain", "(pvc).value = 1"),
+    ("run_fire_loss", "fire_loss", "rasters.forest_loss_fire", "(pvc).value > 0"),
+    ("run_hansen2000", "hansen2000", "rasters.hansen2000_classified", "(pvc).value BETWEEN 0 AND 4"),
+]
+
+# Climate means, for the whole forest and for all blocks at once, weighted by
+# per-value pixel counts over the plausible value range. The ranges also drop
+# NaN / Infinity pixels (NaN sorts above Infinity), so every mean is finite or
+# NULL: (analysis option, "climate" stat name, raster table, pixel value filter)
+_CLIMATE_LAYERS = [
+    ("run_temperature", "temp_mean", "rasters.annual_mean_temperature",
+     "(pvc).value > -100 AND (pvc).value < 100"),
+    ("run_temperature", "temp_min", "rasters.min_temp_coldest_month",
+     "(pvc).value > -100 AND (pvc).value < 100"),
+    ("run_precipitation", "precip_mean", "rasters.annual_precipitation",
+     "(pvc).value >= 0 AND (pvc).value < 'Infinity'"),
+]
+
+# Forest change layers reported in hectares. The Hansen rasters are EPSG:4326
+# with 0.00025 degree (0.9 arc-second) pixels, whose ground area shrinks with
+# latitude (about 680 sqm over Nepal, not the nominal 30m x 30m), so their
+# value-count rows carry the geodesic pixel area summed per value in
+# stat_value (sqm).
+_AREA_LAYERS = {"forest_loss", "forest_gain", "fire_loss"}
+
+# Geodesic area (sqm) of one pixel of tile r.rast, taken on the pixel row at
+# the latitude of the boundary centroid (clamped to the tile)
+_PIXEL_AREA_SQL = """ST_Area(ST_PixelAsPolygon(r.rast, 1, GREATEST(1, LEAST(ST_Height(r.rast),
+                   ST_WorldToRasterCoordY(r.rast, ST_Y(ST_Centroid(b.geom))))))::geography)"""
+
+# Tables reported missing (UndefinedTable), by time.monotonic() when noted;
+# the raster queries skip them instead of failing on every block, and query
+# them again after _MISSING_TABLE_TTL seconds in case they have been loaded
+_MISSING_TABLE_TTL = 60
+_missing_tables: Dict[str, float] = {}
+
+
+def _note_analysis_error(error: Exception) -> None:
+    """Record an error a helper caught for the current whole-forest analysis"""
+    errors = _analysis_errors.get()
+    if errors is not None:
+        errors.append(error)
+
+
+def _note_missing_table(error: Exception) -> None:
+    """Remember the relation named in an UndefinedTable error"""
+    orig = getattr(error, "orig", None)
+    if getattr(orig, "pgcode", None) == "42P01":
+        match = re.search(r'relation "([^"]+)" does not exist', str(orig))
+        if match:
+            _missing_tables[match.group(1)] = time.monotonic()
+
+
+def _is_missing(table: str) -> bool:
+    """Whether table was reported missing in the last _MISSING_TABLE_TTL seconds"""
+    noted = _missing_tables.get(table)
+    if noted is None:
+        return False
+    if time.monotonic() - noted < _MISSING_TABLE_TTL:
+        return True
+    _missing_tables.pop(table, None)
+    return False
+
+
+def _block_raster_summary_query(option_names: list):
+    """The enabled _BLOCK_SUMMARY_LAYERS and _CLIMATE_LAYERS for every block
+    in one statement, skipping tables known to be missing
+
+    Rows are (block_idx, layer, class_value, pixel_count, stat_name, stat_value)
+    as in _raster_summary_query; block_idx is the 1-based position in :geojsons.
+    None if every enabled table is missing.
+    """
+    branches = []
+    for option, layer, table, value_filter in _BLOCK_SUMMARY_LAYERS:
+        if option not in option_names or _is_missing(table):
+            continue
+        if value_filter is None:
+            branches.append(f"""
+        SELECT s.idx AS block_idx, '{layer}'::text AS layer, NULL::float8 AS class_value,
+               NULL::bigint AS pixel_count, v.name::text AS stat_name, v.value::float8 AS stat_value
+        FROM (
+            SELECT b.idx, ST_SummaryStatsAgg(ST_Clip(r.rast, 1, b.geom, true), 1, true) AS stats
+            FROM {table} r JOIN blocks b ON ST_Intersects(r.rast, b.geom)
+            GROUP BY b.idx
+        ) AS s,
+        LATERAL (VALUES ('min', (s.stats).min), ('max', (s.stats).max),
+                        ('mean', (s.stats).mean), ('sum', (s.stats).sum)) AS v(name, value)""")
+        else:
+            pixel_area = _PIXEL_AREA_SQL if layer in _AREA_LAYERS else "NULL::float8"
+            branches.append(f"""
+        SELECT idx AS block_idx, '{layer}'::text AS layer, (pvc).value::float8 AS class_value,
+               SUM((pvc).count)::bigint AS pixel_count, NULL::text AS stat_name,
+               SUM((pvc).count * pixel_m2)::float8 AS stat_value
+        FROM (
+            SELECT b.idx, ST_ValueCount(ST_Clip(r.rast, b.geom)) AS pvc,
+                   {pixel_area} AS pixel_m2
+            FROM {table} r JOIN blocks b ON ST_Intersects(r.rast, b.geom)
+        ) AS {layer}_counts
+        WHERE (pvc).value IS NOT NULL AND {value_filter}
+        GROUP BY idx, (pvc).value""")
+    for option, name, table, value_filter in _CLIMATE_LAYERS:
+        if option not in option_names or _is_missing(table):
+            continue
+        branches.append(f"""
+        SELECT idx AS block_idx, 'climate'::text AS layer, NULL::float8 AS class_value,
+               NULL::bigint AS pixel_count, '{name}'::text AS stat_name,
+               (SUM((pvc).value * (pvc).count) / NULLIF(SUM((pvc).count), 0))::float8 AS stat_value
+        FROM (
+            SELECT b.idx, ST_ValueCount(ST_Clip(r.rast, b.geom)) AS pvc
+            FROM {table} r JOIN blocks b ON ST_Intersects(r.rast, b.geom)
+        ) AS {name}_counts
+        WHERE {value_filter}
+        GROUP BY idx""")
+
+    if not branches:
+        return None
+    return text("""
+        WITH blocks AS (
+            SELECT b.idx, ST_SetSRID(ST_GeomFromGeoJSON(b.geojson), 4326) AS geom
+            FROM unnest(CAST(:geojsons AS text[])) WITH ORDINALITY AS b(geojson, idx)
+        )
+    """ + "\n        UNION ALL".join(branches))
 
 
-async def analyze_block_geometry(geojson_geometry: Dict, calculation_id: UUID, db: Session, options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+def _fetch_block_raster_summaries(geojsons: list, option_names: list, db: Session) -> Dict[int, Tuple[Dict, Dict, Dict]]:
+    """Run _block_raster_summary_query: {block_idx: (value counts, stats, areas)} by layer"""
+    summaries: Dict[int, Tuple[Dict, Dict, Dict]] = {}
+    query = _block_raster_summary_query(option_names)
+    if query is None:
+        return summaries
+    try:
+        db.execute(RASTER_SESSION_SETTINGS)
+        rows = db.execute(query, {"geojsons": geojsons}).fetchall()
+    except Exception as e:
+        _note_missing_table(e)
+        logger.exception("Error analyzing block rasters")
+        db.rollback()
+        return summaries
+
+    for r in rows:
+        counts, stats, areas = summaries.setdefault(int(r.block_idx), ({}, {}, {}))
+        if r.stat_name is None:
+            counts.setdefault(r.layer, {})[int(r.class_value)] = int(r.pixel_count)
+            if r.stat_value is not None:
+                areas.setdefault(r.layer, {})[int(r.class_value)] = r.stat_value
+        else:
+            stats.setdefault(r.layer, {})[r.stat_name] = r.stat_value
+    return summaries
+
+
+# Geometry helper queries (block and whole-forest) running at once across all
+# analyses, each holding its own pooled connection (the pool is
+# DB_POOL_SIZE + DB_MAX_OVERFLOW)
+_GEOMETRY_HELPER_SLOTS = asyncio.Semaphore(4)
+
+
+def _run_with_own_session(helper, wkt: str, snapshot: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a read-only analysis helper on its own session, inside the snapshot
+    exported by the caller's transaction (pg_export_snapshot) when given
+    """
+    session = SessionLocal()
+    try:
+        if snapshot is not None:
+            try:
+                session.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+                session.execute(text("SET TRANSACTION SNAPSHOT :snapshot"), {"snapshot": snapshot})
+            except Exception:
+                # The exporting transaction already ended (e.g. rolled back
+                # after an error); read the current data instead
+                logger.warning("Could not import snapshot %s", snapshot, exc_info=True)
+                session.rollback()
+        return helper(wkt, session)
+    finally:
+        session.close()
+
+
+async def _run_geometry_helper(helper, wkt: str, snapshot: Optional[str] = None) -> Dict[str, Any]:
+    """Run helper(wkt, session) on a worker thread, within _GEOMETRY_HELPER_SLOTS"""
+    async with _GEOMETRY_HELPER_SLOTS:
+        return await asyncio.to_thread(_run_with_own_session, helper, wkt, snapshot)
+
+
+async def analyze_block_geometry(
+    geojson_geometry: Union[Dict, str],
+    calculation_id: UUID,
+    db: Session,
+    options: Optional[Dict[str, bool]] = None,
+    raster_summary: Optional[Tuple[Dict, Dict, Dict]] = None
+) -> Dict[str, Any]:
     """
     Analyze a single block's geometry
 
     Args:
-        geojson_geometry: Block geometry in GeoJSON format
+        geojson_geometry: Block geometry in GeoJSON format (dict or serialized string)
         calculation_id: UUID of parent calculation (for context)
         db: Database session
         options: Dict of boolean flags to enable/disable specific analyses
+        raster_summary: This block's (value counts, stats, areas) from
+                        _fetch_block_raster_summaries; None to fetch it here
 
     Returns:
         Dict with analysis results for this block
@@ -294,21 +562,32 @@ async def analyze_block_geometry(geojson_geometry: Dict, calculation_id: UUID, d
         if analysis_name != 'run_raster_analysis' and not options.get('run_raster_analysis', True):
             return False
         return options.get(analysis_name, True)  # Default True for backward compatibility
-    import json
 
-    # Convert GeoJSON to WKT for PostGIS
-    geojson_str = json.dumps(geojson_geometry)
+    # Convert GeoJSON to WKT for PostGIS (callers may pass it already serialized)
+    if isinstance(geojson_geometry, str):
+        geojson_str = geojson_geometry
+    else:
+        geojson_str = orjson.dumps(geojson_geometry).decode()
 
     try:
-        # Create a temporary geometry from GeoJSON
+        # Parse the GeoJSON once; the WKT and the bounding box extent come
+        # from the same geometry
         geom_query = text("""
-            SELECT ST_AsText(ST_GeomFromGeoJSON(:geojson)) as wkt
+            WITH block AS (
+                SELECT ST_GeomFromGeoJSON(:geojson) as geom
+            )
+            SELECT
+                ST_AsText(geom) as wkt,
+                ST_YMax(geom) as north,
+                ST_YMin(geom) as south,
+                ST_XMax(geom) as east,
+                ST_XMin(geom) as west
+            FROM block
         """)
-        wkt_result = db.execute(geom_query, {"geojson": geojson_str}).first()
-        block_wkt = wkt_result.wkt
+        geom_result = db.execute(geom_query, {"geojson": geojson_str}).first()
+        block_wkt = geom_result.wkt
     except Exception as e:
-        print(f"Error converting GeoJSON to WKT: {e}")
-        print(f"GeoJSON string (first 500 chars): {geojson_str[:500]}")
+        logger.exception("Error converting GeoJSON to WKT (first 500 chars: %s)", geojson_str[:500])
         # CRITICAL: Rollback the failed transaction before raising
         db.rollback()
         raise ValueError(f"Invalid geometry format: {str(e)}")
@@ -318,274 +597,440 @@ async def analyze_block_geometry(geojson_geometry: Dict, calculation_id: UUID, d
     # Store WKT for future reanalysis
     block_results['wkt'] = block_wkt
 
-    # Calculate bounding box extent for this block
-    extent_query = text("""
-        SELECT
-            ST_YMax(ST_Envelope(ST_GeomFromText(:wkt, 4326))) as north,
-            ST_YMin(ST_Envelope(ST_GeomFromText(:wkt, 4326))) as south,
-            ST_XMax(ST_Envelope(ST_GeomFromText(:wkt, 4326))) as east,
-            ST_XMin(ST_Envelope(ST_GeomFromText(:wkt, 4326))) as west
-    """)
-    extent_result = db.execute(extent_query, {"wkt": block_wkt}).first()
-    if extent_result:
-        block_results["extent"] = {
-            "N": round(float(extent_result.north), 7),
-            "S": round(float(extent_result.south), 7),
-            "E": round(float(extent_result.east), 7),
-            "W": round(float(extent_result.west), 7)
-        }
-
-    # Run raster analyses conditionally based on options
-    # 1. DEM - Elevation
-    if should_run('run_elevation'):
-        dem_results = analyze_dem_geometry(block_wkt, db)
-        block_results.update(dem_results)
-
-    # 2. Slope
-    if should_run('run_slope'):
-        slope_results = analyze_slope_geometry(block_wkt, db)
-        block_results.update(slope_results)
-
-    # 3. Aspect
-    if should_run('run_aspect'):
-        aspect_results = analyze_aspect_geometry(block_wkt, db)
-        block_results.update(aspect_results)
-
-    # 4. Canopy Height
-    if should_run('run_canopy'):
-        canopy_results = analyze_canopy_height_geometry(block_wkt, db)
-        block_results.update(canopy_results)
-
-    # 5. AGB (Biomass)
-    if should_run('run_biomass'):
-        agb_results = analyze_agb_geometry(block_wkt, db)
-        block_results.update(agb_results)
-
-    # 6. Forest Health
-    if should_run('run_forest_health'):
-        health_results = analyze_forest_health_geometry(block_wkt, db)
-        block_results.update(health_results)
+    # Bounding box extent for this block
+    block_results["extent"] = {
+        "N": round(float(geom_result.north), 7),
+        "S": round(float(geom_result.south), 7),
+        "E": round(float(geom_result.east), 7),
+        "W": round(float(geom_result.west), 7)
+    }
 
-    # 7. Forest Type
-    if should_run('run_forest_type'):
-        forest_type_results = analyze_forest_type_geometry(block_wkt, db)
-        block_results.update(forest_type_results)
-
-        # 7.1 Potential Tree Species (based on forest type)
-        if forest_type_results.get('forest_type_percentages'):
-            species_results = analyze_potential_tree_species(
-                forest_type_results['forest_type_percentages'],
-                db
-            )
-            block_results.update(species_results)
+    # 1-13. Tile-based raster summaries (elevation, slope, aspect, canopy,
+    # biomass, forest health, forest type, land cover, loss/gain/fire,
+    # Hansen 2000, climate), computed for all blocks at once in
+    # analyze_forest_boundary; callers analyzing a single block (e.g.
+    # reanalysis) get this block's summary from the same query
+    summary_options = [
+        option for option, _, _, _ in _BLOCK_SUMMARY_LAYERS + _CLIMATE_LAYERS if should_run(option)
+    ]
+    if raster_summary is None and summary_options:
+        block_summaries = await asyncio.to_thread(
+            _fetch_block_raster_summaries, [geojson_str], summary_options, db
+        )
+        raster_summary = block_summaries.get(1)
+    counts, stats, areas = raster_summary or ({}, {}, {})
+    block_results.update(summarize_block_rasters(counts, stats, areas, summary_options))
+
+    # 7.1 Potential Tree Species (based on forest type), on a worker thread
+    # so the other blocks keep running; the thread gets its own session, as
+    # the blocks share db
+    if block_results.get('forest_type_percentages'):
+        species_results = await _run_geometry_helper(
+            analyze_potential_tree_species,
+            block_results['forest_type_percentages']
+        )
+        block_results.update(species_results)
 
-    # 7A. Historical Land Cover (1984 - Vector)
+    # 7A-21. The remaining block queries are independent reads: historical
+    # land cover, soil, location, geology, access, nearby features,
+    # physiography, ecoregion and NASA forest 2020.
+    # (helper, result used if the helper raises)
+    helpers = []
     if should_run('run_landcover_1984'):
-        landcover_1984_results = analyze_landcover_1984_geometry(block_wkt, db)
-        block_results.update(landcover_1984_results)
-
-    # 7B. Hansen 2000 Forest Classification (Raster)
-    if should_run('run_hansen2000'):
-        hansen2000_results = analyze_hansen2000_geometry(block_wkt, db)
-        block_results.update(hansen2000_results)
-
-    # 8. Land Cover (ESA WorldCover - Current)
-    if should_run('run_landcover'):
-        landcover_results = analyze_landcover_geometry(block_wkt, db)
-        block_results.update(landcover_results)
-
-    # 9. Forest Loss
-    if should_run('run_forest_loss'):
-        loss_results = analyze_forest_loss_geometry(block_wkt, db)
-        block_results.update(loss_results)
-
-    # 10. Forest Gain
-    if should_run('run_forest_gain'):
-        gain_results = analyze_forest_gain_geometry(block_wkt, db)
-        block_results.update(gain_results)
-
-    # 11. Fire Loss
-    if should_run('run_fire_loss'):
-        fire_results = analyze_fire_loss_geometry(block_wkt, db)
-        block_results.update(fire_results)
-
-    # 12. Temperature
-    if should_run('run_temperature'):
-        temp_results = analyze_temperature_geometry(block_wkt, db)
-        block_results.update(temp_results)
-
-    # 13. Precipitation
-    if should_run('run_precipitation'):
-        precip_results = analyze_precipitation_geometry(block_wkt, db)
-        block_results.update(precip_results)
-
-    # 14. Soil Texture
+        helpers.append((analyze_landcover_1984_geometry, {}))
     if should_run('run_soil'):
-        soil_results = analyze_soil_geometry(block_wkt, db)
-        block_results.update(soil_results)
-
-    # 15. Administrative Location (Province, District, Municipality, Ward, Watershed)
-    location_results = get_administrative_location(block_wkt, db)
-    block_results.update(location_results)
-
-    # 16. Geology Analysis
-    geology_results = analyze_geology_geometry(block_wkt, db)
-    block_results.update(geology_results)
-
-    # 17. Access Information
-    access_results = calculate_access_info(block_wkt, db)
-    block_results.update(access_results)
-
-    # 18. Nearby Features (within 100m, by direction)
-    print("  Calling analyze_nearby_features...", flush=True)
-    try:
-        nearby_results = analyze_nearby_features(block_wkt, db)
-        print(f"  analyze_nearby_features returned: {list(nearby_results.keys())}", flush=True)
-        print(f"  Features: N={nearby_results.get('features_north', 'MISSING')}, E={nearby_results.get('features_east', 'MISSING')}, S={nearby_results.get('features_south', 'MISSING')}, W={nearby_results.get('features_west', 'MISSING')}", flush=True)
-        block_results.update(nearby_results)
-        print(f"  After update, block_results has keys: {list(block_results.keys())}", flush=True)
-    except Exception as e:
-        print(f"  ERROR in analyze_nearby_features: {e}", flush=True)
-        import traceback
-        traceback.print_exc()
-        # Add empty features to avoid crashes
-        block_results.update({
+        helpers.append((analyze_soil_geometry, {}))
+    helpers += [
+        (get_administrative_location, {}),
+        (analyze_geology_geometry, {}),
+        (calculate_access_info, {}),
+        (analyze_nearby_features, {
             'features_north': None,
             'features_east': None,
             'features_south': None,
             'features_west': None
-        })
-
-    # 19. Physiography Analysis
-    print("  Analyzing physiography...", flush=True)
-    try:
-        physio_results = analyze_physiography_geometry(block_wkt, db)
-        block_results.update(physio_results)
-        print(f"  Physiography analysis complete: {list(physio_results.keys())}", flush=True)
-    except Exception as e:
-        print(f"  ERROR in physiography analysis: {e}", flush=True)
-        block_results.update({'physiography_percentages': None})
-
-    # 20. Ecoregion Analysis
-    print("  Analyzing ecoregion...", flush=True)
-    try:
-        ecoregion_results = analyze_ecoregion_geometry(block_wkt, db)
-        block_results.update(ecoregion_results)
-        print(f"  Ecoregion analysis complete: {list(ecoregion_results.keys())}", flush=True)
-    except Exception as e:
-        print(f"  ERROR in ecoregion analysis: {e}", flush=True)
-        block_results.update({'ecoregion_percentages': None})
-
-    # 21. NASA Forest 2020 Classification
-    print("  Analyzing NASA forest 2020...", flush=True)
-    try:
-        nasa_forest_results = analyze_nasa_forest_2020_geometry(block_wkt, db)
-        block_results.update(nasa_forest_results)
-        print(f"  NASA forest 2020 analysis complete: {list(nasa_forest_results.keys())}", flush=True)
-    except Exception as e:
-        print(f"  ERROR in NASA forest 2020 analysis: {e}", flush=True)
-        block_results.update({
+        }),
+        (analyze_physiography_geometry, {'physiography_percentages': None}),
+        (analyze_ecoregion_geometry, {'ecoregion_percentages': None}),
+        (analyze_nasa_forest_2020_geometry, {
             'nasa_forest_2020_percentages': None,
             'nasa_forest_2020_dominant': None
-        })
+        }),
+    ]
+
+    helper_results = await asyncio.gather(
+        *(_run_geometry_helper(helper, block_wkt) for helper, _ in helpers),
+        return_exceptions=True
+    )
+    for (helper, fallback), result in zip(helpers, helper_results):
+        if isinstance(result, Exception):
+            logger.error("Error in %s", helper.__name__, exc_info=result)
+            result = fallback
+        block_results.update(result)
 
     return block_results
 
 
-def calculate_area(calculation_id: UUID, db: Session) -> Dict[str, Any]:
+# Categorical raster layers summarised with ST_ValueCount:
+# (layer, raster table, pixel value filter)
+_VALUE_COUNT_LAYERS = [
+    ("slope", "rasters.slope", "(pvc).value BETWEEN 1 AND 4"),
+    ("aspect", "rasters.aspect", "(pvc).value BETWEEN 1 AND 8"),
+    ("canopy_height", "rasters.canopy_height", "(pvc).value BETWEEN 0 AND 50"),
+    ("forest_health", "rasters.nepal_forest_health", "(pvc).value BETWEEN 1 AND 5"),
+    ("forest_type", "rasters.forest_type", "(pvc).value BETWEEN 1 AND 26"),
+    ("landcover", "rasters.esa_world_cover", "(pvc).value > 0"),
+    ("forest_loss", "rasters.nepal_lossyear", "(pvc).value > 0"),
+    ("forest_gain", "rasters.nepal_gain", "(pvc).value = 1"),
+    ("fire_loss", "rasters.forest_loss_fire", "(pvc).value > 0"),
+]
+
+# Whole-boundary layers summarised with band 1 ST_SummaryStatsAgg: (layer,
+# raster table). DEM voids (-32768) are the band NoData value, so the
+# aggregate skips them.
+_SUMMARY_STATS_LAYERS = [
+    ("dem", "rasters.dem"),
+    ("agb", "rasters.agb_2022_nepal"),
+]
+
+
+def _raster_summary_query():
+    """All whole-boundary raster zonal statistics in one statement
+
+    The boundary is bound once as EWKB (:geom). Every row is (layer,
+    class_value, pixel_count, stat_name, stat_value) with either the
+    value-count pair or the stat pair filled in (value-count rows of
+    _AREA_LAYERS also carry their area in sqm as stat_value). Tables known to
+    be missing are left out, so one unloaded raster does not fail the rest;
+    None if every table is missing.
     """
-    Calculate area using appropriate UTM projection
-
-    Returns area in both square meters and hectares
+    branches = []
+    for layer, table in _SUMMARY_STATS_LAYERS:
+        if _is_missing(table):
+            continue
+        branches.append(f"""
+        SELECT '{layer}'::text AS layer, NULL::float8 AS class_value, NULL::bigint AS pixel_count,
+               v.name::text AS stat_name, v.value::float8 AS stat_value
+        FROM (
+            SELECT ST_SummaryStatsAgg(ST_Clip(r.rast, 1, b.geom, true), 1, true) AS stats
+            FROM {table} r, boundary b
+            WHERE ST_Intersects(r.rast, b.geom)
+        ) AS s,
+        LATERAL (VALUES ('min', (s.stats).min), ('max', (s.stats).max),
+                        ('mean', (s.stats).mean), ('sum', (s.stats).sum)) AS v(name, value)""")
+    for _, name, table, value_filter in _CLIMATE_LAYERS:
+        if _is_missing(table):
+            continue
+        branches.append(f"""
+        SELECT 'climate'::text AS layer, NULL::float8 AS class_value, NULL::bigint AS pixel_count,
+               '{name}'::text AS stat_name,
+               (SUM((pvc).value * (pvc).count) / NULLIF(SUM((pvc).count), 0))::float8 AS stat_value
+        FROM (
+            SELECT ST_ValueCount(ST_Clip(r.rast, b.geom)) AS pvc
+            FROM {table} r, boundary b
+            WHERE ST_Intersects(r.rast, b.geom)
+        ) AS {name}_counts
+        WHERE {value_filter}""")
+    for layer, table, value_filter in _VALUE_COUNT_LAYERS:
+        if _is_missing(table):
+            continue
+        pixel_area = _PIXEL_AREA_SQL if layer in _AREA_LAYERS else "NULL::float8"
+        branches.append(f"""
+        SELECT '{layer}'::text AS layer, (pvc).value::float8 AS class_value,
+               SUM((pvc).count)::bigint AS pixel_count, NULL::text AS stat_name,
+               SUM((pvc).count * pixel_m2)::float8 AS stat_value
+        FROM (
+            SELECT ST_ValueCount(ST_Clip(r.rast, b.geom)) AS pvc,
+                   {pixel_area} AS pixel_m2
+            FROM {table} r, boundary b
+            WHERE ST_Intersects(r.rast, b.geom)
+        ) AS {layer}_counts
+        WHERE (pvc).value IS NOT NULL AND {value_filter}
+        GROUP BY (pvc).value""")
+
+    if not branches:
+        return None
+    return text("""
+        WITH boundary AS (
+            SELECT ST_GeomFromEWKB(:geom) AS geom
+        )
+    """ + "\n        UNION ALL".join(branches))
+
+
+# Transaction-local planner settings for the raster scans: ST_Clip,
+# ST_ValueCount and ST_SummaryStats are PARALLEL SAFE, so tile aggregation can
+# use parallel workers, and bitmap heap scans can prefetch tiles. The tile
+# pixels live in TOAST, so a raster table's heap and index stay far below
+# the default 8MB / 512kB minimum sizes for a parallel scan; without lowering
+# them the planner never plans workers for these tables.
+RASTER_SESSION_SETTINGS = text("""
+    SELECT
+        set_config('max_parallel_workers_per_gather', '4', true),
+        set_config('parallel_setup_cost', '10', true),
+        set_config('min_parallel_table_scan_size', '0', true),
+        set_config('min_parallel_index_scan_size', '0', true),
+        set_config('effective_io_concurrency', '200', true),
+        set_config('work_mem', '256MB', true)
+""")
+
+
+def _fetch_raster_summary(geom_ewkb: bytes, db: Session) -> list:
+    """Run _raster_summary_query with the raster planner settings applied"""
+    query = _raster_summary_query()
+    if query is None:
+        return []
+    db.execute(RASTER_SESSION_SETTINGS)
+    return db.execute(query, {"geom": geom_ewkb}).fetchall()
+
+
+# Raster tables behind each layer returned by _raster_summary_query, one
+# raster_stats_cache row per layer
+RASTER_SUMMARY_TABLES = {
+    **{layer: {table} for layer, table in _SUMMARY_STATS_LAYERS},
+    "climate": {table for _, _, table, _ in _CLIMATE_LAYERS},
+    **{layer: {table} for layer, table, _ in _VALUE_COUNT_LAYERS},
+}
+RASTER_SUMMARY_LAYERS = list(RASTER_SUMMARY_TABLES)
+
+
+def _load_raster_summary(geom_digest: bytes, db: Session) -> Optional[Tuple[Dict, Dict, Dict]]:
     """
-    # Get geometry centroid to determine UTM zone
-    query = text("""
-        SELECT
-            ST_X(ST_Centroid(boundary_geom)) as lon,
-            ST_Y(ST_Centroid(boundary_geom)) as lat
-        FROM public.calculations
-        WHERE id = :calc_id
-    """)
-
-    result = db.execute(query, {"calc_id": str(calculation_id)}).first()
-    lon = result.lon
-
-    # Determine UTM zone (32644 for western Nepal, 32645 for eastern)
-    utm_srid = 32645 if lon > 84 else 32644
-
-    # Calculate area in UTM projection
-    area_query = text(f"""
-        SELECT
-            ST_Area(ST_Transform(boundary_geom, {utm_srid})) as area_sqm,
-            ST_Area(ST_Transform(boundary_geom, {utm_srid})) / 10000.0 as area_hectares
-        FROM public.calculations
-        WHERE id = :calc_id
-    """)
-
-    area_result = db.execute(area_query, {"calc_id": str(calculation_id)}).first()
+    Return the cached (counts, stats, areas) of every RASTER_SUMMARY_LAYERS layer for
+    the boundary digest, or None unless all of them are cached
+    """
+    rows = db.execute(
+        select(RasterStatsCache.raster_name, RasterStatsCache.stats)
+        .where(RasterStatsCache.geom_hash == geom_digest)
+    ).all()
+    cached = {r.raster_name: r.stats for r in rows}
+    if any(layer not in cached for layer in RASTER_SUMMARY_LAYERS):
+        return None
 
-    return {
-        "area_sqm": round(area_result.area_sqm, 2),
-        "area_hectares": round(area_result.area_hectares, 4),
-        "utm_zone": utm_srid
-    }
+    counts: Dict[str, Dict[int, int]] = {}
+    stats: Dict[str, Dict[str, Optional[float]]] = {}
+    areas: Dict[str, Dict[int, float]] = {}
+    for layer in RASTER_SUMMARY_LAYERS:
+        if cached[layer].get("counts"):
+            counts[layer] = {int(k): v for k, v in cached[layer]["counts"].items()}
+        if cached[layer].get("stats"):
+            stats[layer] = cached[layer]["stats"]
+        if cached[layer].get("areas"):
+            areas[layer] = {int(k): v for k, v in cached[layer]["areas"].items()}
+    return counts, stats, areas
 
 
-async def analyze_rasters(calculation_id: UUID, db: Session) -> Dict[str, Any]:
+def _store_raster_summary(geom_digest: bytes, layers: list, counts: Dict, stats: Dict, areas: Dict) -> None:
+    """
+    Upsert one raster_stats_cache row per layer on a separate session, since
+    the whole-forest analysis reads in a read-only transaction
     """
-    Analyze all 16 raster datasets from rasters schema
+    rows = [
+        {
+            "geom_hash": geom_digest,
+            "raster_name": layer,
+            "stats": {
+                "counts": {str(k): v for k, v in counts.get(layer, {}).items()},
+                "stats": {
+                    k: v if v is None or math.isfinite(v) else None
+                    for k, v in stats.get(layer, {}).items()
+                },
+                "areas": {str(k): v for k, v in areas.get(layer, {}).items()},
+            },
+        }
+        for layer in layers
+    ]
+    if not rows:
+        return
+    session = SessionLocal()
+    try:
+        stmt = insert(RasterStatsCache).values(rows)
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=[RasterStatsCache.geom_hash, RasterStatsCache.raster_name],
+            set_={"stats": stmt.excluded.stats, "created_at": func.now()}
+        ))
+        session.commit()
+    except Exception:
+        logger.exception("Error caching raster statistics")
+        session.rollback()
+    finally:
+        session.close()
+
+
+SLOPE_CLASSES = {1: "gentle", 2: "moderate", 3: "steep", 4: "very_steep"}
+
+ASPECT_DIRECTIONS = {1: "N", 2: "NE", 3: "E", 4: "SE", 5: "S", 6: "SW", 7: "W", 8: "NW"}
+
+FOREST_HEALTH_CLASSES = {1: "stressed", 2: "poor", 3: "moderate", 4: "healthy", 5: "excellent"}
+
+# FRTC forest type codes (26 = Data Not Available)
+FOREST_TYPE_CLASSES = {
+    1: "Shorea robusta",
+    2: "Tropical Mixed Broadleaved",
+    3: "Subtropical Mixed Broadleaved",
+    4: "Shorea robusta-Mixed Broadleaved",
+    5: "Abies Mixed",
+    6: "Upper Temperate Coniferous",
+    7: "Cool Temperate Mixed Broadleaved",
+    8: "Castanopsis Lower Temperate Mixed Broadleaved",
+    9: "Pinus roxburghii",
+    10: "Alnus",
+    11: "Schima",
+    12: "Pinus roxburghii-Mixed Broadleaved",
+    13: "Pinus wallichiana",
+    14: "Warm Temperate Mixed Broadleaved",
+    15: "Upper Temperate Quercus",
+    16: "Rhododendron arboreum",
+    17: "Temperate Rhododendron Mixed Broadleaved",
+    18: "Dalbergia sissoo-Senegalia catechu",
+    19: "Terminalia-Tropical Mixed Broadleaved",
+    20: "Temperate Mixed Broadleaved",
+    21: "Tropical Deciduous Indigenous Riverine",
+    22: "Tropical Riverine",
+    23: "Lower Temperate Mixed robusta",
+    24: "Pinus roxburghii-Shorea robusta",
+    25: "Lower Temperate Pinus roxburghii-Quercus",
+    26: "Data Not Available"
+}
+
+# Forest type labels used for the per-block results
+BLOCK_FOREST_TYPE_CLASSES = {
+    1: "Shorea robusta", 2: "Alnus nepalensis", 3: "Schima-Castanopsis",
+    4: "Quercus semecarpifolia", 5: "Larix/Abies spectabilis",
+    6: "Pinus wallichiana-Tsuga dumosa", 7: "Plantation (Pinus-Eucalyptus)",
+    8: "Ficus-Other Tropical Riverine", 9: "Tropical Mixed Broadleaved",
+    10: "Quercus-Pinus", 11: "Abies spectabilis",
+    12: "Pinus roxburghii-Mixed Broadleaved", 13: "Pinus wallichiana",
+    14: "Warm Temperate Mixed Broadleaved", 15: "Upper Temperate Quercus",
+    16: "Rhododendron arboreum", 17: "Temperate Rhododendron Mixed Broadleaved",
+    18: "Dalbergia sissoo-Senegalia catechu", 19: "Terminalia-Tropical Mixed Broadleaved",
+    20: "Temperate Mixed Broadleaved", 21: "Tropical Deciduous Indigenous Riverine",
+    22: "Tropical Riverine", 23: "Lower Temperate Mixed robusta",
+    24: "Pinus roxburghii-Shorea robusta", 25: "Lower Temperate Pinus roxburghii-Quercus",
+    26: "Data Not Available"
+}
+
+# ESA WorldCover v200 codes
+LANDCOVER_CLASSES = {
+    10: "Tree cover",
+    20: "Shrubland",
+    30: "Grassland",
+    40: "Cropland",
+    50: "Built-up",
+    60: "Bare/sparse vegetation",
+    70: "Snow and ice",
+    80: "Permanent water bodies",
+    90: "Herbaceous wetland",
+    95: "Mangroves",
+    100: "Moss and lichen"
+}
+
+# Hansen 2000 classified forest codes
+HANSEN2000_CLASSES = {
+    0: "Non forest",
+    1: "Bush/Shrub",
+    2: "Poor forest",
+    3: "Moderate forest",
+    4: "Good forest"
+}
+
+
+async def analyze_rasters(geom_ewkb: bytes, db: Session, geom_digest: Optional[bytes] = None) -> Dict[str, Any]:
+    """
+    Analyze the raster datasets from rasters schema
 
-    Performs zonal statistics for each raster layer
+    Runs every zonal statistic for the boundary (EWKB, SRID 4326) in a single
+    _raster_summary_query round trip, then formats each layer from the returned rows.
+    With geom_digest (SHA-256 of the normalized boundary) the raw statistics are
+    read from / written to raster_stats_cache instead of re-reading the rasters.
     """
+    counts: Dict[str, Dict[int, int]] = {}
+    stats: Dict[str, Dict[str, Optional[float]]] = {}
+    areas: Dict[str, Dict[int, float]] = {}
+
+    cached = _load_raster_summary(geom_digest, db) if geom_digest is not None else None
+    if cached is not None:
+        logger.info("Raster statistics loaded from cache")
+        counts, stats, areas = cached
+    else:
+        try:
+            # Only layers whose tables were all queried are cached, so a raster
+            # loaded later is picked up instead of served as empty
+            missing = {
+                table for tables in RASTER_SUMMARY_TABLES.values() for table in tables
+                if _is_missing(table)
+            }
+            complete_layers = [
+                layer for layer, tables in RASTER_SUMMARY_TABLES.items()
+                if not tables & missing
+            ]
+            if missing:
+                # Partial statistics must not reach calculation_cache either
+                _note_analysis_error(LookupError("Raster tables missing: %s" % sorted(missing)))
+            # The query is the slow part of the analysis; run it on a worker thread
+            # so the event loop keeps serving other requests meanwhile
+            rows = await asyncio.to_thread(_fetch_raster_summary, geom_ewkb, db)
+            for r in rows:
+                if r.stat_name is None:
+                    counts.setdefault(r.layer, {})[int(r.class_value)] = int(r.pixel_count)
+                    if r.stat_value is not None:
+                        areas.setdefault(r.layer, {})[int(r.class_value)] = r.stat_value
+                else:
+                    stats.setdefault(r.layer, {})[r.stat_name] = r.stat_value
+            if geom_digest is not None:
+                await asyncio.to_thread(
+                    _store_raster_summary, geom_digest, complete_layers, counts, stats, areas
+                )
+        except Exception as e:
+            _note_analysis_error(e)
+            _note_missing_table(e)
+            logger.exception("Error analyzing rasters")
+            db.rollback()
+
     results = {}
 
     # 1. DEM - Elevation statistics
-    dem_results = analyze_dem(calculation_id, db)
-    results.update(dem_results)
+    results.update(summarize_dem(stats.get("dem", {})))
 
     # 2. Slope - Classification percentages
-    slope_results = analyze_slope(calculation_id, db)
-    results.update(slope_results)
+    results.update(summarize_slope(counts.get("slope", {})))
 
     # 3. Aspect - Directional percentages
-    aspect_results = analyze_aspect(calculation_id, db)
-    results.update(aspect_results)
+    results.update(summarize_aspect(counts.get("aspect", {})))
 
     # 4. Canopy Height - Forest structure
-    canopy_results = analyze_canopy_height(calculation_id, db)
-    results.update(canopy_results)
+    results.update(summarize_canopy_height(counts.get("canopy_height", {})))
 
     # 5. Above-ground Biomass (AGB)
-    agb_results = analyze_agb(calculation_id, db)
-    results.update(agb_results)
+    results.update(summarize_agb(stats.get("agb", {})))
 
     # 6. Forest Health
-    health_results = analyze_forest_health(calculation_id, db)
-    results.update(health_results)
+    results.update(summarize_forest_health(counts.get("forest_health", {})))
 
     # 7. Forest Type
-    forest_type_results = analyze_forest_type(calculation_id, db)
+    forest_type_results = summarize_forest_type(counts.get("forest_type", {}))
     results.update(forest_type_results)
 
     # 7.1 Potential Tree Species (based on forest type)
     if forest_type_results.get('forest_type_percentages'):
-        species_results = analyze_potential_tree_species(
+        species_results = await asyncio.to_thread(
+            analyze_potential_tree_species,
             forest_type_results['forest_type_percentages'],
             db
         )
         results.update(species_results)
 
     # 8. ESA WorldCover - Land cover
-    esa_results = analyze_esa_worldcover(calculation_id, db)
-    results.update(esa_results)
+    results.update(summarize_esa_worldcover(counts.get("landcover", {})))
 
     # 9. Climate - Temperature and Precipitation
-    climate_results = analyze_climate(calculation_id, db)
-    results.update(climate_results)
+    results.update(summarize_climate(stats.get("climate", {})))
 
     # 10. Forest Loss and Gain
-    change_results = analyze_forest_change(calculation_id, db)
-    results.update(change_results)
+    results.update(summarize_forest_change(
+        areas.get("forest_loss", {}),
+        areas.get("forest_gain", {}),
+        areas.get("fire_loss", {})
+    ))
 
     # 11. Soil properties (temporarily disabled - complex multi-band query)
     # soil_results = analyze_soil(calculation_id, db)
@@ -595,51 +1040,44 @@ async def analyze_rasters(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     return results
 
 
-def analyze_dem(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze DEM raster - min, max, mean elevation
+def _class_percentages(counts: Dict[int, int], labels: Dict[int, str]) -> Dict[str, float]:
+    """Percentage of pixels per labelled class, rounded to 2 decimals"""
+    total_pixels = sum(counts.values())
+    if total_pixels <= 0:
+        return {}
+    return {
+        labels[code]: round(pixel_count / total_pixels * 100, 2)
+        for code, pixel_count in sorted(counts.items(), key=lambda item: -item[1])
+        if code in labels
+    }
 
-    DEM NoData value is -32768 but not registered in PostGIS metadata.
-    We must explicitly exclude it by filtering pixel values.
-    """
-    try:
-        query = text("""
-            WITH clipped_raster AS (
-                SELECT ST_Clip(rast, boundary_geom) as rast
-                FROM rasters.dem, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-                LIMIT 1
-            ),
-            pixel_values AS (
-                SELECT (ST_PixelAsPolygons(rast)).val as elevation
-                FROM clipped_raster
-            )
-            SELECT
-                MIN(elevation) as elevation_min,
-                MAX(elevation) as elevation_max,
-                AVG(elevation) as elevation_mean
-            FROM pixel_values
-            WHERE elevation > -32000  -- Exclude NoData values (-32768)
-              AND elevation >= 0       -- Nepal minimum elevation
-              AND elevation <= 9000    -- Nepal maximum elevation
-        """)
 
-        result = db.execute(query, {"calc_id": str(calculation_id)}).first()
+def _dominant(percentages: Dict[str, float]) -> Optional[str]:
+    """Class with the largest share (first one wins on ties)"""
+    if not percentages:
+        return None
+    return max(percentages, key=percentages.get)
+
+
+def _rounded(value: Optional[float], digits: int) -> Optional[float]:
+    """Round value, keeping None"""
+    return round(value, digits) if value is not None else None
 
-        if result and result.elevation_mean is not None:
-            return {
-                "elevation_min_m": round(result.elevation_min, 1) if result.elevation_min else None,
-                "elevation_max_m": round(result.elevation_max, 1) if result.elevation_max else None,
-                "elevation_mean_m": round(result.elevation_mean, 1) if result.elevation_mean else None,
-            }
-    except Exception as e:
-        print(f"Error analyzing DEM: {e}")
 
-    return {"elevation_min_m": None, "elevation_max_m": None, "elevation_mean_m": None}
+def summarize_dem(dem_stats: Dict[str, Optional[float]]) -> Dict[str, Any]:
+    """Elevation min, max, mean (m) from the DEM stats"""
+    if dem_stats.get("mean") is None:
+        return {"elevation_min_m": None, "elevation_max_m": None, "elevation_mean_m": None}
+
+    return {
+        "elevation_min_m": _rounded(dem_stats.get("min"), 1),
+        "elevation_max_m": _rounded(dem_stats.get("max"), 1),
+        "elevation_mean_m": _rounded(dem_stats["mean"], 1),
+    }
 
 
-def analyze_slope(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze slope raster - categorical codes (0-4)
+def summarize_slope(counts: Dict[int, int]) -> Dict[str, Any]:
+    """Slope class percentages from categorical codes (1-4)
 
     Slope classes from raster:
     0 = No data / Water (excluded from analysis)
@@ -648,64 +1086,15 @@ def analyze_slope(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     3 = 20-30° (Steep)
     4 = >30° (Very Steep)
     """
-    try:
-        # Mapping from raster categorical codes to class names
-        slope_map = {
-            1: "gentle",
-            2: "moderate",
-            3: "steep",
-            4: "very_steep"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as slope_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.slope, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL
-              AND (pvc).value > 0
-              AND (pvc).value <= 4
-            GROUP BY slope_code
-        """)
-
-        results = db.execute(query, {"calc_id": str(calculation_id)}).fetchall()
-
-        if not results:
-            return {"slope_dominant_class": None, "slope_percentages": {}}
-
-        total_pixels = sum(r.pixel_count for r in results)
-        slope_percentages = {}
-        dominant_class = None
-        max_percentage = 0
-
-        for r in results:
-            code = int(r.slope_code)
-            if code in slope_map:
-                percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-                class_name = slope_map[code]
-                slope_percentages[class_name] = round(percentage, 2)
-
-                if percentage > max_percentage:
-                    max_percentage = percentage
-                    dominant_class = class_name
-
-        return {
-            "slope_dominant_class": dominant_class,
-            "slope_percentages": slope_percentages
-        }
-    except Exception as e:
-        print(f"Error analyzing slope: {e}")
-
-    return {"slope_dominant_class": None, "slope_percentages": {}}
+    percentages = _class_percentages(counts, SLOPE_CLASSES)
+    return {
+        "slope_dominant_class": _dominant(percentages),
+        "slope_percentages": percentages
+    }
 
 
-def analyze_aspect(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze aspect raster - categorical codes (1-8)
+def summarize_aspect(counts: Dict[int, int]) -> Dict[str, Any]:
+    """Aspect direction percentages from categorical codes (1-8)
 
     Aspect classes from raster:
     0 = No data (excluded from analysis)
@@ -718,67 +1107,15 @@ def analyze_aspect(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     7 = W (247.5° - 292.5°)
     8 = NW (292.5° - 337.5°)
     """
-    try:
-        # Mapping from raster categorical codes to direction names
-        aspect_map = {
-            1: "N",
-            2: "NE",
-            3: "E",
-            4: "SE",
-            5: "S",
-            6: "SW",
-            7: "W",
-            8: "NW"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as aspect_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.aspect, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 8
-            GROUP BY aspect_code
-        """)
-
-        results = db.execute(query, {"calc_id": str(calculation_id)}).fetchall()
-
-        if not results:
-            return {"aspect_dominant": None, "aspect_percentages": {}}
-
-        total_pixels = sum(r.pixel_count for r in results)
-        aspect_percentages = {}
-        dominant_aspect = None
-        max_percentage = 0
-
-        for r in results:
-            code = int(r.aspect_code)
-            if code in aspect_map:
-                percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-                direction = aspect_map[code]
-                aspect_percentages[direction] = round(percentage, 2)
-
-                # Track dominant aspect
-                if percentage > max_percentage:
-                    max_percentage = percentage
-                    dominant_aspect = direction
-
-        return {
-            "aspect_dominant": dominant_aspect,
-            "aspect_percentages": aspect_percentages
-        }
-    except Exception as e:
-        print(f"Error analyzing aspect: {e}")
-
-    return {"aspect_dominant": None, "aspect_percentages": {}}
+    percentages = _class_percentages(counts, ASPECT_DIRECTIONS)
+    return {
+        "aspect_dominant": _dominant(percentages),
+        "aspect_percentages": percentages
+    }
 
 
-def analyze_canopy_height(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze canopy height raster - actual height values in meters
+def summarize_canopy_height(counts: Dict[int, int]) -> Dict[str, Any]:
+    """Canopy structure classes and mean height from height values in meters
 
     Canopy height raster contains height values 0-41m:
     0m = Non-forest (agricultural land, open areas, water, etc.)
@@ -786,100 +1123,57 @@ def analyze_canopy_height(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     6-15m = Pole sized forest
     >15m = High forest
     """
-    try:
-        query = text("""
-            SELECT
-                CASE
-                    WHEN (pvc).value = 0 THEN 'non_forest'
-                    WHEN (pvc).value > 0 AND (pvc).value <= 5 THEN 'bush_regenerated'
-                    WHEN (pvc).value > 5 AND (pvc).value <= 15 THEN 'pole_trees'
-                    WHEN (pvc).value > 15 THEN 'high_forest'
-                END as canopy_class,
-                SUM((pvc).count) as pixel_count,
-                AVG((pvc).value) as avg_height
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.canopy_height, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL
-              AND (pvc).value >= 0
-              AND (pvc).value <= 50
-            GROUP BY canopy_class
-        """)
-
-        results = db.execute(query, {"calc_id": str(calculation_id)}).fetchall()
-
-        if not results:
-            return {"canopy_dominant_class": None, "canopy_percentages": {}, "canopy_mean_m": None}
-
-        total_pixels = sum(r.pixel_count for r in results)
-        canopy_percentages = {}
-        dominant_class = None
-        max_percentage = 0
-
-        for r in results:
-            class_name = r.canopy_class
-            percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-            canopy_percentages[class_name] = round(percentage, 2)
-
-            if percentage > max_percentage:
-                max_percentage = percentage
-                dominant_class = class_name
-
-        # Calculate weighted mean height (including all pixels)
-        total_weighted_height = sum(r.avg_height * r.pixel_count for r in results)
-        canopy_mean_m = round(total_weighted_height / total_pixels, 1) if total_pixels > 0 else None
+    total_pixels = sum(counts.values())
+    if total_pixels <= 0:
+        return {"canopy_dominant_class": None, "canopy_percentages": {}, "canopy_mean_m": None}
+
+    class_pixels: Dict[str, int] = {}
+    for height, pixel_count in counts.items():
+        if height == 0:
+            class_name = "non_forest"
+        elif height <= 5:
+            class_name = "bush_regenerated"
+        elif height <= 15:
+            class_name = "pole_trees"
+        else:
+            class_name = "high_forest"
+        class_pixels[class_name] = class_pixels.get(class_name, 0) + pixel_count
 
-        return {
-            "canopy_dominant_class": dominant_class,
-            "canopy_percentages": canopy_percentages,
-            "canopy_mean_m": canopy_mean_m
-        }
-    except Exception as e:
-        print(f"Error analyzing canopy height: {e}")
+    canopy_percentages = {
+        class_name: round(pixel_count / total_pixels * 100, 2)
+        for class_name, pixel_count in class_pixels.items()
+    }
 
-    return {"canopy_dominant_class": None, "canopy_percentages": {}, "canopy_mean_m": None}
+    # Pixel-weighted mean height (including non-forest pixels)
+    canopy_mean_m = round(sum(h * n for h, n in counts.items()) / total_pixels, 1)
 
+    return {
+        "canopy_dominant_class": _dominant(canopy_percentages),
+        "canopy_percentages": canopy_percentages,
+        "canopy_mean_m": canopy_mean_m
+    }
 
-def analyze_agb(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze above-ground biomass"""
-    try:
-        query = text("""
-            SELECT
-                (stats).mean as agb_mean,
-                (stats).sum as agb_total
-            FROM (
-                SELECT ST_SummaryStats(
-                    ST_Clip(rast, 1, boundary_geom)
-                ) as stats
-                FROM rasters.agb_2022_nepal, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-                LIMIT 1
-            ) as subquery
-        """)
 
-        result = db.execute(query, {"calc_id": str(calculation_id)}).first()
+def summarize_agb(agb_stats: Dict[str, Optional[float]]) -> Dict[str, Any]:
+    """Above-ground biomass mean/total and carbon stock"""
+    agb_mean = agb_stats.get("mean")
+    agb_total = agb_stats.get("sum")
 
-        if result and result.agb_mean and result.agb_mean > 0:
-            # Convert AGB to carbon (carbon is approximately 50% of AGB)
-            carbon_stock = result.agb_total * 0.5 if result.agb_total and result.agb_total > 0 else 0
+    if not agb_mean or agb_mean <= 0:
+        return {"agb_mean_mg_ha": None, "agb_total_mg": None, "carbon_stock_mg": None}
 
-            return {
-                "agb_mean_mg_ha": round(result.agb_mean, 2) if result.agb_mean > 0 else 0,
-                "agb_total_mg": round(result.agb_total, 2) if result.agb_total and result.agb_total > 0 else 0,
-                "carbon_stock_mg": round(carbon_stock, 2) if carbon_stock > 0 else 0
-            }
-    except Exception as e:
-        print(f"Error analyzing AGB: {e}")
+    # Convert AGB to carbon (carbon is approximately 50% of AGB)
+    carbon_stock = agb_total * 0.5 if agb_total and agb_total > 0 else 0
 
-    return {"agb_mean_mg_ha": None, "agb_total_mg": None, "carbon_stock_mg": None}
+    return {
+        "agb_mean_mg_ha": round(agb_mean, 2),
+        "agb_total_mg": round(agb_total, 2) if agb_total and agb_total > 0 else 0,
+        "carbon_stock_mg": round(carbon_stock, 2) if carbon_stock > 0 else 0
+    }
 
 
-def analyze_forest_health(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze forest health classes - categorical codes (1-5)
+def summarize_forest_health(counts: Dict[int, int]) -> Dict[str, Any]:
+    """Forest health class percentages from categorical codes (1-5)
 
     Forest health classes (Sentinel-2 NDVI):
     1 = Stressed (NDVI < 0.2)
@@ -888,420 +1182,146 @@ def analyze_forest_health(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     4 = Healthy (NDVI 0.6 - 0.8)
     5 = Excellent (NDVI > 0.8)
     """
-    try:
-        # Correct mapping from table comments
-        health_labels = {
-            1: "stressed",
-            2: "poor",
-            3: "moderate",
-            4: "healthy",
-            5: "excellent"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as health_class,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.nepal_forest_health, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 5
-            GROUP BY health_class
-        """)
-
-        results = db.execute(query, {"calc_id": str(calculation_id)}).fetchall()
-
-        if not results:
-            return {"forest_health_dominant": None, "forest_health_percentages": {}}
-
-        total_pixels = sum(r.pixel_count for r in results)
-        health_percentages = {}
-        dominant_class = None
-        max_percentage = 0
-
-        for r in results:
-            percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-            class_label = health_labels.get(int(r.health_class), "unknown")
-            health_percentages[class_label] = round(percentage, 2)
-
-            if percentage > max_percentage:
-                max_percentage = percentage
-                dominant_class = class_label
-
-        return {
-            "forest_health_dominant": dominant_class,
-            "forest_health_percentages": health_percentages
-        }
-    except Exception as e:
-        print(f"Error analyzing forest health: {e}")
-
-    return {"forest_health_dominant": None, "forest_health_percentages": {}}
-
-
-def analyze_forest_type(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze forest type distribution - categorical codes (1-26)
-
-    Forest type classes (FRTC, Kathmandu):
-    1 = Shorea robusta Forest
-    2 = Tropical Mixed Broadleaved Forest
-    3 = Subtropical Mixed Broadleaved Forest
-    ... (26 total classes)
-    26 = Data Not Available
-    """
-    try:
-        # Mapping from codes to forest type names
-        forest_type_map = {
-            1: "Shorea robusta",
-            2: "Tropical Mixed Broadleaved",
-            3: "Subtropical Mixed Broadleaved",
-            4: "Shorea robusta-Mixed Broadleaved",
-            5: "Abies Mixed",
-            6: "Upper Temperate Coniferous",
-            7: "Cool Temperate Mixed Broadleaved",
-            8: "Castanopsis Lower Temperate Mixed Broadleaved",
-            9: "Pinus roxburghii",
-            10: "Alnus",
-            11: "Schima",
-            12: "Pinus roxburghii-Mixed Broadleaved",
-            13: "Pinus wallichiana",
-            14: "Warm Temperate Mixed Broadleaved",
-            15: "Upper Temperate Quercus",
-            16: "Rhododendron arboreum",
-            17: "Temperate Rhododendron Mixed Broadleaved",
-            18: "Dalbergia sissoo-Senegalia catechu",
-            19: "Terminalia-Tropical Mixed Broadleaved",
-            20: "Temperate Mixed Broadleaved",
-            21: "Tropical Deciduous Indigenous Riverine",
-            22: "Tropical Riverine",
-            23: "Lower Temperate Mixed robusta",
-            24: "Pinus roxburghii-Shorea robusta",
-            25: "Lower Temperate Pinus roxburghii-Quercus",
-            26: "Data Not Available"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as forest_type_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.forest_type, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 26
-            GROUP BY forest_type_code
-            ORDER BY pixel_count DESC
-        """)
-
-        results = db.execute(query, {"calc_id": str(calculation_id)}).fetchall()
-
-        if not results:
-            return {"forest_type_dominant": None, "forest_type_percentages": {}}
+    percentages = _class_percentages(counts, FOREST_HEALTH_CLASSES)
+    return {
+        "forest_health_dominant": _dominant(percentages),
+        "forest_health_percentages": percentages
+    }
 
-        total_pixels = sum(r.pixel_count for r in results)
-        forest_type_percentages = {}
-        dominant_type = None
-        max_percentage = 0
 
-        for r in results:
-            code = int(r.forest_type_code)
-            if code in forest_type_map:
-                percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-                type_name = forest_type_map[code]
-                forest_type_percentages[type_name] = round(percentage, 2)
-
-                # Find dominant (excluding "Data Not Available" if possible)
-                if code != 26 and percentage > max_percentage:
-                    max_percentage = percentage
-                    dominant_type = type_name
-                elif code == 26 and dominant_type is None:
-                    dominant_type = type_name
+def summarize_forest_type(
+    counts: Dict[int, int],
+    labels: Dict[int, str] = FOREST_TYPE_CLASSES
+) -> Dict[str, Any]:
+    """Forest type percentages from categorical codes (1-26)
 
-        return {
-            "forest_type_dominant": dominant_type,
-            "forest_type_percentages": forest_type_percentages
-        }
-    except Exception as e:
-        print(f"Error analyzing forest type: {e}")
-
-    return {"forest_type_dominant": None, "forest_type_percentages": {}}
-
-
-def analyze_esa_worldcover(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze ESA WorldCover land cover - categorical codes
-
-    Land cover classes (ESA/WorldCover/v200):
-    10 = Tree cover
-    20 = Shrubland
-    30 = Grassland
-    40 = Cropland
-    50 = Built-up
-    60 = Bare/sparse vegetation
-    70 = Snow and ice
-    80 = Permanent water bodies
-    90 = Herbaceous wetland
-    95 = Mangroves
-    100 = Moss and lichen
+    The dominant type ignores "Data Not Available" (26) unless it is the
+    only class present.
     """
-    try:
-        # Mapping from codes to land cover names
-        landcover_map = {
-            10: "Tree cover",
-            20: "Shrubland",
-            30: "Grassland",
-            40: "Cropland",
-            50: "Built-up",
-            60: "Bare/sparse vegetation",
-            70: "Snow and ice",
-            80: "Permanent water bodies",
-            90: "Herbaceous wetland",
-            95: "Mangroves",
-            100: "Moss and lichen"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as landcover_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.esa_world_cover, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value > 0
-            GROUP BY landcover_code
-            ORDER BY pixel_count DESC
-        """)
-
-        results = db.execute(query, {"calc_id": str(calculation_id)}).fetchall()
-
-        if not results:
-            return {"landcover_dominant": None, "landcover_percentages": {}}
-
-        total_pixels = sum(r.pixel_count for r in results)
-        landcover_percentages = {}
-        dominant_cover = None
-        max_percentage = 0
+    percentages = _class_percentages(counts, labels)
+    available = {k: v for k, v in percentages.items() if k != labels[26]}
+    return {
+        "forest_type_dominant": _dominant(available) or _dominant(percentages),
+        "forest_type_percentages": percentages
+    }
 
-        for r in results:
-            code = int(r.landcover_code)
-            if code in landcover_map:
-                percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-                cover_name = landcover_map[code]
-                landcover_percentages[cover_name] = round(percentage, 2)
 
-                if percentage > max_percentage:
-                    max_percentage = percentage
-                    dominant_cover = cover_name
+def summarize_esa_worldcover(counts: Dict[int, int]) -> Dict[str, Any]:
+    """ESA WorldCover land cover percentages"""
+    percentages = _class_percentages(counts, LANDCOVER_CLASSES)
+    return {
+        "landcover_dominant": _dominant(percentages),
+        "landcover_percentages": percentages
+    }
 
-        return {
-            "landcover_dominant": dominant_cover,
-            "landcover_percentages": landcover_percentages
-        }
-    except Exception as e:
-        print(f"Error analyzing ESA WorldCover: {e}")
 
-    return {"landcover_dominant": None, "landcover_percentages": {}}
+def summarize_hansen2000(counts: Dict[int, int]) -> Dict[str, Any]:
+    """Hansen 2000 forest class percentages from classified codes (0-4)"""
+    percentages = _class_percentages(counts, HANSEN2000_CLASSES)
+    return {
+        "hansen2000_dominant": _dominant(percentages),
+        "hansen2000_percentages": percentages
+    }
 
 
-def analyze_climate(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze climate data (temperature and precipitation)
+def summarize_climate(climate_stats: Dict[str, Optional[float]]) -> Dict[str, Any]:
+    """Climate summary from WorldClim stats
 
-    WorldClim data:
-    - annual_mean_temperature: Bio01, scale = 0.1, unit = deg C
-    - min_temp_coldest_month: Bio06, scale = 0.1, unit = deg C
+    - annual_mean_temperature: Bio01, unit = deg C
+    - min_temp_coldest_month: Bio06, unit = deg C
     - annual_precipitation: Bio12, unit = mm
     """
-    try:
-        # Temperature analysis (annual mean and min)
-        temp_query = text("""
-            SELECT
-                (amt_stats).mean * 0.1 as temp_mean_c,
-                (mint_stats).mean * 0.1 as temp_min_c
-            FROM (
-                SELECT
-                    ST_SummaryStats(ST_Clip(amt.rast, calc.boundary_geom), 1, true) as amt_stats,
-                    ST_SummaryStats(ST_Clip(mint.rast, calc.boundary_geom), 1, true) as mint_stats
-                FROM rasters.annual_mean_temperature amt,
-                     rasters.min_temp_coldest_month mint,
-                     public.calculations calc
-                WHERE calc.id = :calc_id
-                  AND ST_Intersects(amt.rast, calc.boundary_geom)
-                  AND ST_Intersects(mint.rast, calc.boundary_geom)
-                LIMIT 1
-            ) as subquery
-        """)
-
-        temp_result = db.execute(temp_query, {"calc_id": str(calculation_id)}).first()
-
-        # Precipitation analysis
-        precip_query = text("""
-            SELECT
-                (stats).mean as precip_mean_mm
-            FROM (
-                SELECT ST_SummaryStats(
-                    ST_Clip(rast, boundary_geom),
-                    1,
-                    true
-                ) as stats
-                FROM rasters.annual_precipitation, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-                LIMIT 1
-            ) as subquery
-        """)
-
-        precip_result = db.execute(precip_query, {"calc_id": str(calculation_id)}).first()
-
-        # Filter out invalid values (None, NaN, Infinity)
-        temp_mean = None
-        temp_min = None
-        precip_mean = None
-
-        if temp_result and temp_result.temp_mean_c is not None:
-            import math
-            if not math.isinf(temp_result.temp_mean_c) and not math.isnan(temp_result.temp_mean_c):
-                temp_mean = round(temp_result.temp_mean_c, 1)
-
-        if temp_result and temp_result.temp_min_c is not None:
-            import math
-            if not math.isinf(temp_result.temp_min_c) and not math.isnan(temp_result.temp_min_c):
-                temp_min = round(temp_result.temp_min_c, 1)
-
-        if precip_result and precip_result.precip_mean_mm is not None:
-            import math
-            if not math.isinf(precip_result.precip_mean_mm) and not math.isnan(precip_result.precip_mean_mm):
-                precip_mean = round(precip_result.precip_mean_mm, 1)
-
-        return {
-            "temperature_mean_c": temp_mean,
-            "temperature_min_c": temp_min,
-            "precipitation_mean_mm": precip_mean
-        }
-    except Exception as e:
-        print(f"Error analyzing climate: {e}")
-
     return {
-        "temperature_mean_c": None,
-        "temperature_min_c": None,
-        "precipitation_mean_mm": None
+        "temperature_mean_c": _rounded(climate_stats.get("temp_mean"), 2),
+        "temperature_min_c": _rounded(climate_stats.get("temp_min"), 2),
+        "precipitation_mean_mm": _rounded(climate_stats.get("precip_mean"), 1)
     }
 
 
-def analyze_forest_change(calculation_id: UUID, db: Session) -> Dict[str, Any]:
-    """Analyze forest loss and gain (Hansen Global Forest Change)
+def summarize_forest_change(
+    loss_areas: Dict[int, float],
+    gain_areas: Dict[int, float],
+    fire_areas: Dict[int, float]
+) -> Dict[str, Any]:
+    """Forest loss and gain (Hansen Global Forest Change)
 
+    Takes the geodesic area in sqm of each raster value (see _AREA_LAYERS).
     nepal_lossyear: 0 = no loss, 1-24 = year of loss (2001-2024)
     nepal_gain: 0 = no gain, 1 = forest gain (2000-2012)
-    forest_loss_fire: 0 = no fire loss, 1-24 = year of fire loss (2001-2024)
-    """
-    try:
-        # Get area calculation for converting pixels to hectares
-        area_query = text("""
-            SELECT ST_Area(ST_Transform(boundary_geom, 32645)) / 10000.0 as area_hectares
-            FROM public.calculations
-            WHERE id = :calc_id
-        """)
-        area_result = db.execute(area_query, {"calc_id": str(calculation_id)}).first()
-        total_area_ha = area_result.area_hectares if area_result else 0
-
-        # Forest loss by year
-        loss_query = text("""
-            SELECT
-                (pvc).value as loss_year_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.nepal_lossyear, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value > 0
-            GROUP BY loss_year_code
-            ORDER BY loss_year_code
-        """)
-
-        loss_results = db.execute(loss_query, {"calc_id": str(calculation_id)}).fetchall()
-
-        # Forest gain
-        gain_query = text("""
-            SELECT
-                SUM((pvc).count) as gain_pixels
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.nepal_gain, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value = 1
-        """)
-
-        gain_result = db.execute(gain_query, {"calc_id": str(calculation_id)}).first()
-
-        # Forest loss from fire
-        fire_query = text("""
-            SELECT
-                (pvc).value as fire_year_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, boundary_geom)) as pvc
-                FROM rasters.forest_loss_fire, public.calculations
-                WHERE calculations.id = :calc_id
-                  AND ST_Intersects(rast, boundary_geom)
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value > 0
-            GROUP BY fire_year_code
-        """)
-
-        fire_results = db.execute(fire_query, {"calc_id": str(calculation_id)}).fetchall()
-
-        # Calculate total pixels and percentages
-        total_loss_pixels = sum(r.pixel_count for r in loss_results) if loss_results else 0
-        gain_pixels = gain_result.gain_pixels if gain_result and gain_result.gain_pixels else 0
-        total_fire_pixels = sum(r.pixel_count for r in fire_results) if fire_results else 0
-
-        # Estimate hectares (30m pixel = 900 sqm = 0.09 ha)
-        pixel_area_ha = 0.09
-        loss_hectares = total_loss_pixels * pixel_area_ha
-        gain_hectares = gain_pixels * pixel_area_ha
-        fire_loss_hectares = total_fire_pixels * pixel_area_ha
-
-        # Build year-by-year loss data
-        forest_loss_by_year = {}
-        for r in loss_results:
-            year = 2000 + int(r.loss_year_code)
-            forest_loss_by_year[str(year)] = round(r.pixel_count * pixel_area_ha, 2)
-
-        # Build year-by-year fire loss data
-        fire_loss_by_year = {}
-        for r in fire_results:
-            year = 2000 + int(r.fire_year_code)
-            fire_loss_by_year[str(year)] = round(r.pixel_count * pixel_area_ha, 2)
+    forest_loss_fire: 0 = no fire loss, 1-24 = year of fire loss (2001-2024)
+    """
+    loss_hectares = sum(loss_areas.values()) / 10000
+    gain_hectares = sum(gain_areas.values()) / 10000
+    fire_loss_hectares = sum(fire_areas.values()) / 10000
 
-        return {
-            "forest_loss_hectares": round(loss_hectares, 2) if loss_hectares > 0 else 0,
-            "forest_gain_hectares": round(gain_hectares, 2) if gain_hectares > 0 else 0,
-            "fire_loss_hectares": round(fire_loss_hectares, 2) if fire_loss_hectares > 0 else 0,
-            "forest_loss_by_year": forest_loss_by_year,
-            "fire_loss_by_year": fire_loss_by_year
-        }
-    except Exception as e:
-        print(f"Error analyzing forest change: {e}")
+    forest_loss_by_year = {
+        str(2000 + code): round(area_sqm / 10000, 2)
+        for code, area_sqm in sorted(loss_areas.items())
+    }
+    fire_loss_by_year = {
+        str(2000 + code): round(area_sqm / 10000, 2)
+        for code, area_sqm in sorted(fire_areas.items())
+    }
 
     return {
-        "forest_loss_hectares": 0,
-        "forest_gain_hectares": 0,
-        "fire_loss_hectares": 0,
-        "forest_loss_by_year": {},
-        "fire_loss_by_year": {}
+        "forest_loss_hectares": round(loss_hectares, 2),
+        "forest_gain_hectares": round(gain_hectares, 2),
+        "fire_loss_hectares": round(fire_loss_hectares, 2),
+        "forest_loss_by_year": forest_loss_by_year,
+        "fire_loss_by_year": fire_loss_by_year
     }
 
 
+def summarize_block_rasters(
+    counts: Dict[str, Dict[int, int]],
+    stats: Dict[str, Dict[str, Optional[float]]],
+    areas: Dict[str, Dict[int, float]],
+    option_names: list
+) -> Dict[str, Any]:
+    """Per-block results for the enabled _BLOCK_SUMMARY_LAYERS options"""
+    results: Dict[str, Any] = {}
+    if "run_elevation" in option_names:
+        results.update(summarize_dem(stats.get("dem", {})))
+    if "run_slope" in option_names:
+        results.update(summarize_slope(counts.get("slope", {})))
+    if "run_aspect" in option_names:
+        results.update(summarize_aspect(counts.get("aspect", {})))
+    if "run_canopy" in option_names:
+        results.update(summarize_canopy_height(counts.get("canopy_height", {})))
+    if "run_biomass" in option_names:
+        results.update(summarize_agb(stats.get("agb", {})))
+    if "run_forest_health" in option_names:
+        results.update(summarize_forest_health(counts.get("forest_health", {})))
+    if "run_forest_type" in option_names:
+        results.update(summarize_forest_type(counts.get("forest_type", {}), BLOCK_FOREST_TYPE_CLASSES))
+    if "run_landcover" in option_names:
+        results.update(summarize_esa_worldcover(counts.get("landcover", {})))
+
+    change = summarize_forest_change(
+        areas.get("forest_loss", {}),
+        areas.get("forest_gain", {}),
+        areas.get("fire_loss", {})
+    )
+    if "run_forest_loss" in option_names:
+        results["forest_loss_hectares"] = change["forest_loss_hectares"]
+        results["forest_loss_by_year"] = change["forest_loss_by_year"]
+    if "run_forest_gain" in option_names:
+        results["forest_gain_hectares"] = change["forest_gain_hectares"]
+    if "run_fire_loss" in option_names:
+        results["fire_loss_hectares"] = change["fire_loss_hectares"]
+        results["fire_loss_by_year"] = change["fire_loss_by_year"]
+    if "run_hansen2000" in option_names:
+        results.update(summarize_hansen2000(counts.get("hansen2000", {})))
+
+    climate = summarize_climate(stats.get("climate", {}))
+    if "run_temperature" in option_names:
+        results["temperature_mean_c"] = climate["temperature_mean_c"]
+        results["temperature_min_c"] = climate["temperature_min_c"]
+    if "run_precipitation" in option_names:
+        results["precipitation_mean_mm"] = climate["precipitation_mean_mm"]
+    return results
+
+
 def classify_usda_texture(clay_pct: float, sand_pct: float, silt_pct: float) -> str:
     """
     Classify soil texture using USDA 12-class system
@@ -1499,7 +1519,7 @@ def analyze_soil(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     """
     # TEMPORARILY DISABLED: Soil analysis crashes PostgreSQL
     # Return empty results to allow other analyses to complete
-    print("Soil analysis skipped (temporarily disabled to prevent database crashes)")
+    logger.info("Soil analysis skipped (temporarily disabled to prevent database crashes)")
     return {
         "soil_texture": None,
         "soil_texture_system": "USDA 12-class (disabled)",
@@ -1513,7 +1533,7 @@ def analyze_soil(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     }
 
 
-async def analyze_vectors(calculation_id: UUID, db: Session) -> Dict[str, Any]:
+def analyze_vectors(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     """
     Analyze vector datasets - proximity and intersection analysis
     """
@@ -1527,8 +1547,6 @@ async def analyze_vectors(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     return results
 
 
-
-
 def get_administrative_location(geometry_wkt: str, db: Session) -> Dict[str, Any]:
     """
     Get administrative location by intersecting geometry centroid with admin boundaries
@@ -1607,8 +1625,6 @@ def get_administrative_location(geometry_wkt: str, db: Session) -> Dict[str, Any
     return location
 
 
-
-
 def analyze_geology_geometry(geometry_wkt: str, db: Session) -> Dict[str, Any]:
     """
     Analyze geology classes that intersect with the geometry
@@ -1663,7 +1679,8 @@ def analyze_geology_geometry(geometry_wkt: str, db: Session) -> Dict[str, Any]:
             "geology_percentages": geology_data if geology_data else None
         }
     except Exception as e:
-        print(f"Geology analysis error: {e}")
+        _note_analysis_error(e)
+        logger.exception("Geology analysis error")
         return {"geology_percentages": None}
 
 
@@ -1728,7 +1745,8 @@ def calculate_access_info(geometry_wkt: str, db: Session) -> Dict[str, Any]:
         else:
             return {"access_info": None}
     except Exception as e:
-        print(f"Access calculation error: {e}")
+        _note_analysis_error(e)
+        logger.exception("Access calculation error")
         return {"access_info": None}
 
 
@@ -1748,7 +1766,7 @@ def analyze_nearby_features(geometry_wkt: str, db: Session) -> Dict[str, Any]:
         Dict with features_north, features_east, features_south, features_west
     """
 
-    print("  Calling PostgreSQL analyze_nearby_features function...")
+    logger.debug("Calling PostgreSQL analyze_nearby_features function")
 
     # Use savepoint for transaction isolation (based on E:\CF_application working implementation)
     savepoint = db.begin_nested()
@@ -1774,18 +1792,14 @@ def analyze_nearby_features(geometry_wkt: str, db: Session) -> Dict[str, Any]:
                 'features_west': result.get('features_west')
             }
 
-            # Debug logging
-            print(f"  PostgreSQL function returned all 4 directions:")
-            for direction in ['north', 'east', 'south', 'west']:
-                key = f'features_{direction}'
-                val = result_dict.get(key)
-                val_preview = val[:50] if val else None
-                print(f"    {key}: {val_preview}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for key, val in result_dict.items():
+                    logger.debug("Nearby %s: %s", key, val[:50] if val else None)
 
             return result_dict
         else:
             # Function returned NULL
-            print("  WARNING: PostgreSQL function returned NULL")
+            logger.warning("analyze_nearby_features returned NULL")
             return {
                 'features_north': None,
                 'features_east': None,
@@ -1794,11 +1808,10 @@ def analyze_nearby_features(geometry_wkt: str, db: Session) -> Dict[str, Any]:
             }
 
     except Exception as e:
+        _note_analysis_error(e)
         # Rollback savepoint only (preserves outer transaction)
         savepoint.rollback()
-        print(f"  ERROR calling PostgreSQL function: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calling PostgreSQL function")
 
         # Return empty result on error
         return {
@@ -1809,7 +1822,7 @@ def analyze_nearby_features(geometry_wkt: str, db: Session) -> Dict[str, Any]:
         }
 
 
-async def analyze_admin_boundaries(calculation_id: UUID, db: Session) -> Dict[str, Any]:
+def analyze_admin_boundaries(calculation_id: UUID, db: Session) -> Dict[str, Any]:
     """
     Analyze administrative boundaries - province, municipality, ward
     """
@@ -1824,558 +1837,6 @@ async def analyze_admin_boundaries(calculation_id: UUID, db: Session) -> Dict[st
 # GEOMETRY-BASED ANALYSIS FUNCTIONS (for individual blocks)
 # ============================================================================
 
-def analyze_dem_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze DEM raster for a specific geometry (WKT)
-
-    DEM contains 16-bit signed integer values in meters.
-    NoData value is -32768 but PostGIS doesn't know this (NoData=NULL in raster metadata).
-    We must explicitly exclude -32768 values by filtering in the query.
-    """
-    try:
-        # Use ST_PixelAsPolygons to get all pixel values, then filter and aggregate
-        query = text("""
-            WITH clipped_raster AS (
-                SELECT ST_Clip(rast, ST_GeomFromText(:wkt, 4326)) as rast
-                FROM rasters.dem
-                WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-                LIMIT 1
-            ),
-            pixel_values AS (
-                SELECT (ST_PixelAsPolygons(rast)).val as elevation
-                FROM clipped_raster
-            )
-            SELECT
-                MIN(elevation) as elevation_min,
-                MAX(elevation) as elevation_max,
-                AVG(elevation) as elevation_mean
-            FROM pixel_values
-            WHERE elevation > -32000  -- Exclude NoData values (-32768)
-              AND elevation >= 0       -- Nepal minimum elevation
-              AND elevation <= 9000    -- Nepal maximum elevation
-        """)
-
-        result = db.execute(query, {"wkt": wkt}).first()
-
-        if result and result.elevation_mean is not None:
-            return {
-                "elevation_min_m": round(result.elevation_min, 1) if result.elevation_min else None,
-                "elevation_max_m": round(result.elevation_max, 1) if result.elevation_max else None,
-                "elevation_mean_m": round(result.elevation_mean, 1) if result.elevation_mean else None
-            }
-    except Exception as e:
-        print(f"Error analyzing DEM: {e}")
-
-    return {"elevation_min_m": None, "elevation_max_m": None, "elevation_mean_m": None}
-
-
-def analyze_slope_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze slope for a specific geometry
-
-    Slope raster contains categorical codes (8-bit unsigned):
-    0 = No data / Water (excluded)
-    1 = Gentle (<10°)
-    2 = Moderate (10-20°)
-    3 = Steep (20-30°)
-    4 = Very Steep (>30°)
-    """
-    try:
-        # Mapping from raster values to class names (excluding 0)
-        slope_map = {
-            1: "gentle",
-            2: "moderate",
-            3: "steep",
-            4: "very_steep"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as slope_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.slope
-                WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL
-              AND (pvc).value > 0
-              AND (pvc).value <= 4
-            GROUP BY slope_code
-        """)
-
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-
-        if results:
-            total_pixels = sum(r.pixel_count for r in results)
-            percentages = {}
-            for r in results:
-                code = int(r.slope_code)
-                if code in slope_map:
-                    percentages[slope_map[code]] = round((r.pixel_count / total_pixels) * 100, 2)
-
-            if percentages:
-                dominant = max(percentages.items(), key=lambda x: x[1])[0]
-                return {
-                    "slope_dominant_class": dominant,
-                    "slope_percentages": percentages
-                }
-    except Exception as e:
-        print(f"Error analyzing slope: {e}")
-
-    return {"slope_dominant_class": None, "slope_percentages": {}}
-
-
-def analyze_aspect_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze aspect for a specific geometry
-
-    Aspect raster contains categorical codes (8-bit unsigned):
-    0 = No data (excluded from analysis), 1 = N, 2 = NE, 3 = E, 4 = SE, 5 = S, 6 = SW, 7 = W, 8 = NW
-    """
-    try:
-        # Mapping from raster values to direction names
-        aspect_map = {
-            1: "N",
-            2: "NE",
-            3: "E",
-            4: "SE",
-            5: "S",
-            6: "SW",
-            7: "W",
-            8: "NW"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as aspect_code,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.aspect
-                WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 8
-            GROUP BY aspect_code
-        """)
-
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-
-        if results:
-            total_pixels = sum(r.pixel_count for r in results)
-            percentages = {}
-            for r in results:
-                code = int(r.aspect_code)
-                if code in aspect_map:
-                    percentages[aspect_map[code]] = round((r.pixel_count / total_pixels) * 100, 2)
-
-            if percentages:
-                # Find dominant aspect
-                dominant = max(percentages.items(), key=lambda x: x[1])[0]
-
-                return {
-                    "aspect_dominant": dominant,
-                    "aspect_percentages": percentages
-                }
-    except Exception as e:
-        print(f"Error analyzing aspect: {e}")
-
-    return {"aspect_dominant": None, "aspect_percentages": {}}
-
-
-def analyze_canopy_height_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze canopy height for a specific geometry
-
-    Canopy height raster contains actual height values in meters (0-41m):
-    0m = Non-forest (agricultural land, open areas, water, etc.)
-    1-5m = Bush or shrub land
-    6-15m = Pole sized forest
-    >15m = High forest (tree sized)
-
-    Uses conservative pixel containment: only pixels whose center point
-    is FULLY CONTAINED within the polygon boundary are counted.
-    This matches QGIS zonal statistics behavior more closely.
-    """
-    try:
-        # Use ST_PixelAsPolygons with geom parameter to get pixel center points
-        # Filter to only include pixels where center is CONTAINED (not just intersects)
-        query = text("""
-            WITH boundary AS (
-                SELECT ST_GeomFromText(:wkt, 4326) as geom
-            ),
-            all_pixels AS (
-                SELECT
-                    (pix).val as height,
-                    (pix).geom as pixel_center
-                FROM (
-                    SELECT ST_PixelAsPolygons(rast) as pix
-                    FROM rasters.canopy_height, boundary
-                    WHERE ST_Intersects(rast, geom)
-                ) as subq
-            )
-            SELECT
-                CASE
-                    WHEN height = 0 THEN 'non_forest'
-                    WHEN height > 0 AND height <= 5 THEN 'bush_regenerated'
-                    WHEN height > 5 AND height <= 15 THEN 'pole_trees'
-                    WHEN height > 15 THEN 'high_forest'
-                END as canopy_class,
-                COUNT(*) as pixel_count,
-                AVG(height) as avg_height
-            FROM all_pixels, boundary
-            WHERE ST_Contains(boundary.geom, ST_Centroid(pixel_center))
-              AND height IS NOT NULL
-              AND height >= 0
-              AND height <= 50
-            GROUP BY canopy_class
-        """)
-
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-
-        if results:
-            total_pixels = sum(r.pixel_count for r in results)
-            percentages = {r.canopy_class: round((r.pixel_count / total_pixels) * 100, 2) for r in results}
-            dominant = max(percentages.items(), key=lambda x: x[1])[0]
-
-            # Calculate weighted mean height (including all pixels)
-            total_weighted_height = sum(r.avg_height * r.pixel_count for r in results)
-            canopy_mean_m = round(total_weighted_height / total_pixels, 1) if total_pixels > 0 else None
-
-            return {
-                "canopy_mean_m": canopy_mean_m,
-                "canopy_dominant_class": dominant,
-                "canopy_percentages": percentages
-            }
-    except Exception as e:
-        print(f"Error analyzing canopy height: {e}")
-
-    return {"canopy_mean_m": None, "canopy_dominant_class": None, "canopy_percentages": {}}
-
-
-def analyze_agb_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze above-ground biomass for a specific geometry
-
-    AGB raster (16-bit unsigned) has 2 bands:
-    Band 1 = AGB estimate in Mg/ha, Band 2 = standard deviation
-    """
-    try:
-        query = text("""
-            SELECT
-                (stats).mean as agb_mean,
-                (stats).sum as agb_total
-            FROM (
-                SELECT ST_SummaryStats(
-                    ST_Clip(rast, 1, ST_GeomFromText(:wkt, 4326)),
-                    1,  -- band 1
-                    true  -- exclude nodata
-                ) as stats
-                FROM rasters.agb_2022_nepal
-                WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-                LIMIT 1
-            ) as subquery
-        """)
-
-        result = db.execute(query, {"wkt": wkt}).first()
-
-        if result and result.agb_total:
-            return {
-                "agb_mean_mg_ha": round(result.agb_mean, 2) if result.agb_mean else None,
-                "agb_total_mg": round(result.agb_total, 2) if result.agb_total else None,
-                "carbon_stock_mg": round(result.agb_total * 0.5, 2) if result.agb_total else None
-            }
-    except Exception as e:
-        print(f"Error analyzing AGB: {e}")
-
-    return {"agb_mean_mg_ha": None, "agb_total_mg": None, "carbon_stock_mg": None}
-
-
-def analyze_forest_health_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze forest health for a specific geometry
-
-    Forest health classes (8-bit unsigned):
-    1=Stressed, 2=Poor, 3=Moderate, 4=Healthy, 5=Excellent
-    """
-    try:
-        # Correct mapping according to table comment
-        health_map = {
-            1: "stressed",
-            2: "poor",
-            3: "moderate",
-            4: "healthy",
-            5: "excellent"
-        }
-
-        query = text("""
-            SELECT
-                (pvc).value as health_class,
-                SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.nepal_forest_health
-                WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 5
-            GROUP BY health_class
-        """)
-
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-
-        if results:
-            total_pixels = sum(r.pixel_count for r in results)
-            percentages = {}
-            for r in results:
-                class_val = int(r.health_class)
-                if class_val in health_map:
-                    percentages[health_map[class_val]] = round((r.pixel_count / total_pixels) * 100, 2)
-
-            if percentages:
-                dominant = max(percentages.items(), key=lambda x: x[1])[0]
-                return {
-                    "forest_health_dominant": dominant,
-                    "forest_health_percentages": percentages
-                }
-    except Exception as e:
-        print(f"Error analyzing forest health: {e}")
-
-    return {"forest_health_dominant": None, "forest_health_percentages": {}}
-
-
-def analyze_forest_type_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze forest type for a specific geometry (WKT)"""
-    try:
-        forest_type_map = {
-            1: "Shorea robusta", 2: "Alnus nepalensis", 3: "Schima-Castanopsis",
-            4: "Quercus semecarpifolia", 5: "Larix/Abies spectabilis",
-            6: "Pinus wallichiana-Tsuga dumosa", 7: "Plantation (Pinus-Eucalyptus)",
-            8: "Ficus-Other Tropical Riverine", 9: "Tropical Mixed Broadleaved",
-            10: "Quercus-Pinus", 11: "Abies spectabilis",
-            12: "Pinus roxburghii-Mixed Broadleaved", 13: "Pinus wallichiana",
-            14: "Warm Temperate Mixed Broadleaved", 15: "Upper Temperate Quercus",
-            16: "Rhododendron arboreum", 17: "Temperate Rhododendron Mixed Broadleaved",
-            18: "Dalbergia sissoo-Senegalia catechu", 19: "Terminalia-Tropical Mixed Broadleaved",
-            20: "Temperate Mixed Broadleaved", 21: "Tropical Deciduous Indigenous Riverine",
-            22: "Tropical Riverine", 23: "Lower Temperate Mixed robusta",
-            24: "Pinus roxburghii-Shorea robusta", 25: "Lower Temperate Pinus roxburghii-Quercus",
-            26: "Data Not Available"
-        }
-        query = text("""
-            SELECT (pvc).value as forest_type_code, SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.forest_type WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 26
-            GROUP BY forest_type_code ORDER BY pixel_count DESC
-        """)
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-        if not results:
-            return {"forest_type_dominant": None, "forest_type_percentages": {}}
-        total_pixels = sum(r.pixel_count for r in results)
-        forest_type_percentages = {}
-        dominant_type = None
-        max_percentage = 0
-        for r in results:
-            code = int(r.forest_type_code)
-            if code in forest_type_map:
-                percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-                type_name = forest_type_map[code]
-                forest_type_percentages[type_name] = round(percentage, 2)
-                if code != 26 and percentage > max_percentage:
-                    max_percentage = percentage
-                    dominant_type = type_name
-                elif code == 26 and dominant_type is None:
-                    dominant_type = type_name
-        return {"forest_type_dominant": dominant_type, "forest_type_percentages": forest_type_percentages}
-    except Exception as e:
-        print(f"Error analyzing forest type for geometry: {e}")
-    return {"forest_type_dominant": None, "forest_type_percentages": {}}
-
-
-def analyze_landcover_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze ESA WorldCover land cover for a specific geometry (WKT)
-
-    ESA WorldCover classes:
-    0 = No data (excluded from analysis)
-    10-100 = Valid land cover classes
-    """
-    try:
-        landcover_map = {
-            10: "Tree cover", 20: "Shrubland", 30: "Grassland", 40: "Cropland",
-            50: "Built-up", 60: "Bare/sparse vegetation", 70: "Snow and ice",
-            80: "Permanent water bodies", 90: "Herbaceous wetland", 95: "Mangroves",
-            100: "Moss and lichen"
-        }
-        query = text("""
-            SELECT (pvc).value as landcover_code, SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.esa_world_cover WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value > 0
-            GROUP BY landcover_code ORDER BY pixel_count DESC
-        """)
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-        if not results:
-            return {"landcover_dominant": None, "landcover_percentages": {}}
-        total_pixels = sum(r.pixel_count for r in results)
-        landcover_percentages = {}
-        dominant_cover = None
-        max_percentage = 0
-        for r in results:
-            code = int(r.landcover_code)
-            if code in landcover_map:
-                percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-                cover_name = landcover_map[code]
-                landcover_percentages[cover_name] = round(percentage, 2)
-                if percentage > max_percentage:
-                    max_percentage = percentage
-                    dominant_cover = cover_name
-        return {"landcover_dominant": dominant_cover, "landcover_percentages": landcover_percentages}
-    except Exception as e:
-        print(f"Error analyzing land cover for geometry: {e}")
-    return {"landcover_dominant": None, "landcover_percentages": {}}
-
-
-def analyze_forest_loss_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze Hansen forest loss (2001-2023) for a specific geometry"""
-    try:
-        query = text("""
-            SELECT (pvc).value as loss_year, SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.nepal_lossyear WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 23
-            GROUP BY loss_year ORDER BY loss_year
-        """)
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-        if not results:
-            return {"forest_loss_hectares": 0, "forest_loss_by_year": {}}
-        pixel_area_ha = 0.0009
-        loss_by_year = {}
-        total_loss_pixels = 0
-        for r in results:
-            year_code = int(r.loss_year)
-            actual_year = 2000 + year_code
-            loss_ha = r.pixel_count * pixel_area_ha
-            loss_by_year[str(actual_year)] = round(loss_ha, 4)
-            total_loss_pixels += r.pixel_count
-        total_loss_ha = total_loss_pixels * pixel_area_ha
-        return {"forest_loss_hectares": round(total_loss_ha, 4), "forest_loss_by_year": loss_by_year}
-    except Exception as e:
-        print(f"Error analyzing forest loss for geometry: {e}")
-    return {"forest_loss_hectares": None, "forest_loss_by_year": {}}
-
-
-def analyze_forest_gain_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze Hansen forest gain (2000-2012) for a specific geometry"""
-    try:
-        query = text("""
-            SELECT SUM((pvc).count) as gain_pixels
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.nepal_gain WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value = 1
-        """)
-        result = db.execute(query, {"wkt": wkt}).first()
-        if result and result.gain_pixels:
-            pixel_area_ha = 0.0009
-            gain_ha = result.gain_pixels * pixel_area_ha
-            return {"forest_gain_hectares": round(gain_ha, 4)}
-    except Exception as e:
-        print(f"Error analyzing forest gain for geometry: {e}")
-    return {"forest_gain_hectares": None}
-
-
-def analyze_fire_loss_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze fire-related forest loss for a specific geometry"""
-    try:
-        query = text("""
-            SELECT (pvc).value as fire_year, SUM((pvc).count) as pixel_count
-            FROM (
-                SELECT ST_ValueCount(ST_Clip(rast, ST_GeomFromText(:wkt, 4326))) as pvc
-                FROM rasters.forest_loss_fire WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-            ) as subquery
-            WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 1 AND 23
-            GROUP BY fire_year ORDER BY fire_year
-        """)
-        results = db.execute(query, {"wkt": wkt}).fetchall()
-        if not results:
-            return {"fire_loss_hectares": 0, "fire_loss_by_year": {}}
-        pixel_area_ha = 0.0009
-        fire_by_year = {}
-        total_fire_pixels = 0
-        for r in results:
-            year_code = int(r.fire_year)
-            actual_year = 2000 + year_code
-            fire_ha = r.pixel_count * pixel_area_ha
-            fire_by_year[str(actual_year)] = round(fire_ha, 4)
-            total_fire_pixels += r.pixel_count
-        total_fire_ha = total_fire_pixels * pixel_area_ha
-        return {"fire_loss_hectares": round(total_fire_ha, 4), "fire_loss_by_year": fire_by_year}
-    except Exception as e:
-        print(f"Error analyzing fire loss for geometry: {e}")
-    return {"fire_loss_hectares": None, "fire_loss_by_year": {}}
-
-
-def analyze_temperature_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze temperature data for a specific geometry"""
-    try:
-        query = text("""
-            WITH clipped AS (
-                SELECT ST_Clip(rast, ST_GeomFromText(:wkt, 4326)) as rast
-                FROM rasters.annual_mean_temperature WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-                LIMIT 1
-            ), pixel_values AS (
-                SELECT (ST_PixelAsPolygons(rast)).val as temp FROM clipped
-            )
-            SELECT AVG(temp) as temp_mean FROM pixel_values WHERE temp IS NOT NULL AND temp > -100 AND temp < 100
-        """)
-        result = db.execute(query, {"wkt": wkt}).first()
-        temp_mean = None
-        if result and result.temp_mean is not None:
-            temp_mean = round(result.temp_mean, 2)
-
-        query_min = text("""
-            WITH clipped AS (
-                SELECT ST_Clip(rast, ST_GeomFromText(:wkt, 4326)) as rast
-                FROM rasters.min_temp_coldest_month WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-                LIMIT 1
-            ), pixel_values AS (
-                SELECT (ST_PixelAsPolygons(rast)).val as temp FROM clipped
-            )
-            SELECT AVG(temp) as temp_min FROM pixel_values WHERE temp IS NOT NULL AND temp > -100 AND temp < 100
-        """)
-        result_min = db.execute(query_min, {"wkt": wkt}).first()
-        temp_min = None
-        if result_min and result_min.temp_min is not None:
-            temp_min = round(result_min.temp_min, 2)
-
-        return {"temperature_mean_c": temp_mean, "temperature_min_c": temp_min}
-    except Exception as e:
-        print(f"Error analyzing temperature for geometry: {e}")
-    return {"temperature_mean_c": None, "temperature_min_c": None}
-
-
-def analyze_precipitation_geometry(wkt: str, db: Session) -> Dict[str, Any]:
-    """Analyze precipitation data for a specific geometry"""
-    try:
-        query = text("""
-            WITH clipped AS (
-                SELECT ST_Clip(rast, ST_GeomFromText(:wkt, 4326)) as rast
-                FROM rasters.annual_precipitation WHERE ST_Intersects(rast, ST_GeomFromText(:wkt, 4326))
-                LIMIT 1
-            ), pixel_values AS (
-                SELECT (ST_PixelAsPolygons(rast)).val as precip FROM clipped
-            )
-            SELECT AVG(precip) as precip_mean FROM pixel_values WHERE precip IS NOT NULL AND precip >= 0
-        """)
-        result = db.execute(query, {"wkt": wkt}).first()
-        if result and result.precip_mean is not None:
-            return {"precipitation_mean_mm": round(result.precip_mean, 1)}
-    except Exception as e:
-        print(f"Error analyzing precipitation for geometry: {e}")
-    return {"precipitation_mean_mm": None}
-
-
 def analyze_soil_geometry(wkt: str, db: Session) -> Dict[str, Any]:
     """Analyze soil properties for a specific geometry (WKT) with enhanced analysis
 
@@ -2544,20 +2005,14 @@ def analyze_physiography_geometry(wkt: str, db: Session) -> Dict[str, Any]:
         Dict with physiography_percentages: {zone_name: percentage}
     """
     try:
-        # Determine UTM zone from centroid longitude
-        centroid_query = text("""
-            SELECT ST_X(ST_Centroid(ST_GeomFromText(:wkt, 4326))) as lon
-        """)
-        centroid_result = db.execute(centroid_query, {"wkt": wkt}).first()
-        utm_srid = 32645 if centroid_result.lon > 84 else 32644
-
-        # Calculate intersection areas in UTM projection
+        # Calculate intersection areas in the UTM zone of the centroid
         query = text(f"""
             WITH input_geom AS (
-                SELECT ST_GeomFromText(:wkt, 4326) as geom
+                SELECT geom, {UTM_SRID_SQL} as utm_srid
+                FROM ST_GeomFromText(:wkt, 4326) AS geom, ST_Centroid(geom) AS centroid
             ),
             total_area AS (
-                SELECT ST_Area(ST_Transform(geom, {utm_srid})) as area
+                SELECT ST_Area(ST_Transform(geom, utm_srid)) as area
                 FROM input_geom
             ),
             intersections AS (
@@ -2566,7 +2021,7 @@ def analyze_physiography_geometry(wkt: str, db: Session) -> Dict[str, Any]:
                     ST_Area(
                         ST_Transform(
                             ST_Intersection(p.geom, i.geom),
-                            {utm_srid}
+                            i.utm_srid
                         )
                     ) as intersection_area
                 FROM admin.physiography p, input_geom i
@@ -2590,9 +2045,8 @@ def analyze_physiography_geometry(wkt: str, db: Session) -> Dict[str, Any]:
 
             return {"physiography_percentages": percentages}
     except Exception as e:
-        print(f"Error analyzing physiography: {e}")
-        import traceback
-        traceback.print_exc()
+        _note_analysis_error(e)
+        logger.exception("Error analyzing physiography")
 
     return {"physiography_percentages": None}
 
@@ -2611,20 +2065,14 @@ def analyze_ecoregion_geometry(wkt: str, db: Session) -> Dict[str, Any]:
         Dict with ecoregion_percentages: {eco_name: percentage}
     """
     try:
-        # Determine UTM zone from centroid longitude
-        centroid_query = text("""
-            SELECT ST_X(ST_Centroid(ST_GeomFromText(:wkt, 4326))) as lon
-        """)
-        centroid_result = db.execute(centroid_query, {"wkt": wkt}).first()
-        utm_srid = 32645 if centroid_result.lon > 84 else 32644
-
-        # Calculate intersection areas in UTM projection
+        # Calculate intersection areas in the UTM zone of the centroid
         query = text(f"""
             WITH input_geom AS (
-                SELECT ST_GeomFromText(:wkt, 4326) as geom
+                SELECT geom, {UTM_SRID_SQL} as utm_srid
+                FROM ST_GeomFromText(:wkt, 4326) AS geom, ST_Centroid(geom) AS centroid
             ),
             total_area AS (
-                SELECT ST_Area(ST_Transform(geom, {utm_srid})) as area
+                SELECT ST_Area(ST_Transform(geom, utm_srid)) as area
                 FROM input_geom
             ),
             intersections AS (
@@ -2633,7 +2081,7 @@ def analyze_ecoregion_geometry(wkt: str, db: Session) -> Dict[str, Any]:
                     ST_Area(
                         ST_Transform(
                             ST_Intersection(e.geom, i.geom),
-                            {utm_srid}
+                            i.utm_srid
                         )
                     ) as intersection_area
                 FROM ecology.ecoregion e, input_geom i
@@ -2657,9 +2105,8 @@ def analyze_ecoregion_geometry(wkt: str, db: Session) -> Dict[str, Any]:
 
             return {"ecoregion_percentages": percentages}
     except Exception as e:
-        print(f"Error analyzing ecoregion: {e}")
-        import traceback
-        traceback.print_exc()
+        _note_analysis_error(e)
+        logger.exception("Error analyzing ecoregion")
 
     return {"ecoregion_percentages": None}
 
@@ -2726,9 +2173,8 @@ def analyze_nasa_forest_2020_geometry(wkt: str, db: Session) -> Dict[str, Any]:
                 "nasa_forest_2020_dominant": dominant
             }
     except Exception as e:
-        print(f"Error analyzing NASA forest 2020: {e}")
-        import traceback
-        traceback.print_exc()
+        _note_analysis_error(e)
+        logger.exception("Error analyzing NASA forest 2020")
 
     return {
         "nasa_forest_2020_percentages": None,
@@ -2748,26 +2194,15 @@ def analyze_landcover_1984_geometry(wkt: str, db: Session) -> Dict[str, Any]:
         landcover_1984_percentages: Percentage breakdown by landcover type
     """
     try:
-        # Detect UTM zone for accurate area calculation
-        centroid_query = text("""
-            SELECT ST_X(ST_Centroid(ST_GeomFromText(:wkt, 4326))) as longitude
-        """)
-        centroid_result = db.execute(centroid_query, {"wkt": wkt}).first()
-
-        if not centroid_result:
-            return {"landcover_1984_dominant": None, "landcover_1984_percentages": {}}
-
-        longitude = centroid_result.longitude
-        utm_zone = int((longitude + 180) / 6) + 1
-        utm_srid = 32600 + utm_zone if longitude >= 0 else 32700 + utm_zone
-
-        # Calculate intersection areas for each landcover type
+        # Calculate intersection areas for each landcover type in the UTM
+        # zone of the centroid
         query = text(f"""
             WITH input_geom AS (
-                SELECT ST_GeomFromText(:wkt, 4326) as geom
+                SELECT geom, {UTM_SRID_SQL} as utm_srid
+                FROM ST_GeomFromText(:wkt, 4326) AS geom, ST_Centroid(geom) AS centroid
             ),
             total_area AS (
-                SELECT ST_Area(ST_Transform(geom, {utm_srid})) as area
+                SELECT ST_Area(ST_Transform(geom, utm_srid)) as area
                 FROM input_geom
             ),
             intersections AS (
@@ -2776,7 +2211,7 @@ def analyze_landcover_1984_geometry(wkt: str, db: Session) -> Dict[str, Any]:
                     ST_Area(
                         ST_Transform(
                             ST_Intersection(lc.geom, i.geom),
-                            {utm_srid}
+                            i.utm_srid
                         )
                     ) as intersection_area
                 FROM landcover.landcover_1984 lc, input_geom i
@@ -2816,9 +2251,8 @@ def analyze_landcover_1984_geometry(wkt: str, db: Session) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error analyzing landcover 1984 for geometry: {e}")
-        import traceback
-        traceback.print_exc()
+        _note_analysis_error(e)
+        logger.exception("Error analyzing landcover 1984 for geometry")
 
     return {"landcover_1984_dominant": None, "landcover_1984_percentages": {}}
 
@@ -2840,14 +2274,6 @@ def analyze_hansen2000_geometry(wkt: str, db: Session) -> Dict[str, Any]:
         hansen2000_percentages: Percentage breakdown by forest class
     """
     try:
-        forest_class_map = {
-            0: "Non forest",
-            1: "Bush/Shrub",
-            2: "Poor forest",
-            3: "Moderate forest",
-            4: "Good forest"
-        }
-
         query = text("""
             SELECT
                 (pvc).value as forest_class,
@@ -2859,39 +2285,15 @@ def analyze_hansen2000_geometry(wkt: str, db: Session) -> Dict[str, Any]:
             ) as subquery
             WHERE (pvc).value IS NOT NULL AND (pvc).value BETWEEN 0 AND 4
             GROUP BY forest_class
-            ORDER BY pixel_count DESC
         """)
 
         results = db.execute(query, {"wkt": wkt}).fetchall()
-
-        if not results:
-            return {"hansen2000_dominant": None, "hansen2000_percentages": {}}
-
-        total_pixels = sum(r.pixel_count for r in results)
-        percentages = {}
-        dominant_class = None
-        max_percentage = 0
-
-        for r in results:
-            class_code = int(r.forest_class)
-            if class_code in forest_class_map:
-                percentage = (r.pixel_count / total_pixels * 100) if total_pixels > 0 else 0
-                class_name = forest_class_map[class_code]
-                percentages[class_name] = round(percentage, 2)
-
-                if percentage > max_percentage:
-                    max_percentage = percentage
-                    dominant_class = class_name
-
-        return {
-            "hansen2000_dominant": dominant_class,
-            "hansen2000_percentages": percentages
-        }
+        return summarize_hansen2000({int(r.forest_class): int(r.pixel_count) for r in results})
 
     except Exception as e:
-        print(f"Error analyzing Hansen 2000 for geometry: {e}")
-        import traceback
-        traceback.print_exc()
+        _note_analysis_error(e)
+        _note_missing_table(e)
+        logger.exception("Error analyzing Hansen 2000 for geometry")
 
     return {"hansen2000_dominant": None, "hansen2000_percentages": {}}
 
@@ -3038,7 +2440,6 @@ def analyze_potential_tree_species(forest_type_percentages: Dict[str, float], db
         }
 
     except Exception as e:
-        print(f"Error analyzing potential tree species: {e}")
-        import traceback
-        traceback.print_exc()
+        _note_analysis_error(e)
+        logger.exception("Error analyzing potential tree species")
         return {"potential_species": [], "species_count": 0}
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 import csv
 import io
+import math
 from typing import List, Dict, Any
 from xml.etree import ElementTree as ET
 
@@ -434,7 +435,6 @@ def export_sampling_kml(db: Session, design_id: UUID) -> bytes:
             desc = f'Shape: {design.plot_shape}<br/>'
             if design.plot_radius_meters:
                 # Calculate plot area for circular plots: π * r²
-                import math
                 plot_area = math.pi * float(design.plot_radius_meters) ** 2
                 desc += f'Radius: {design.plot_radius_meters}m<br/>'
                 desc += f'Area: {plot_area:.2f} m²'
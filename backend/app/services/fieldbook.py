@@ -517,7 +517,6 @@ def update_utm_and_elevation(db: Session, calculation_id: UUID, calculate_refere
         reference_update_query = text("""
             WITH references_raw AS (
                 SELECT
-                    id,
                     point_number,
                     rasters.find_nearest_feature(longitude, latitude) as ref
                 FROM public.fieldbook
@@ -526,7 +525,7 @@ def update_utm_and_elevation(db: Session, calculation_id: UUID, calculate_refere
             ),
             references_with_lag AS (
                 SELECT
-                    id,
+                    point_number,
                     ref,
                     LAG(ref) OVER (ORDER BY point_number) as prev_ref
                 FROM references_raw
@@ -537,7 +536,8 @@ def update_utm_and_elevation(db: Session, calculation_id: UUID, calculate_refere
                 ELSE NULL
             END
             FROM references_with_lag rwl
-            WHERE fb.id = rwl.id
+            WHERE fb.calculation_id = :calc_id
+            AND fb.point_number = rwl.point_number
         """)
         db.execute(reference_update_query, {"calc_id": str(calculation_id)})
         logger.info(f"Reference calculation completed for fieldbook {calculation_id}")
@@ -0,0 +1,265 @@
+"""
+Unit tests for the raster summary formatters in analysis.py
+
+The formatters turn the per-layer value counts, statistics and areas returned
+by the fused raster queries into the analysis result fields.
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import analysis
+from app.services.analysis import (
+    ASPECT_DIRECTIONS,
+    BLOCK_FOREST_TYPE_CLASSES,
+    SLOPE_CLASSES,
+    _class_percentages,
+    _dominant,
+    summarize_block_rasters,
+    summarize_canopy_height,
+    summarize_dem,
+    summarize_forest_change,
+    summarize_forest_type,
+)
+
+
+class TestClassPercentages:
+    """Test per-class percentages from value counts"""
+
+    @pytest.mark.parametrize("counts,labels,expected", [
+        ({}, SLOPE_CLASSES, {}),
+        ({1: 0, 2: 0}, SLOPE_CLASSES, {}),
+        ({1: 50, 2: 50}, SLOPE_CLASSES, {"gentle": 50.0, "moderate": 50.0}),
+        ({1: 1, 2: 2}, SLOPE_CLASSES, {"moderate": 66.67, "gentle": 33.33}),
+        # Unlabelled codes count towards the total but are not reported
+        ({1: 3, 9: 1}, SLOPE_CLASSES, {"gentle": 75.0}),
+        ({5: 10}, ASPECT_DIRECTIONS, {"S": 100.0}),
+    ])
+    def test_percentages(self, counts, labels, expected):
+        """Test rounding, filtering and largest-first ordering"""
+        result = _class_percentages(counts, labels)
+        assert result == expected
+        assert list(result) == list(expected)
+
+    @pytest.mark.parametrize("percentages,expected", [
+        ({}, None),
+        ({"gentle": 30.0, "steep": 70.0}, "steep"),
+        ({"gentle": 50.0, "steep": 50.0}, "gentle"),
+    ])
+    def test_dominant(self, percentages, expected):
+        """Test the largest share wins and the first one wins ties"""
+        assert _dominant(percentages) == expected
+
+
+class TestSummarizeDem:
+    """Test elevation statistics formatting"""
+
+    @pytest.mark.parametrize("dem_stats,expected", [
+        ({}, (None, None, None)),
+        ({"min": 100.0, "max": 200.0, "mean": None}, (None, None, None)),
+        ({"min": 101.04, "max": 2500.26, "mean": 987.65}, (101.0, 2500.3, 987.6)),
+        # An elevation of 0 is a value, not a missing statistic
+        ({"min": 0.0, "max": 12.0, "mean": 0.0}, (0.0, 12.0, 0.0)),
+        ({"min": None, "max": None, "mean": 5.0}, (None, None, 5.0)),
+    ])
+    def test_summarize_dem(self, dem_stats, expected):
+        """Test rounding to 0.1 m and missing statistics"""
+        result = summarize_dem(dem_stats)
+        assert (result["elevation_min_m"], result["elevation_max_m"], result["elevation_mean_m"]) == expected
+
+
+class TestSummarizeCanopyHeight:
+    """Test canopy structure classes and mean height"""
+
+    def test_empty_counts(self):
+        """Test that no pixels give no classes and no mean"""
+        assert summarize_canopy_height({}) == {
+            "canopy_dominant_class": None,
+            "canopy_percentages": {},
+            "canopy_mean_m": None
+        }
+
+    @pytest.mark.parametrize("counts,expected_percentages,expected_dominant,expected_mean", [
+        ({0: 10}, {"non_forest": 100.0}, "non_forest", 0.0),
+        ({0: 1, 5: 1, 6: 1, 15: 1, 16: 1, 41: 1},
+         {"non_forest": 16.67, "bush_regenerated": 16.67, "pole_trees": 33.33, "high_forest": 33.33},
+         "pole_trees", 13.8),
+        # The mean height includes the non-forest pixels
+        ({0: 3, 20: 1}, {"non_forest": 75.0, "high_forest": 25.0}, "non_forest", 5.0),
+    ])
+    def test_classes_and_mean(self, counts, expected_percentages, expected_dominant, expected_mean):
+        """Test class boundaries (0, 1-5, 6-15, >15 m) and the pixel-weighted mean"""
+        result = summarize_canopy_height(counts)
+        assert result["canopy_percentages"] == expected_percentages
+        assert result["canopy_dominant_class"] == expected_dominant
+        assert result["canopy_mean_m"] == expected_mean
+
+
+class TestSummarizeForestType:
+    """Test forest type percentages and the dominant type"""
+
+    @pytest.mark.parametrize("counts,expected_dominant", [
+        ({}, None),
+        ({1: 10, 9: 5}, "Shorea robusta"),
+        # "Data Not Available" (26) is skipped for the dominant type...
+        ({26: 80, 9: 20}, "Pinus roxburghii"),
+        # ...unless it is the only class present
+        ({26: 10}, "Data Not Available"),
+    ])
+    def test_dominant(self, counts, expected_dominant):
+        """Test the dominant type ignores code 26 when other types exist"""
+        assert summarize_forest_type(counts)["forest_type_dominant"] == expected_dominant
+
+    def test_percentages_keep_code_26(self):
+        """Test code 26 is still reported in the percentages"""
+        result = summarize_forest_type({26: 80, 9: 20})
+        assert result["forest_type_percentages"] == {"Data Not Available": 80.0, "Pinus roxburghii": 20.0}
+
+    def test_block_labels(self):
+        """Test the block label set is used when given"""
+        result = summarize_forest_type({2: 10}, BLOCK_FOREST_TYPE_CLASSES)
+        assert result["forest_type_dominant"] == "Alnus nepalensis"
+
+
+class TestSummarizeBlockRasters:
+    """Test the per-block results only contain the enabled analyses"""
+
+    def test_no_options(self):
+        """Test that no enabled option gives no results"""
+        assert summarize_block_rasters({"slope": {1: 10}}, {}, {}, []) == {}
+
+    @pytest.mark.parametrize("option,expected_keys", [
+        ("run_elevation", {"elevation_min_m", "elevation_max_m", "elevation_mean_m"}),
+        ("run_slope", {"slope_dominant_class", "slope_percentages"}),
+        ("run_canopy", {"canopy_dominant_class", "canopy_percentages", "canopy_mean_m"}),
+        ("run_forest_type", {"forest_type_dominant", "forest_type_percentages"}),
+        ("run_forest_loss", {"forest_loss_hectares", "forest_loss_by_year"}),
+        ("run_forest_gain", {"forest_gain_hectares"}),
+        ("run_fire_loss", {"fire_loss_hectares", "fire_loss_by_year"}),
+        ("run_hansen2000", {"hansen2000_dominant", "hansen2000_percentages"}),
+        ("run_temperature", {"temperature_mean_c", "temperature_min_c"}),
+        ("run_precipitation", {"precipitation_mean_mm"}),
+    ])
+    def test_enabled_option_keys(self, option, expected_keys):
+        """Test each option adds exactly its own result fields, even without data"""
+        assert set(summarize_block_rasters({}, {}, {}, [option])) == expected_keys
+
+    def test_values(self):
+        """Test block values come from the counts, stats and areas"""
+        result = summarize_block_rasters(
+            {"slope": {3: 30, 1: 10}, "forest_type": {2: 5}},
+            {"dem": {"min": 500.0, "max": 900.0, "mean": 700.0}, "climate": {"precip_mean": 1500.04}},
+            {"forest_loss": {1: 5000.0}},
+            ["run_elevation", "run_slope", "run_forest_type", "run_forest_loss", "run_precipitation"]
+        )
+        assert result["elevation_mean_m"] == 700.0
+        assert result["slope_dominant_class"] == "steep"
+        assert result["slope_percentages"] == {"steep": 75.0, "gentle": 25.0}
+        assert result["forest_type_dominant"] == "Alnus nepalensis"
+        assert result["forest_loss_hectares"] == 0.5
+        assert result["forest_loss_by_year"] == {"2001": 0.5}
+        assert result["precipitation_mean_mm"] == 1500.0
+
+
+class TestForestChange:
+    """Test forest loss / gain / fire hectares from per-value areas (sqm)"""
+
+    def test_empty_areas(self):
+        """Test that no areas give zero hectares and empty histograms"""
+        assert summarize_forest_change({}, {}, {}) == {
+            "forest_loss_hectares": 0,
+            "forest_gain_hectares": 0,
+            "fire_loss_hectares": 0,
+            "forest_loss_by_year": {},
+            "fire_loss_by_year": {}
+        }
+
+    @pytest.mark.parametrize("loss_areas,expected_total,expected_by_year", [
+        ({1: 6800.0}, 0.68, {"2001": 0.68}),
+        ({3: 3400.0, 1: 6800.0}, 1.02, {"2001": 0.68, "2003": 0.34}),
+        ({24: 123456.0}, 12.35, {"2024": 12.35}),
+    ])
+    def test_loss_by_year(self, loss_areas, expected_total, expected_by_year):
+        """Test conversion to hectares and year labels (code + 2000)"""
+        result = summarize_forest_change(loss_areas, {}, {})
+        assert result["forest_loss_hectares"] == expected_total
+        assert result["forest_loss_by_year"] == expected_by_year
+        assert list(result["forest_loss_by_year"]) == sorted(expected_by_year)
+
+    def test_gain_and_fire(self):
+        """Test gain and fire totals are summed over all codes"""
+        result = summarize_forest_change({}, {1: 20000.0}, {5: 1000.0, 7: 500.0})
+        assert result["forest_gain_hectares"] == 2.0
+        assert result["fire_loss_hectares"] == 0.15
+        assert result["fire_loss_by_year"] == {"2005": 0.1, "2007": 0.05}
+
+
+class TestPixelAreaQueries:
+    """Test that only the forest change layers carry the pixel area"""
+
+    def test_whole_forest_query(self):
+        """Test the whole-forest query sums the pixel area for the area layers"""
+        sql = str(analysis._raster_summary_query())
+        for layer, _, _ in analysis._VALUE_COUNT_LAYERS:
+            branch = sql.split(f"'{layer}'::text", 1)[1].split(f"AS {layer}_counts", 1)[0]
+            assert ("ST_PixelAsPolygon" in branch) == (layer in analysis._AREA_LAYERS)
+
+    def test_block_query(self):
+        """Test the block summary query sums the pixel area for the area layers"""
+        options = [option for option, _, _, _ in analysis._BLOCK_SUMMARY_LAYERS]
+        sql = str(analysis._block_raster_summary_query(options))
+        for _, layer, _, value_filter in analysis._BLOCK_SUMMARY_LAYERS:
+            if value_filter is None:
+                continue
+            branch = sql.split(f"'{layer}'::text", 1)[1].split(f"AS {layer}_counts", 1)[0]
+            assert ("ST_PixelAsPolygon" in branch) == (layer in analysis._AREA_LAYERS)
+
+
+class TestMissingTables:
+    """Test that tables reported missing are left out of the raster queries"""
+
+    def test_whole_forest_query_skips_missing_table(self, monkeypatch):
+        """Test one missing table drops only its own branch"""
+        monkeypatch.setattr(analysis, "_missing_tables", {"rasters.slope": time.monotonic()})
+        sql = str(analysis._raster_summary_query())
+        assert "rasters.slope" not in sql
+        assert "rasters.dem" in sql
+        assert "rasters.aspect" in sql
+
+    def test_whole_forest_query_all_missing(self, monkeypatch):
+        """Test no query is built when every table is missing"""
+        monkeypatch.setattr(analysis, "_missing_tables", {
+            table: time.monotonic()
+            for tables in analysis.RASTER_SUMMARY_TABLES.values() for table in tables
+        })
+        assert analysis._raster_summary_query() is None
+
+    def test_block_query_all_missing(self, monkeypatch):
+        """Test no block query is built when every enabled table is missing"""
+        monkeypatch.setattr(analysis, "_missing_tables", {"rasters.slope": time.monotonic()})
+        assert analysis._block_raster_summary_query(["run_slope"]) is None
+        assert analysis._fetch_block_raster_summaries(["{}"], ["run_slope"], db=None) == {}
+
+    def test_note_missing_table(self, monkeypatch):
+        """Test the relation named in an UndefinedTable error is remembered"""
+        class Orig(Exception):
+            pgcode = "42P01"
+
+        error = Exception()
+        error.orig = Orig('relation "rasters.dem" does not exist')
+        monkeypatch.setattr(analysis, "_missing_tables", {})
+        analysis._note_missing_table(error)
+        assert set(analysis._missing_tables) == {"rasters.dem"}
+        assert analysis._is_missing("rasters.dem")
+
+    def test_missing_table_expires(self, monkeypatch):
+        """Test a table is queried again once it was noted missing too long ago"""
+        noted = time.monotonic() - analysis._MISSING_TABLE_TTL - 1
+        monkeypatch.setattr(analysis, "_missing_tables", {"rasters.slope": noted})
+        assert "rasters.slope" in str(analysis._raster_summary_query())
+        assert analysis._missing_tables == {}
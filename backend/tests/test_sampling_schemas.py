@@ -0,0 +1,130 @@
+"""
+Unit tests for the sampling design create schemas in schemas/sampling.py
+
+Create requests are tagged on sampling_type and carry a nested plot object
+tagged on plot_shape; unknown fields are rejected.
+"""
+
+import pytest
+import sys
+import os
+from decimal import Decimal
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.sampling import (
+    CircularPlot,
+    RandomSamplingDesign,
+    RectangularPlot,
+    SamplingDesignCreate,
+    SquarePlot,
+    StratifiedSamplingDesign,
+    SystematicSamplingDesign,
+)
+
+
+ADAPTER = TypeAdapter(SamplingDesignCreate)
+
+
+def validate(payload):
+    return ADAPTER.validate_python(payload)
+
+
+class TestSamplingTypeVariants:
+    """Test each sampling_type selects its own variant"""
+
+    @pytest.mark.parametrize("payload,expected_type", [
+        ({"sampling_type": "systematic"}, SystematicSamplingDesign),
+        ({"sampling_type": "systematic", "grid_spacing_meters": 100}, SystematicSamplingDesign),
+        ({"sampling_type": "random"}, RandomSamplingDesign),
+        ({"sampling_type": "stratified"}, StratifiedSamplingDesign),
+        ({"sampling_type": "stratified", "num_strata": 8}, StratifiedSamplingDesign),
+    ])
+    def test_accepted(self, payload, expected_type):
+        """Test valid payloads validate to the tagged variant"""
+        assert type(validate(payload)) is expected_type
+
+    def test_defaults(self):
+        """Test defaults, including the 500m² circular plot"""
+        design = validate({"sampling_type": "random"})
+        assert design.sampling_intensity_percent == Decimal("0.5")
+        assert design.min_samples_per_block == 5
+        assert design.boundary_buffer_meters == 50.0
+        assert isinstance(design.plot, CircularPlot)
+        assert design.plot.plot_radius_meters == Decimal("12.6156")
+
+    @pytest.mark.parametrize("payload", [
+        {},
+        {"sampling_type": "cluster"},
+        # Fields of another sampling type
+        {"sampling_type": "random", "grid_spacing_meters": 100},
+        {"sampling_type": "random", "num_strata": 8},
+        {"sampling_type": "systematic", "num_strata": 8},
+        {"sampling_type": "stratified", "grid_spacing_meters": 100},
+        # Unknown fields and the old flat plot fields
+        {"sampling_type": "random", "unknown": 1},
+        {"sampling_type": "random", "plot_shape": "circular"},
+        {"sampling_type": "random", "plot_radius_meters": 10},
+        # Out of range values
+        {"sampling_type": "stratified", "num_strata": 2},
+        {"sampling_type": "random", "sampling_intensity_percent": 50},
+    ])
+    def test_rejected(self, payload):
+        """Test missing or wrong tags, wrong-tag fields and bad values are rejected"""
+        with pytest.raises(ValidationError):
+            validate(payload)
+
+
+class TestPlotShapes:
+    """Test each plot_shape selects its own plot variant"""
+
+    @pytest.mark.parametrize("plot,expected_type", [
+        ({"plot_shape": "circular"}, CircularPlot),
+        ({"plot_shape": "circular", "plot_radius_meters": 10}, CircularPlot),
+        ({"plot_shape": "square", "plot_length_meters": 20, "plot_width_meters": 20}, SquarePlot),
+        ({"plot_shape": "rectangular", "plot_length_meters": 30, "plot_width_meters": 10}, RectangularPlot),
+    ])
+    def test_accepted(self, plot, expected_type):
+        """Test valid plots validate to the tagged shape"""
+        design = validate({"sampling_type": "systematic", "plot": plot})
+        assert type(design.plot) is expected_type
+
+    @pytest.mark.parametrize("plot", [
+        {},
+        {"plot_shape": "hexagonal"},
+        # Missing dimensions
+        {"plot_shape": "square"},
+        {"plot_shape": "square", "plot_length_meters": 20},
+        {"plot_shape": "rectangular", "plot_width_meters": 10},
+        # Dimensions of another shape
+        {"plot_shape": "circular", "plot_length_meters": 20},
+        {"plot_shape": "square", "plot_radius_meters": 10,
+         "plot_length_meters": 20, "plot_width_meters": 20},
+        # Out of range dimensions
+        {"plot_shape": "circular", "plot_radius_meters": 0.5},
+        {"plot_shape": "rectangular", "plot_length_meters": 500, "plot_width_meters": 10},
+    ])
+    def test_rejected(self, plot):
+        """Test missing or wrong tags, missing dimensions and wrong-shape fields are rejected"""
+        with pytest.raises(ValidationError):
+            validate({"sampling_type": "systematic", "plot": plot})
+
+
+class TestBlockOverrides:
+    """Test per-block overrides"""
+
+    def test_accepted(self):
+        """Test overrides validate per block name"""
+        design = validate({
+            "sampling_type": "random",
+            "block_overrides": {"Block 1": {"sampling_type": "systematic", "min_samples_per_block": 3}}
+        })
+        assert design.block_overrides["Block 1"].min_samples_per_block == 3
+
+    def test_unknown_field_rejected(self):
+        """Test an unknown override field is rejected"""
+        with pytest.raises(ValidationError):
+            validate({"sampling_type": "random", "block_overrides": {"Block 1": {"plot_shape": "square"}}})
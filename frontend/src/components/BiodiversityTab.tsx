@@ -90,7 +90,7 @@ const BiodiversityTab: React.FC<BiodiversityTabProps> = ({ calculationId }) => {
 
   const loadSelectedSpecies = async () => {
     try {
-      const response = await api.get(`/api/biodiversity/calculations/${calculationId}/species`);
+      const response = await api.get(`/api/biodiversity/calculations/${calculationId}/species?include_species=true`);
       setSelectedSpecies(response.data.species);
     } catch (error) {
       console.error('Error loading selected species:', error);
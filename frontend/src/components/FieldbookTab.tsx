@@ -232,7 +232,7 @@ export function FieldbookTab({ calculationId }: FieldbookTabProps) {
               </thead>
               <tbody className="bg-white divide-y divide-gray-200">
                 {fieldbook.points.slice(0, 50).map((point: any) => (
-                  <tr key={point.id} className="hover:bg-gray-50">
+                  <tr key={point.point_number} className="hover:bg-gray-50">
                     <td className="px-4 py-2 text-sm font-mono">P{point.point_number}</td>
                     <td className="px-4 py-2 text-sm">
                       <span className={`px-2 py-1 rounded text-xs ${
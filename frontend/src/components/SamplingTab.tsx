@@ -108,7 +108,6 @@ export function SamplingTab({ calculationId }: SamplingTabProps) {
         sampling_intensity_percent: samplingIntensity, // NEW: Use percentage instead of grid spacing
         min_samples_per_block: minSamplesPerBlock, // NEW: Minimum for blocks >= 1ha
         min_samples_small_blocks: minSamplesSmallBlocks, // NEW: Minimum for blocks < 1ha
-        plot_shape: plotShape,
       };
 
       // For random sampling, add minimum distance
@@ -117,10 +116,9 @@ export function SamplingTab({ calculationId }: SamplingTabProps) {
       }
 
       if (plotShape === 'circular') {
-        params.plot_radius_meters = plotRadius;
+        params.plot = { plot_shape: plotShape, plot_radius_meters: plotRadius };
       } else {
-        params.plot_length_meters = plotSide;
-        params.plot_width_meters = plotSide;
+        params.plot = { plot_shape: plotShape, plot_length_meters: plotSide, plot_width_meters: plotSide };
       }
 
       // Add block overrides if enabled
@@ -1720,11 +1720,11 @@ export default function CalculationDetail() {
               </dd>
             </div>
 
-            {calculation.processing_time_seconds && (
+            {calculation.processing_time_ms != null && (
               <div>
                 <dt className="text-sm font-medium text-gray-500">Processing Time</dt>
                 <dd className="mt-1 text-sm text-gray-900">
-                  {calculation.processing_time_seconds} seconds
+                  {(calculation.processing_time_ms / 1000).toFixed(1)} seconds
                 </dd>
               </div>
             )}
@@ -386,10 +386,9 @@ export const samplingApi = {
       intensity_per_hectare?: number; // DEPRECATED: Use sampling_intensity_percent instead
       grid_spacing_meters?: number; // DEPRECATED: Calculated automatically
       min_distance_meters?: number;
-      plot_shape?: "circular" | "square" | "rectangular";
-      plot_radius_meters?: number;
-      plot_length_meters?: number;
-      plot_width_meters?: number;
+      plot?:
+        | { plot_shape: "circular"; plot_radius_meters?: number }
+        | { plot_shape: "square" | "rectangular"; plot_length_meters: number; plot_width_meters: number };
       notes?: string;
     }
   ): Promise<any> => {
@@ -234,7 +234,7 @@ export interface Calculation {
   forest_name?: string;
   block_name?: string;
   status: 'pending' | 'processing' | 'completed' | 'failed';
-  processing_time_seconds?: number;
+  processing_time_ms?: number;
   error_message?: string;
   created_at: string;
   completed_at?: string;
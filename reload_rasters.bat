@@ -0,0 +1,68 @@
+@echo off
+REM Reload the analysis rasters into the rasters schema as 256x256 tiles
+REM with constraints (-C, records the extent) and a GiST index (-I), then
+REM CLUSTER each table on that index so neighbouring tiles are stored together
+REM Usage: reload_rasters.bat <folder with <table>.tif files>
+REM Tables without a matching .tif in the folder are left untouched
+
+if "%~1"=="" (
+    echo Usage: reload_rasters.bat ^<raster folder^>
+    exit /b 1
+)
+
+set RASTER_DIR=%~1
+set PGHOST=localhost
+set PGPORT=5432
+set PGUSER=postgres
+set PGDATABASE=cf_db
+
+echo ========================================
+echo Reloading rasters from %RASTER_DIR%
+echo ========================================
+echo.
+
+for %%T in (
+    agb_2022_nepal
+    annual_mean_temperature
+    annual_precipitation
+    aspect
+    canopy_height
+    esa_world_cover
+    forest_loss_fire
+    forest_type
+    hansen2000_classified
+    min_temp_coldest_month
+    nasa_forest_2020
+    nepal_forest_health
+    nepal_gain
+    nepal_lossyear
+    slope
+    soilgrids_isric
+) do (
+    if exist "%RASTER_DIR%\%%T.tif" (
+        echo Loading rasters.%%T...
+        raster2pgsql -d -s 4326 -I -C -M -t 256x256 "%RASTER_DIR%\%%T.tif" rasters.%%T | psql -q
+        psql -q -c "CLUSTER rasters.%%T USING %%T_st_convexhull_idx; ANALYZE rasters.%%T;"
+    ) else (
+        echo Skipping rasters.%%T - %%T.tif not found
+    )
+)
+
+REM DEM voids are -32768; register them as the band NoData value
+if exist "%RASTER_DIR%\dem.tif" (
+    echo Loading rasters.dem...
+    raster2pgsql -d -s 4326 -N -32768 -I -C -M -t 256x256 "%RASTER_DIR%\dem.tif" rasters.dem | psql -q
+    psql -q -c "CLUSTER rasters.dem USING dem_st_convexhull_idx; ANALYZE rasters.dem;"
+) else (
+    echo Skipping rasters.dem - dem.tif not found
+)
+
+REM Cached statistics are keyed on the geometry only, so drop them with the
+REM rasters they were computed from
+echo Clearing analysis caches...
+psql -q -c "TRUNCATE public.calculation_cache, public.raster_stats_cache;"
+
+echo.
+echo ========================================
+echo Raster reload complete
+echo ========================================
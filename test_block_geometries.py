@@ -2,12 +2,13 @@
 Test why some blocks have no temperature/precipitation data
 """
 import sys
+import json
 sys.path.insert(0, 'backend')
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from backend.app.services.analysis import analyze_temperature_geometry, analyze_precipitation_geometry
-from shapely.geometry import shape
+from backend.app.services.analysis import _fetch_block_raster_summaries, summarize_climate
+from shapely.geometry import mapping
 from shapely import wkt as shapely_wkt
 
 # Database connection
@@ -16,6 +17,18 @@ engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine)
 db = SessionLocal()
 
+CLIMATE_OPTIONS = ["run_temperature", "run_precipitation"]
+
+
+def analyze_climate(geojsons):
+    """Climate summary for each GeoJSON geometry from the batch block raster query"""
+    summaries = _fetch_block_raster_summaries(geojsons, CLIMATE_OPTIONS, db)
+    return [
+        summarize_climate(summaries.get(idx, ({}, {}, {}))[1].get("climate", {}))
+        for idx in range(1, len(geojsons) + 1)
+    ]
+
+
 print("=" * 70)
 print("Testing Block Geometries for Temperature/Precipitation")
 print("=" * 70)
@@ -40,43 +53,36 @@ if calc:
     print(f"\nTesting all {len(blocks)} blocks:")
     print("=" * 70)
 
+    # Collect each block's GeoJSON, then query all blocks at once
+    block_geojsons = []
     for i, block in enumerate(blocks):
         block_name = block.get('block_name', f'Block {i+1}')
-        print(f"\n{i+1}. {block_name}")
-        print("-" * 70)
 
-        # Check if block has WKT or geometry
-        if 'wkt' in block:
-            block_wkt = block['wkt']
-            print(f"   Using WKT from block data")
-        elif 'geometry' in block:
+        # Check if block has geometry or WKT
+        if 'geometry' in block:
+            block_geojsons.append((i, block, json.dumps(block['geometry'])))
+        elif 'wkt' in block:
             try:
-                geom = shape(block['geometry'])
-                block_wkt = shapely_wkt.dumps(geom)
-                print(f"   Converted GeoJSON to WKT")
+                geom = shapely_wkt.loads(block['wkt'])
+                block_geojsons.append((i, block, json.dumps(mapping(geom))))
             except Exception as e:
-                print(f"   ERROR converting geometry: {e}")
-                continue
+                print(f"\n{i+1}. {block_name}: ERROR converting WKT: {e}")
         else:
-            print(f"   ERROR: No geometry found")
-            continue
-
-        # Test temperature
-        try:
-            temp_result = analyze_temperature_geometry(block_wkt, db)
-            temp_mean = temp_result.get('temperature_mean_c')
-            temp_min = temp_result.get('temperature_min_c')
-            print(f"   Temperature: {temp_mean}°C (mean), {temp_min}°C (min)")
-        except Exception as e:
-            print(f"   Temperature ERROR: {e}")
-
-        # Test precipitation
-        try:
-            precip_result = analyze_precipitation_geometry(block_wkt, db)
-            precip_mean = precip_result.get('precipitation_mean_mm')
-            print(f"   Precipitation: {precip_mean} mm/year")
-        except Exception as e:
-            print(f"   Precipitation ERROR: {e}")
+            print(f"\n{i+1}. {block_name}: ERROR: No geometry found")
+
+    try:
+        climate_results = analyze_climate([geojson for _, _, geojson in block_geojsons])
+    except Exception as e:
+        print(f"\nClimate query ERROR: {e}")
+        climate_results = []
+
+    for (i, block, _), climate_result in zip(block_geojsons, climate_results):
+        print(f"\n{i+1}. {block.get('block_name', f'Block {i+1}')}")
+        print("-" * 70)
+        temp_mean = climate_result.get('temperature_mean_c')
+        temp_min = climate_result.get('temperature_min_c')
+        print(f"   Temperature: {temp_mean}°C (mean), {temp_min}°C (min)")
+        print(f"   Precipitation: {climate_result.get('precipitation_mean_mm')} mm/year")
 
         # Show what's currently in the block data
         print(f"   Current in DB: temp={block.get('temperature_mean_c')}, precip={block.get('precipitation_mean_mm')}")
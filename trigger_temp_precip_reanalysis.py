@@ -8,8 +8,8 @@ sys.path.insert(0, 'backend')
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from backend.app.services.analysis import (
-    analyze_temperature_geometry,
-    analyze_precipitation_geometry
+    _fetch_block_raster_summaries,
+    summarize_climate
 )
 
 # Database connection
@@ -18,13 +18,25 @@ engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine)
 db = SessionLocal()
 
+CLIMATE_OPTIONS = ["run_temperature", "run_precipitation"]
+
+
+def analyze_climate(geojsons):
+    """Climate summary for each GeoJSON geometry from the batch block raster query"""
+    summaries = _fetch_block_raster_summaries(geojsons, CLIMATE_OPTIONS, db)
+    return [
+        summarize_climate(summaries.get(idx, ({}, {}, {}))[1].get("climate", {}))
+        for idx in range(1, len(geojsons) + 1)
+    ]
+
+
 print("=" * 70)
 print("Re-analyzing for Temperature and Precipitation")
 print("=" * 70)
 
 # Get the most recent calculation
 query = text("""
-    SELECT id, forest_name, ST_AsText(boundary_geom) as wkt, result_data
+    SELECT id, forest_name, ST_AsGeoJSON(boundary_geom) as geojson, result_data
     FROM calculations
     WHERE boundary_geom IS NOT NULL
     ORDER BY created_at DESC
@@ -36,15 +48,13 @@ if calc:
     print(f"\nCalculation ID: {calc.id}")
     print(f"Forest Name: {calc.forest_name}")
 
-    # Run temperature analysis on whole forest
+    # Run temperature and precipitation analysis on whole forest
     print("\n1. Running Temperature analysis (whole forest)...")
-    result_temp = analyze_temperature_geometry(calc.wkt, db)
+    result_temp = result_precip = analyze_climate([calc.geojson])[0]
     print(f"   Mean: {result_temp.get('temperature_mean_c')}°C")
     print(f"   Min: {result_temp.get('temperature_min_c')}°C")
 
-    # Run precipitation analysis on whole forest
     print("\n2. Running Precipitation analysis (whole forest)...")
-    result_precip = analyze_precipitation_geometry(calc.wkt, db)
     print(f"   Annual: {result_precip.get('precipitation_mean_mm')} mm/year")
 
     # Update whole forest result_data
@@ -59,30 +69,23 @@ if calc:
     blocks = result_data.get('blocks', [])
     if blocks:
         print(f"   Found {len(blocks)} blocks")
-        for i, block in enumerate(blocks):
-            if 'geometry' in block:
-                # Convert GeoJSON to WKT
-                from shapely.geometry import shape
-                from shapely import wkt as shapely_wkt
-
-                try:
-                    geom = shape(block['geometry'])
-                    block_wkt = shapely_wkt.dumps(geom)
-
-                    # Run analyses for this block
-                    block_temp = analyze_temperature_geometry(block_wkt, db)
-                    block_precip = analyze_precipitation_geometry(block_wkt, db)
-
-                    # Update block data
-                    block['temperature_mean_c'] = block_temp.get('temperature_mean_c')
-                    block['temperature_min_c'] = block_temp.get('temperature_min_c')
-                    block['precipitation_mean_mm'] = block_precip.get('precipitation_mean_mm')
-
-                    print(f"   Block {i+1} ({block.get('block_name', 'Unknown')}): " +
-                          f"Temp={block_temp.get('temperature_mean_c')}°C, " +
-                          f"Precip={block_precip.get('precipitation_mean_mm')}mm")
-                except Exception as e:
-                    print(f"   Block {i+1}: ERROR - {e}")
+        # Run the analyses for all blocks with geometry in one query
+        geo_blocks = [(i, block) for i, block in enumerate(blocks) if 'geometry' in block]
+        try:
+            block_climates = analyze_climate([json.dumps(block['geometry']) for _, block in geo_blocks])
+        except Exception as e:
+            print(f"   ERROR - {e}")
+            block_climates = []
+
+        for (i, block), block_climate in zip(geo_blocks, block_climates):
+            # Update block data
+            block['temperature_mean_c'] = block_climate.get('temperature_mean_c')
+            block['temperature_min_c'] = block_climate.get('temperature_min_c')
+            block['precipitation_mean_mm'] = block_climate.get('precipitation_mean_mm')
+
+            print(f"   Block {i+1} ({block.get('block_name', 'Unknown')}): " +
+                  f"Temp={block_climate.get('temperature_mean_c')}°C, " +
+                  f"Precip={block_climate.get('precipitation_mean_mm')}mm")
 
         result_data['blocks'] = blocks
 
@@ -45,7 +45,7 @@ $function$;
 -- Step 2: Update fieldbook using fast function
 WITH references_raw AS (
     SELECT
-        id,
+        calculation_id,
         point_number,
         rasters.find_nearest_road(longitude, latitude) as ref
     FROM public.fieldbook
@@ -54,7 +54,8 @@ WITH references_raw AS (
 ),
 references_with_lag AS (
     SELECT
-        id,
+        calculation_id,
+        point_number,
         ref,
         LAG(ref) OVER (ORDER BY point_number) as prev_ref
     FROM references_raw
@@ -65,4 +66,5 @@ SET reference = CASE
     ELSE NULL
 END
 FROM references_with_lag rwl
-WHERE fb.id = rwl.id;
+WHERE fb.calculation_id = rwl.calculation_id
+  AND fb.point_number = rwl.point_number;
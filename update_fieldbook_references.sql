@@ -1,7 +1,7 @@
 -- Update fieldbook references for existing data
 WITH all_references AS (
     SELECT
-        id,
+        calculation_id,
         point_number,
         rasters.find_nearest_feature(longitude, latitude) as ref,
         LAG(rasters.find_nearest_feature(longitude, latitude)) OVER (ORDER BY point_number) as prev_ref
@@ -15,4 +15,5 @@ SET reference = CASE
     ELSE NULL
 END
 FROM all_references ar
-WHERE fb.id = ar.id;
+WHERE fb.calculation_id = ar.calculation_id
+  AND fb.point_number = ar.point_number;
@@ -1,7 +1,7 @@
 -- Optimized version: Calculate references once, then apply LAG
 WITH references_raw AS (
     SELECT
-        id,
+        calculation_id,
         point_number,
         rasters.find_nearest_feature(longitude, latitude) as ref
     FROM public.fieldbook
@@ -10,7 +10,7 @@ WITH references_raw AS (
 ),
 references_with_lag AS (
     SELECT
-        id,
+        calculation_id,
         point_number,
         ref,
         LAG(ref) OVER (ORDER BY point_number) as prev_ref
@@ -22,4 +22,5 @@ SET reference = CASE
     ELSE NULL
 END
 FROM references_with_lag rwl
-WHERE fb.id = rwl.id;
+WHERE fb.calculation_id = rwl.calculation_id
+  AND fb.point_number = rwl.point_number;
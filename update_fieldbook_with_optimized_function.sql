@@ -2,7 +2,7 @@
 -- This will take ~10-15 minutes for 295 points
 WITH references_raw AS (
     SELECT
-        id,
+        calculation_id,
         point_number,
         rasters.find_nearest_feature(longitude, latitude) as ref
     FROM public.fieldbook
@@ -11,7 +11,8 @@ WITH references_raw AS (
 ),
 references_with_lag AS (
     SELECT
-        id,
+        calculation_id,
+        point_number,
         ref,
         LAG(ref) OVER (ORDER BY point_number) as prev_ref
     FROM references_raw
@@ -22,7 +23,8 @@ SET reference = CASE
     ELSE NULL
 END
 FROM references_with_lag rwl
-WHERE fb.id = rwl.id;
+WHERE fb.calculation_id = rwl.calculation_id
+  AND fb.point_number = rwl.point_number;
 
 -- Show results
 SELECT point_number, longitude, latitude, reference